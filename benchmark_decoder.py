@@ -0,0 +1,115 @@
+"""
+   ----------------------------------------------------------------------------
+   Copyright (C) 2020 Francesco Darugna <fd@geopp.de>  Geo++ GmbH,
+                      Jannes B. Wübbena <jw@geopp.de>  Geo++ GmbH.
+   
+   A list of all the historical RTCM-SSR Python Demonstrator contributors in
+   CREDITS.info.
+   
+   The first author has received funding from the European Union's Horizon 2020
+   research and innovation programme under the Marie Sklodowska-Curie Grant
+   Agreement No 722023.
+   ----------------------------------------------------------------------------
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import sys
+import time
+import numpy as np
+import bit_layouts
+import rtcm_decoder
+import rtcm_frames
+
+""" Micro-benchmark of the decoding of RTCM messages.
+
+    Input:
+    - f_in   : RTCM binary file
+    - repeat : number of times every message is decoded (default 20)
+    - year   : year at the time of the message reception (default 2020)
+    - doy    : day of the year at the time of the message reception
+               (default 1)
+
+    Output:
+    - per message type: number of messages and mean decoding time per
+      message in microseconds, parsing the bit layouts at every call
+      (bitstruct.unpack, before) and using the compiled layouts cached by the
+      bit_layouts module (after), and decoding only the SSR header with the
+      lazy mode of the rtcm_decoder (header)
+
+    ***************************************************************************
+    Description:
+    the frames of the file are extracted once by the rtcm_frames module and
+    only the message types supported by the rtcm_decoder are kept. Then every
+    message is decoded repeat times with the layout cache disabled and
+    enabled. The first pass with the cache enabled fills the cache and it is
+    not timed.
+
+    Usage: python benchmark_decoder.py f_in [repeat] [year] [doy]
+"""
+
+def time_decoding(messages, repeat, year, doy, lazy=False):
+    timing = {}
+    for [msg_type, msg_content] in messages:
+        t0 = time.perf_counter()
+        for r in range(repeat):
+            rtcm_decoder.rtcm_decoder(msg_content, len(msg_content),
+                                      year, doy, lazy).header
+        dt = (time.perf_counter() - t0) / repeat
+        timing.setdefault(msg_type, []).append(dt)
+    return timing
+
+def benchmark_decoder(f_in, repeat=20, year=2020, doy=1):
+    with open(f_in, 'rb') as f:
+        data = f.read()
+    messages = []
+    for [offset, msg_type,
+         msg_content] in rtcm_frames.iter_frames(data):
+        if rtcm_decoder.is_supported(msg_type):
+            messages.append([msg_type, msg_content])
+    if len(messages) == 0:
+        print('No supported RTCM message in ' + f_in)
+        return
+
+    bit_layouts.enabled = False
+    before = time_decoding(messages, repeat, year, doy)
+    bit_layouts.enabled = True
+    bit_layouts.clear()
+    time_decoding(messages, 1, year, doy)
+    after = time_decoding(messages, repeat, year, doy)
+    header = time_decoding(messages, repeat, year, doy, lazy=True)
+
+    print('{:>6} {:>6} {:>12} {:>12} {:>8} {:>12}'.format('type', 'n',
+          'before[us]', 'after[us]', 'speedup', 'header[us]'))
+    for msg_type in sorted(before):
+        t_before = np.mean(before[msg_type]) * 1e6
+        t_after = np.mean(after[msg_type]) * 1e6
+        t_header = np.mean(header[msg_type]) * 1e6
+        print('{:>6} {:>6} {:>12.1f} {:>12.1f} {:>8.1f} {:>12.1f}'.format(
+              msg_type, len(before[msg_type]), t_before, t_after,
+              t_before / t_after, t_header))
+    t_before = sum([sum(t) for t in before.values()]) / len(messages) * 1e6
+    t_after = sum([sum(t) for t in after.values()]) / len(messages) * 1e6
+    t_header = sum([sum(t) for t in header.values()]) / len(messages) * 1e6
+    print('{:>6} {:>6} {:>12.1f} {:>12.1f} {:>8.1f} {:>12.1f}'.format(
+          'all', len(messages), t_before, t_after, t_before / t_after,
+          t_header))
+    print(bit_layouts.stats)
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print('Usage: python benchmark_decoder.py f_in [repeat] [year] [doy]')
+        sys.exit(1)
+    args = [sys.argv[1]] + [int(a) for a in sys.argv[2:5]]
+    benchmark_decoder(*args)
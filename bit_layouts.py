@@ -0,0 +1,138 @@
+"""
+   ----------------------------------------------------------------------------
+   Copyright (C) 2020 Francesco Darugna <fd@geopp.de>  Geo++ GmbH,
+                      Jannes B. Wübbena <jw@geopp.de>  Geo++ GmbH.
+   
+   A list of all the historical RTCM-SSR Python Demonstrator contributors in
+   CREDITS.info.
+   
+   The first author has received funding from the European Union's Horizon 2020
+   research and innovation programme under the Marie Sklodowska-Curie Grant
+   Agreement No 722023.
+   ----------------------------------------------------------------------------
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import bitstruct
+try:
+    # C implementation of bitstruct, same format strings and results
+    import bitstruct.c as bitstruct_c
+except ImportError:
+    bitstruct_c = None
+
+""" Cache of the compiled bit layouts of the RTCM messages
+
+    Input:
+    - fmt : bitstruct format string of the message, e.g. header + n_sat times
+            the satellite block
+    - data: RTCM message content (bytes, bytearray or memoryview)
+
+    Output:
+    - tuple of the unpacked values, as returned by bitstruct.unpack
+
+    ***************************************************************************
+    Description:
+    bitstruct.unpack parses the format string every time it is called, while
+    the format of an RTCM message only depends on the message type and on
+    the number of satellites (and signals, ionospheric layers, ...) that it
+    contains. The format string already encodes these quantities, hence it is
+    used as key of the LAYOUTS dictionary, which stores the compiled
+    bitstruct objects. A format is compiled only the first time it is
+    needed, then the compiled object is reused for all the following
+    messages with the same layout.
+
+    The C implementation of bitstruct is used if available, otherwise (or if
+    the format is not supported by it) the format is compiled by the Python
+    implementation. Once MAX_LAYOUTS formats have been stored the cache is
+    emptied, in order to bound the memory of long streams.
+
+    The BitCursor class reads a message whose layout depends on the content
+    already read, e.g. the number of signals of each satellite of a bias
+    message. The cursor keeps the bit offset of the next field: every call of
+    the method read unpacks the requested fields from the current offset,
+    using the cached compiled layouts, and moves the offset forward by the
+    size of the layout. Each field of the message is therefore read exactly
+    once and the decoding time grows linearly with the message size.
+
+    The cache can be disabled through the enabled member, so that the
+    decoding falls back to bitstruct.unpack, e.g. for benchmarking. The hits
+    and misses of the cache are counted by the LayoutStats class.
+"""
+
+MAX_LAYOUTS = 4096
+
+class LayoutStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return 'LayoutStats objects: hits, misses'
+
+    def __str__(self):
+        return ('### Bit layouts: ' + str(len(LAYOUTS)) +
+                ', hits: ' + str(self.hits) +
+                ', misses: ' + str(self.misses) + ' ###')
+
+LAYOUTS = {}
+stats = LayoutStats()
+enabled = True
+
+def compile_layout(fmt):
+    layout = LAYOUTS.get(fmt)
+    if layout is not None:
+        stats.hits += 1
+        return layout
+    stats.misses += 1
+    layout = None
+    if bitstruct_c is not None:
+        try:
+            layout = bitstruct_c.compile(fmt)
+        except (TypeError, ValueError, NotImplementedError):
+            layout = None
+    if layout is None:
+        layout = bitstruct.compile(fmt)
+    if len(LAYOUTS) >= MAX_LAYOUTS:
+        LAYOUTS.clear()
+    LAYOUTS[fmt] = layout
+    return layout
+
+def unpack(fmt, data):
+    if not enabled:
+        return bitstruct.unpack(fmt, data)
+    return compile_layout(fmt).unpack(data)
+
+class BitCursor:
+    def __init__(self, data, offset=0):
+        self.data = data
+        self.offset = offset
+
+    def __repr__(self):
+        return 'BitCursor objects: data, offset'
+
+    def read(self, fmt):
+        if not enabled:
+            values = bitstruct.unpack_from(fmt, self.data, self.offset)
+            self.offset += bitstruct.calcsize(fmt)
+            return values
+        layout = compile_layout(fmt)
+        values = layout.unpack_from(self.data, self.offset)
+        self.offset += layout.calcsize()
+        return values
+
+def clear():
+    LAYOUTS.clear()
+    stats.hits = 0
+    stats.misses = 0
@@ -0,0 +1,137 @@
+"""
+   ----------------------------------------------------------------------------
+   Copyright (C) 2020 Francesco Darugna <fd@geopp.de>  Geo++ GmbH,
+                      Jannes B. Wübbena <jw@geopp.de>  Geo++ GmbH.
+   
+   A list of all the historical RTCM-SSR Python Demonstrator contributors in
+   CREDITS.info.
+   
+   The first author has received funding from the European Union's Horizon 2020
+   research and innovation programme under the Marie Sklodowska-Curie Grant
+   Agreement No 722023.
+   ----------------------------------------------------------------------------
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+try:
+    # crcmod uses its C extension when available, otherwise its own
+    # pure Python implementation, which is slower than the table below
+    import crcmod
+    from crcmod import _crcfunext
+    _crc_fun = crcmod.mkCrcFun(0x1864CFB, rev=False,
+                               initCrc=0x000000, xorOut=0x000000)
+except ImportError:
+    _crc_fun = None
+
+"""
+    CRC-24Q computation and verification of RTCM 3 frames.
+
+    Input:
+        - data   : RTCM 3 binary data (bytes, bytearray, memoryview or mmap)
+        - offsets: positions of candidate preambles in data
+
+    Output:
+        - crc24q       : CRC-24Q of the data, 0 for a complete frame
+        - check_header : status and message length of a candidate frame
+                         before computing the CRC
+        - verify_frames: status and message length for a list of candidates
+
+    ***************************************************************************
+    Description:
+    the CRC-24Q generator polynomial is 0x1864CFB, no initial value and no
+    final xor (Ref. RTCM 10403.3, chap. 4.2). The CRC function is created
+    once when the module is imported. If the crcmod C extension is available
+    it is used, otherwise the CRC is computed with a 256 entries lookup
+    table built at import time.
+
+    Before computing any CRC, the 3 bytes of the frame header are checked:
+    the preamble has to be 0xD3, the 6 reserved bits have to be 0 and the
+    frame defined by the 10 bit message length has to end inside the data.
+    Only the plausible candidates are passed to the CRC computation.
+"""
+
+# RTCM 3 frame definition
+PREAMBLE = 0xD3
+HEADER_LEN = 3      # preamble (8 bit), reserved (6 bit), msg length (10 bit)
+CRC_LEN = 3         # CRC-24Q (24 bit)
+
+# status of a candidate frame
+FRAME_OK = 0
+BAD_HEADER = 1
+INCOMPLETE = 2
+BAD_CRC = 3
+
+POLY = 0x1864CFB
+
+def make_table():
+    """ Lookup table of the CRC-24Q for all the byte values
+    """
+    table = []
+    for b in range(256):
+        crc = b << 16
+        for k in range(8):
+            crc = crc << 1
+            if crc & 0x1000000:
+                crc = crc ^ POLY
+        table.append(crc & 0xFFFFFF)
+    return table
+
+CRC_TABLE = make_table()
+USING_EXTENSION = _crc_fun is not None
+
+def crc24q(data):
+    """ CRC-24Q of data
+    """
+    if _crc_fun is not None:
+        return _crc_fun(data)
+    crc = 0
+    table = CRC_TABLE
+    for b in data:
+        crc = ((crc << 8) & 0xFFFFFF) ^ table[(crc >> 16) ^ b]
+    return crc
+
+def check_header(data, offset, n_bytes=None):
+    """ Plausibility of the frame header at offset.
+        It returns the status of the candidate and the message length.
+    """
+    if n_bytes is None:
+        n_bytes = len(data)
+    if offset + HEADER_LEN > n_bytes:
+        return INCOMPLETE, 0
+    if data[offset] != PREAMBLE or data[offset + 1] & 0xFC:
+        return BAD_HEADER, 0
+    msg_len = ((data[offset + 1] & 0x03) << 8) | data[offset + 2]
+    if offset + HEADER_LEN + msg_len + CRC_LEN > n_bytes:
+        return INCOMPLETE, msg_len
+    return FRAME_OK, msg_len
+
+def verify_frames(data, offsets):
+    """ Verification of a list of candidate frames.
+        It returns, for each offset, the status of the candidate and the
+        message length.
+    """
+    data = memoryview(data)
+    n_bytes = len(data)
+    crc_fun = crc24q
+    result = []
+    for offset in offsets:
+        [status, msg_len] = check_header(data, offset, n_bytes)
+        if status == FRAME_OK:
+            end = offset + HEADER_LEN + msg_len + CRC_LEN
+            if crc_fun(data[offset:end]) != 0:
+                status = BAD_CRC
+        result.append((status, msg_len))
+    return result
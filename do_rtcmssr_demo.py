@@ -25,15 +25,20 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import bitstruct
 import rtcm_decoder
-import crcmod
+import rtcm_frames
+import rtcm_index
+import rtcm_filter
+import rtcm_parallel
 import numpy as np
 import coord_and_time_transformations as trafo
 import rtcm_ssr2osr
+import trajectory_cache
 import sort_messages
+import rtcm_ssr
+from ephemeris import Ephemeris
 from datetime import date
-import os, errno
+import os, errno, sys
 
 """ Decoding of RTCM 3 message and computing influence from SSR components on 
     user position.
@@ -41,7 +46,8 @@ import os, errno
     Input:
     - f_in        : complete path of the RTCM-SSR binary file
     - user_llh    : ellipsoidal coordinates of the user position, 
-                    lat[deg], lon[deg], height [m] considering WGS84
+                    lat[deg], lon[deg], height [m] considering WGS84, or
+                    list of the coordinates of several stations
     - dec_only    : if 1, the demo works as decoder, i.e. the SSR influence on
                     rover position is not performed, but the decoding of 
                     RTCM-SSR messages
@@ -49,10 +55,40 @@ import os, errno
                    the output folder will be 'path//RTCM_SSR_demo//' 
     - year        : year at the time of the message reception
     - doy         : day of the year at the time of the message reception
+    - use_mmap    : if True (default), the input file is memory mapped
+                    instead of being read completely into memory
+    - use_index   : if True, the frames are read through the sidecar index
+                    f_in + '.idx', which is created or updated if needed
+    - epochs      : [first, last] GPS time of week [s], only the SSR messages
+                    of the epochs inside the window are decoded
+    - systems     : GNSS to be decoded, e.g. ['G', 'E']
+    - msg_types   : RTCM message numbers to be decoded
+    - provider_id : SSR provider ID, or list of IDs, to be decoded
+    - solution_id : SSR solution ID, or list of IDs, to be decoded
+    - workers     : number of processes decoding the messages, if None
+                    (default) the messages are decoded sequentially
+    - ssr_retention: if given, only the SSR epochs of the last ssr_retention
+                    seconds are kept
+    - eph_keep    : if given, number of ephemeris kept per satellite, e.g. 2
+                    for the current and the previous one
+    - iono_blend  : if True, the VTEC coefficients are interpolated in time
+                    between the ionosphere messages before and after the
+                    epoch, instead of taking the closest message
+    - orbit_accuracy: if given, the satellite states are evaluated from
+                    Chebyshev polynomials of the trajectory of each
+                    ephemeris, with this accuracy [m] (trajectory_cache
+                    module)
+    - batch       : if True, the SSR influence is computed for all the
+                    satellites of a GNSS system at once by the class
+                    RtcmSsr2osrBatch, and the output osr is a structured
+                    array with a row for each visible satellite
+    - station_names: names of the stations of user_llh, used for the output
+                    files of the stations (default 00, 01, ...)
                    
     Output:   
     - print decoded rtcm-ssr messages 
-    - print influence from SSR components on user position
+    - print influence from SSR components on user position, in the file
+      f_in[-12:-4] + '_' + name + '.osr' for each station
     - print ionosphere debug output with information about pierce point and
       Legendre polynomials
     
@@ -61,9 +97,28 @@ import os, errno
     decoding the message is performed by finding the RTCM preamble in the byte 
     stream. Then the message length is decoded and the CRC sum check is
     computed (Ref. Numerical Recipes, Press, W. H. et al., 3rd edition,
-    cap. 22.4).
+    cap. 22.4). The framing is done by the iter_frames function of the
+    rtcm_frames module on a memory map of the input file, whose message
+    contents are passed to the decoder without copy.
     After verification of the CRC the complete message passes to 
     the rtcm_decoder class for decoding.
+    If use_index is True, the frames are instead taken from the sidecar index
+    of the rtcm_index module: only the frames of the message types supported
+    by the decoder are read from the file, without searching the preambles
+    again. The index is extended when the input file grew since the last run.
+    The frames not selected by epochs, systems, msg_types, provider_id and
+    solution_id are rejected by the FrameFilter class of the rtcm_filter
+    module before the decoding, i.e. they are neither decoded nor sorted and
+    printed: message type and GNSS are given by the message number, the
+    other criteria need only the common SSR header. With the index, the
+    records are selected without reading the frames.
+    If workers is given, the valid frames are decoded and printed by a pool
+    of processes (rtcm_parallel module) and returned in stream order, so
+    that the sorting and the output are the same as for the sequential
+    decoding.
+    With ssr_retention and eph_keep the memory of a long running process
+    stays bounded: the old SSR epochs and ephemeris are removed when new ones
+    are stored, and the number of removed ones is printed.
     
     After decoding the messages the function sort_messages is called to create
     classes of ephemeris and ssr parameters objects.
@@ -71,12 +126,32 @@ import os, errno
     The computation of the SSR influence on the user location is computed per
     epoch, GNSS system and satellite. After selecting the epoch,
     GNSS, and satellite, the ssr parameters and ephemeris pass to the
-    rtcm_ssr2osr class for computing osr parameters.  
+    rtcm_ssr2osr class for computing osr parameters. With batch, the
+    satellites of the GNSS system at the epoch are collected and passed
+    together to the RtcmSsr2osrBatch class, which gives the same output.
+    The GLONASS ephemeris are integrated by a GloOrbits object shared by all
+    the epochs, which keeps the trajectory of each ephemeris. With
+    orbit_accuracy, the trajectory of each ephemeris is interpolated on its
+    first use by a TrajectoryCache object shared by all the epochs, and the
+    cache statistics are printed at the end.
+    With several stations in user_llh, the messages are decoded and sorted
+    once and the batch computation is used: the satellite states are
+    computed once per satellite and epoch, the receiver dependent
+    corrections for all the stations together. osr is then a dictionary from
+    the station name to the structured array of the station. The ionosphere
+    debug output is not printed for several stations.
     
+    Usage, for the stations of a file with lines name, lat, lon, height:
+    python do_rtcmssr_demo.py f_in f_stations [out_folder] [year] [doy]
 """
 
 def do_rtcmssr_demo(f_in, user_llh, dec_only=None, out_folder=None,
-                    year=None, doy=None):
+                    year=None, doy=None, use_mmap=True,
+                    use_index=False, epochs=None, systems=None,
+                    msg_types=None, provider_id=None, solution_id=None,
+                    workers=None, ssr_retention=None, eph_keep=None,
+                    iono_blend=False, orbit_accuracy=None, batch=False,
+                    station_names=None):
 # =============================================================================
 # get the year, month and compute leap seconds
 # =============================================================================
@@ -95,6 +170,13 @@ def do_rtcmssr_demo(f_in, user_llh, dec_only=None, out_folder=None,
     # This quantity will be considered for GLONASS w.r.t. GPS time
     ls_glo = trafo.get_ls_from_date(year, month)
     
+    # several stations are computed by the batch computation
+    stations = np.ndim(user_llh) == 2
+    if stations:
+        batch = True
+        if station_names is None:
+            station_names = [f'{k:02d}' for k in range(len(user_llh))]
+    
 # =============================================================================
 #  open output files   
 # =============================================================================
@@ -110,7 +192,12 @@ def do_rtcmssr_demo(f_in, user_llh, dec_only=None, out_folder=None,
     if dec_only == 1:
         dec_out = open(out_folder + f_in[-12:-4] + '.ssr', 'w')
     else:
-        osr_output = open(out_folder + f_in[-12:-4] + '.osr', 'w')
+        if stations:
+            osr_outputs = [open(out_folder + f_in[-12:-4] + '_' + name +
+                                '.osr', 'w') for name in station_names]
+        else:
+            osr_outputs = [open(out_folder + f_in[-12:-4] + '.osr', 'w')]
+        osr_output = osr_outputs[0]
         iono_output = open(out_folder + f_in[-12:-4] + '.ion', 'w')
         dec_out = open(out_folder + f_in[-12:-4] + '.ssr', 'w')
         
@@ -119,152 +206,133 @@ def do_rtcmssr_demo(f_in, user_llh, dec_only=None, out_folder=None,
 # =============================================================================
     receiver = {}
     
-    user_xyz = trafo.ell2cart(user_llh[0], user_llh[1], user_llh[2])
+    if stations:
+        user_xyz = [trafo.ell2cart(llh[0], llh[1], llh[2])
+                    for llh in user_llh]
+    else:
+        user_xyz = trafo.ell2cart(user_llh[0], user_llh[1], user_llh[2])
     receiver['ellipsoidal'] = np.array(user_llh)
     receiver['cartesian'  ] = np.array(user_xyz)
     
-    with open(f_in, 'rb') as f:
-        data = f.read()
+    in_file = rtcm_frames.MappedFile(f_in, use_mmap)
+    data = in_file.open()
 
 # =============================================================================
 #                        Loop over the whole message  
 # =============================================================================
-    # Description of the preamble 
-    preamble = b'\xd3'
-    i = 0
-    
     # initialization of ephemeris and ssr variables
     eph0 = None
     ssr0 = None
+    if eph_keep is not None:
+        eph0 = Ephemeris(eph_keep)
+    if ssr_retention is not None:
+        ssr0 = rtcm_ssr.SSR(retention=ssr_retention)
     types_list = [] # list of the message types contained in the rtcm file
-    while i <= len(data):
-        if data[i:i + 1] == preamble:
-            frame_header    = data[i:i + 3]
-            # Getting RTCM header consisting of preamble (8 bit),
-            # reserved bits (6 bit) and messange length (10) bit
+    frame_stats = rtcm_frames.FrameStats()
+    frame_index = None
+    frame_filter = rtcm_filter.FrameFilter(epochs, systems, msg_types,
+                                           provider_id, solution_id, ls_glo)
+    if not frame_filter.is_active():
+        frame_filter = None
+    if use_index:
+        try:
+            frame_index = rtcm_index.update_index(f_in)
+        except OSError:
+            print('Warning: the frame index of ' + f_in + ' cannot be ' +
+                  'written, the file is scanned.')
+    if frame_index is None:
+        frames = rtcm_frames.iter_frames(data, frame_stats)
+    else:
+        records = frame_index.select(msg_types=rtcm_decoder.DECODERS)
+        if not rtcm_index.check_records(data, records):
+            # the RTCM file changed inside the indexed part
+            print('Warning: the frame index of ' + f_in + ' does not ' +
+                  'match the file, it is built again.')
+            frame_index = rtcm_index.update_index(f_in, rebuild=True)
+            records = frame_index.select(msg_types=rtcm_decoder.DECODERS)
+        if frame_filter is not None:
+            records = records[frame_filter.mask(records)]
+        frames = rtcm_index.iter_indexed_frames(data, records)
+    def select(msg_type, msg_content):
+        # decode only the supported messages accepted by the filters
+        if not rtcm_decoder.is_supported(msg_type):
+            return False
+        if (frame_filter is None) or (frame_index is not None):
+            return True
+        return frame_filter.accept(msg_type, msg_content)
+    decoded_frames = rtcm_parallel.decode_frames(frames, year, doy, select,
+                                                 workers,
+                                                 dec_only is not None)
+    for [offset, msg_type, msg_content, read_msg] in decoded_frames:
+        if msg_type is None:
+            # empty frame, nothing to decode
+            continue
+        if not rtcm_decoder.is_supported(msg_type):
+            # message type not considered by the demo, skip it before
+            # unpacking its content
+            if dec_only is not None:
+                print('Be aware: received possible unknown message.')
+            continue
+        if read_msg is None:
+            # rejected by the filters, only the header has been read
+            continue
+        # extract the message
+        msg_type = read_msg.msg_type
+        
+        if dec_only is not None:
             try:
-                frame_header_unpack = bitstruct.unpack('u8u6u10', frame_header)
-            except ValueError:
-                print('Found not completed message.')
-                i = i + 1
-                continue
-            msg_len   = frame_header_unpack[2]
-            
-            # check CRC for the completeness of the message
-            msg_complete = data[i : i + 6 + msg_len]
-            # create the function for CRC-24Q
-            crc_fun = crcmod.crcmod.mkCrcFun(0x1864CFB,rev=False,
-                                             initCrc=0x000000, xorOut=0x000000)
-            # compute crc value for the complete msg, if correctly received,
-            #  it should be 0
-            crc_value = crc_fun(msg_complete)
-            if crc_value == 0:
-                msg_content   = data[i + 3:i + 3 + msg_len]
-                # decode message
-                read_msg = rtcm_decoder.rtcm_decoder(msg_content, msg_len,
-                                                     year, doy)
-                # extract the message
-                msg_type = read_msg.msg_type
-                
-                if dec_only is not None:
-                    try:
-                        print(read_msg, file = dec_out)
-                    except TypeError:
-                        # in this case an unkwonn message has been considered
-                        print('Be aware: received possible unknown message.')
-                dec_msg = read_msg.dec_msg
+                print(read_msg, file = dec_out)
+            except TypeError:
+                # in this case an unkwonn message has been considered
+                print('Be aware: received possible unknown message.')
+        dec_msg = read_msg.dec_msg
 # =============================================================================
 #                              Sort messages
 # =============================================================================                
-                if dec_msg is not None: # this might happen for 
-                                        # unknown message number,
-                                        # e.g. not considered by the demo
-                    types_list = np.append(types_list, msg_type)
-                    # collect ephemeris data
-                    ephemeris = sort_messages.sort_msg(msg_type, dec_msg,
-                                                       eph=eph0)[0]
-                    eph0 = ephemeris
-                    # get the GLONASS four-year interval number 
-                    # starting from 1996
-                    try:
-                        n4_list = []
-                        # get number of week day from eph
-                        if np.size(eph0.glo.sat) != 0:
-                            eph_sat_list = eph0.glo.sat
-                            eph_epochs = eph0.glo.sat_epochs
-                            for sv in eph_sat_list:
-                                for e in range(len(eph_epochs[sv])):
-                                    n4_list = np.append(n4_list,
-                                                        eph0.glo.eph[sv][e].n4)
-                            # n4 might be 0 even in this case, when
-                            # the GLONASS additional data are not reliable
-                            if len(n4_list[np.where(n4_list!=0)[0]])==0:
-                                n4 = 0
-                            elif np.isnan(np.nanmean(n4_list[np.where(n4_list!=0)[0]])) == True:
-                                n4=0
-                            else:
-                                n4 = np.nanmean(n4_list[np.where(n4_list!=0)[0]])
-                        else:
-                            n4 = 0
-                        if ((n4 == 0) | (np.size(eph0.glo.sat) == 0)):
-                            
-                            if np.size(eph0.gps.sat) != 0:
-                                eph_sat_list = eph0.gps.sat
-                                eph_epochs = eph0.gps.sat_epochs
-                                eph_ref = eph0.gps
-                            else:
-                                if np.size(eph0.gal.sat) != 0:
-                                    eph_sat_list = eph0.gal.sat
-                                    eph_epochs = eph0.gal.sat_epochs
-                                    eph_ref = eph0.gal
-                                else:
-                                    if np.size(eph0.bds.sat) != 0:
-                                        eph_sat_list = eph0.bds.sat
-                                        eph_epochs = eph0.bds.sat_epochs
-                                        eph_ref = eph0.bds
-
-                            gps_time = []
-                            gps_week = []
-                            for sv in eph_sat_list:
-                                for e in range(len(eph_epochs[sv])):
-                                    gps_time = np.append(gps_time,
-                                                         eph_epochs[sv][e])
-                                    gps_week = np.append(gps_week, 
-                                                         eph_ref.eph[sv][e].week)
-                            time = np.nanmean(gps_time)
-                            week = np.nanmean(gps_week)
-                            [year, doy,
-                             hh, mm,
-                             ss] = trafo.gpsTime2y_doy_hms(week, time)
-                            n4 = int((year - 1995) / 4)
-                                            # collect rtcm ssr data
-                        try:
-                            state_space = sort_messages.sort_msg(msg_type,
-                                                                 dec_msg,
-                                                                 eph=eph0,
-                                                                 ssr=ssr0,
-                                                                 n4=n4,
-                                                                 ls=ls_glo)[1]
-                        except IndexError:
-                            print('Warning: probably ephemeris are missing' + 
-                                  ' for some satellites, please check the ' + 
-                                  'ephemeris source.')
-                            i = i + msg_len + 6
-                            continue
-                    except UnboundLocalError:
-                        state_space = sort_messages.sort_msg(msg_type, dec_msg,
-                                                             eph=eph0,
-                                                             ssr=ssr0,
-                                                             ls=ls_glo)[1]
-                
-                    ssr0 = state_space     
-                i = i + msg_len + 6
-            else:
-                i = i + 1
-        else:
-            i = i + 1
+        if dec_msg is not None: # this might happen for 
+                                # unknown message number,
+                                # e.g. not considered by the demo
+            types_list = np.append(types_list, msg_type)
+            # collect ephemeris data
+            ephemeris = sort_messages.sort_msg(msg_type, dec_msg,
+                                               eph=eph0)[0]
+            eph0 = ephemeris
+            # get the GLONASS four-year interval number 
+            # starting from 1996, from the GLONASS ephemeris or from the
+            # time of the GPS, Galileo or BeiDou ephemeris. n4 is None if
+            # no ephemeris is available
+            n4 = eph0.reference.n4()
+            # collect rtcm ssr data
+            try:
+                state_space = sort_messages.sort_msg(msg_type, dec_msg,
+                                                     eph=eph0, ssr=ssr0,
+                                                     n4=n4, ls=ls_glo)[1]
+            except IndexError:
+                print('Warning: probably ephemeris are missing' + 
+                      ' for some satellites, please check the ' + 
+                      'ephemeris source.')
+                continue
+        
+            ssr0 = state_space     
     
+    # release the last message content before unmapping the input file
+    read_msg = None
+    msg_content = None
+    frames = None
+    decoded_frames = None
+    in_file.close()
     dec_out.close() 
+    if frame_index is None:
+        print(frame_stats)
+    else:
+        print(frame_index)
+    if frame_filter is not None:
+        print(frame_filter.stats)
+    if (ssr_retention is not None) or (eph_keep is not None):
+        print('### Removed SSR epochs: ' + 
+              str(0 if ssr0 is None else ssr0.evicted) +
+              ', removed ephemeris: ' + 
+              str(0 if eph0 is None else eph0.evicted) + ' ###')
     print('### Decoded RTCM-SSR message types:' + '\n' +
           str(np.unique(types_list).astype('int')) + ' ###')
     if dec_only == 1:
@@ -287,32 +355,45 @@ def do_rtcmssr_demo(f_in, user_llh, dec_only=None, out_folder=None,
         return eph0, [], []
         
     osr = []
+    osr_stations = [[] for osr_output in osr_outputs]
+    # GLONASS trajectories, continued from one epoch to the next
+    glo_orbits = rtcm_ssr2osr.GloOrbits()
+    if orbit_accuracy is None:
+        orbit_cache = None
+    else:
+        orbit_cache = trajectory_cache.TrajectoryCache(orbit_accuracy,
+                                                       glo_orbits=glo_orbits)
     for epoch in sorted(ssr0.epochs):
-        j = int(np.where(ssr0.epochs == epoch)[0])
+        j = ssr0.row(epoch)
+        # get the closest in time ionosphere corrections if available, the
+        # same for all the satellites of the epoch
+        epoch_iono = ssr0.get_iono(epoch, iono_blend)
         # print epoch header
-        lat    = receiver['ellipsoidal'][0]
-        lon    = receiver['ellipsoidal'][1]
-        height = receiver['ellipsoidal'][2]                    
-        print('#****************************************' +
-              '*****************************************' + 
-              '************************************ ' + '\n' + 
-              '# Influence from SSR components on LLH position:' +
-              ' lat: ' + 
-              f'{lat}' + '  lon: ' + f'{lon}' + '  height: ' + 
-              f'{height}' + '.' + '\n' +
-              '# Satellite elevation is output in [deg], while all the other' +
-              ' parameters are in [m].' + '\n' + 
-              '# Frequencies used for wup, ' + 
-              'iono impact, code and phase bias are L1, G1, E1, B1-2,'+ '\n' + 
-              '# respectively for ' + 
-              'GPS/QZSS(1C), GLONASS(1C), Galileo(1X) and Beidou(2I).' + '\n' + 
-              '# Eph. week       time       SV       elev     sv_clk ' + 
-              '   sv_orb     iono_gl    shapiro      wup      phbias' +
-              '      cbias' + '\n' + 
-              '# ---------------------------------------' + 
-              '-----------------------------------------' + 
-              '------------------------------------ ',
-              file = osr_output)
+        for [k, llh] in enumerate(np.reshape(receiver['ellipsoidal'],
+                                             (-1, 3))):
+            lat    = llh[0]
+            lon    = llh[1]
+            height = llh[2]
+            print('#****************************************' +
+                  '*****************************************' + 
+                  '************************************ ' + '\n' + 
+                  '# Influence from SSR components on LLH position:' +
+                  ' lat: ' + 
+                  f'{lat}' + '  lon: ' + f'{lon}' + '  height: ' + 
+                  f'{height}' + '.' + '\n' +
+                  '# Satellite elevation is output in [deg], while all the other' +
+                  ' parameters are in [m].' + '\n' + 
+                  '# Frequencies used for wup, ' + 
+                  'iono impact, code and phase bias are L1, G1, E1, B1-2,'+ '\n' + 
+                  '# respectively for ' + 
+                  'GPS/QZSS(1C), GLONASS(1C), Galileo(1X) and Beidou(2I).' + '\n' + 
+                  '# Eph. week       time       SV       elev     sv_clk ' + 
+                  '   sv_orb     iono_gl    shapiro      wup      phbias' +
+                  '      cbias' + '\n' + 
+                  '# ---------------------------------------' + 
+                  '-----------------------------------------' + 
+                  '------------------------------------ ',
+                  file = osr_outputs[k])
         for system in eph0.systems:
             # check if any satellite of the GNSS system  considered received
             # any correction for the current epoch
@@ -375,34 +456,32 @@ def do_rtcmssr_demo(f_in, user_llh, dec_only=None, out_folder=None,
                 sat_list = ssr.orb.gnss_id
                 gnss_short = ssr.clck.gnss_short
             
+            # closest ephemeris of the satellites within their validity.
+            # The GLONASS ephemeris are given at tb, in GLONASS time of day
+            gnss_eph = eph0.gnss(system)
+            eph_epoch = rtcm_ssr2osr.ephemeris_epoch(system, epoch, ls_glo,
+                                                     n4)
+            eph_sat = gnss_eph.select(eph_epoch,
+                                      [gnss_short + sv for sv in sat_list],
+                                      gnss_eph.validity)
+            batch_IDs = []
+            batch_eph = []
             # sat counter
             for sv in sorted(sat_list):
                 ID = gnss_short + sv
-                # get for the closest ephemeris for that satellite if available
-                try:
-                    if system == 'G':
-                        ephemeris = eph0.get_closest_epo(epoch,
-                                                         eph0.gps, ID)[0]
-                    elif system == 'R':
-                        ephemeris = eph0.get_closest_epo(epoch,
-                                                         eph0.glo, ID)[0]
-                    elif system == 'E':
-                        ephemeris = eph0.get_closest_epo(epoch,
-                                                         eph0.gal, ID)[0]
-                    elif system == 'C':
-                        ephemeris = eph0.get_closest_epo(epoch,
-                                                         eph0.bds, ID)[0]
-                    elif system == 'J':
-                        ephemeris = eph0.get_closest_epo(epoch,
-                                                         eph0.qzs, ID)[0]
-                except:
+                # the ephemeris with the IOD of the orbit correction is
+                # preferred by RtcmSsr2osr, the closest one is the fallback
+                ephemeris = eph_sat.get(ID)
+                if ephemeris is None:
+                    ephemeris = eph0.get_iod_ephemeris(
+                        system, ID, rtcm_ssr2osr.orbit_iod(ssr, sv),
+                        eph_epoch)
+                if ephemeris is None:
                     print('No ephemeris available for satellite ' + ID)
                     continue
 
-                # get the closest in time ionosphere corrections if available
-                try:
-                    ionosphere = ssr0.get_closest_iono(ssr0, epoch)
-                except:
+                ionosphere = epoch_iono
+                if ionosphere is None:
                     print('No ionosphere corrections available for epoch ' +
                           str(epoch))
                     ionosphere = []
@@ -425,20 +504,86 @@ def do_rtcmssr_demo(f_in, user_llh, dec_only=None, out_folder=None,
                 
                 dt = 0
                 
+                if batch:
+                    batch_IDs.append(ID)
+                    batch_eph.append(ephemeris)
+                    continue
                 osr_out = rtcm_ssr2osr.RtcmSsr2osr(ssr, ephemeris,
                                                    epoch, ionosphere,
                                                    ID, track_mode,
                                                    ls, n4,
-                                                   receiver, dt, iono_output)
+                                                   receiver, dt, iono_output,
+                                                   eph0, glo_orbits,
+                                                   orbit_cache)
                 # print osr of the visible satellite and save it
                 if float(osr_out.el) >= 0:
                     osr = np.append(osr, osr_out)
                     print(osr_out, file = osr_output)
+            
+            if batch and batch_IDs:
+                osr_batch = rtcm_ssr2osr.RtcmSsr2osrBatch(ssr, batch_eph,
+                                                          epoch, ionosphere,
+                                                          batch_IDs,
+                                                          track_mode,
+                                                          ls, n4,
+                                                          receiver, dt,
+                                                          iono_output,
+                                                          eph0, glo_orbits,
+                                                          orbit_cache)
+                # print osr of the visible satellites and save them, for
+                # each station
+                visible = np.reshape(osr_batch.visible(),
+                                     (len(osr_outputs), -1))
+                osr_rows = np.reshape(osr_batch.osr, visible.shape)
+                for [k, osr_output] in enumerate(osr_outputs):
+                    osr_stations[k].append(osr_rows[k][visible[k]])
+                    for osr_sat in osr_rows[k][visible[k]]:
+                        print(rtcm_ssr2osr.RtcmSsr2osrBatch.make_output_line(
+                              osr_sat), file = osr_output)
 
 # =============================================================================
 #      close output files                
 # =============================================================================
-    osr_output.close()
+    for osr_output in osr_outputs:
+        osr_output.close()
     iono_output.close()
+    if orbit_cache is not None:
+        print(orbit_cache.stats)
     print('### Completed SSR influence computation.')
-    return eph0, ssr0, osr
\ No newline at end of file
+    if batch:
+        osr = [np.concatenate(osr_station) if osr_station else
+               np.zeros(0, dtype=rtcm_ssr2osr.OSR_DTYPE)
+               for osr_station in osr_stations]
+        if stations:
+            osr = dict(zip(station_names, osr))
+        else:
+            osr = osr[0]
+    return eph0, ssr0, osr
+
+def read_stations(f_stations):
+    """
+        Names and ellipsoidal coordinates lat[deg], lon[deg], height[m] of the
+        stations of the file f_stations, one station per line. The empty
+        lines and the lines starting with # are skipped.
+    """
+    names = []
+    llh = []
+    with open(f_stations) as f:
+        for line in f:
+            fields = line.split()
+            if (not fields) or fields[0].startswith('#'):
+                continue
+            names.append(fields[0])
+            llh.append([float(x) for x in fields[1:4]])
+    return names, llh
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print('Usage: python do_rtcmssr_demo.py f_in f_stations ' +
+              '[out_folder] [year] [doy]')
+        sys.exit(1)
+    [names, llh] = read_stations(sys.argv[2])
+    out_folder = sys.argv[3] if len(sys.argv) > 3 else None
+    [year, doy] = ([int(a) for a in sys.argv[4:6]] + [None, None])[0:2]
+    do_rtcmssr_demo(sys.argv[1], llh, out_folder=out_folder, year=year,
+                    doy=doy, station_names=names)
@@ -25,7 +25,10 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import bisect
+from collections.abc import Mapping
 import numpy as np
+import coord_and_time_transformations as trafo
 
 """
    Group of classes to create ephemeris objects.
@@ -39,20 +42,52 @@ import numpy as np
    message of a new system is received, the system is appended to the systems
    object by the method add_system.
    
-   The GNSS objects, e.g. gps, are defined by the GNSS class,
-   which has the objects sat, sat_epochs and eph. sat is a list of satellite ID
-   with received ephemeris, sat_epochs has, for each satellite of sat,
-   the list of epoch of received ephemeris. eph is the content of the 
-   ephemeris which is defined by the class StateAcc if the GNSS is GLONASS,
-   by the class Elements if not. 
+   The GNSS objects, e.g. gps, are defined by the GNSS class, an
+   incremental store of the ephemeris of one GNSS. It has the objects sat,
+   sat_epochs and eph. sat is the array of satellite IDs with received
+   ephemeris, sat_epochs has, for each satellite of sat, the sorted array of
+   epochs of received ephemeris (toe, tb for GLONASS). eph[sv] is the array
+   of the ephemeris of the satellite in the same order, defined by the class
+   StateAcc if the GNSS is GLONASS, by the class Elements if not.
    
-   Every time a new message is read, the GNSS object, e.g. gps, is updated by
-   using the methods add_sv of the Satellite class to add a new satellite
-   and add_epoch of the Epochs class to update the epochs and add a new decoded
-   ephemeris message. 
+   Every time a new message is read, the add method of the GNSS object
+   stores the ephemeris in the lists of its satellite. An ephemeris already
+   received, i.e. same satellite, epoch and IODE, is found in a set of keys
+   and ignored. The epochs are kept sorted: usually the ephemeris arrive in
+   time order and are appended at the end, otherwise they are inserted by
+   bisection. The arrays of sat, sat_epochs and eph are built from the
+   lists only when they are read after a change.
    
    A method to get the closest in time ephemeris of a specific satellite is 
-   included in the Ephemeris class: get_closest_epo.
+   included in the Ephemeris class: get_closest_epo. The closest epochs are
+   found by bisection of the sorted epochs of the satellite. The time
+   difference is computed modulo the week (the day for GLONASS tb), so that
+   the ephemeris of the end of a week is close to the epochs of the
+   beginning of the next one. If a window is given, the ephemeris is
+   returned only if its epoch is within the window, e.g. the validity of the
+   ephemeris of the GNSS (VALIDITY). The select method of the GNSS class
+   returns the closest ephemeris of several satellites at once.
+   
+   For a long running process, the number of ephemeris stored per satellite
+   can be limited by the keep argument of the Ephemeris class, e.g. keep=2
+   for the current and the previous ephemeris: after the insertion of a new
+   ephemeris, the method trim of the GNSS class removes the earliest received
+   ones. The removed ephemeris are counted in the evicted object of the GNSS
+   class.
+   
+   The SSR orbit corrections refer to the ephemeris with a given IOD. The
+   GNSS class keeps a dictionary, iods, of the received ephemeris for each
+   satellite and IOD, so that the ephemeris of a correction is found by the
+   method get_iod_ephemeris of the Ephemeris class without searching all
+   the ephemeris of the satellite. The IOD is the IODE for GPS and QZSS,
+   IODnav for Galileo, tb for GLONASS and mod(toe/720, 240) for BeiDou
+   (Ref. RTCM 10403.3). Since the IODs are reused, e.g. every day for
+   GLONASS, the ephemeris of the IOD closest to the SSR epoch is returned,
+   and only if it is within the validity of the GNSS.
+   
+   The Ephemeris class also keeps a ReferenceTime object, reference, which
+   is updated with every new ephemeris and gives the GLONASS four-year
+   interval number n4 used for the conversion of the GLONASS SSR epochs.
 """
 
 class Elements:
@@ -80,6 +115,14 @@ class Elements:
         self.toe       = dec_msg.toe
         self.toc       = dec_msg.toc
         self.week      = dec_msg.week
+        # issue of data of the ephemeris: IODE for GPS and QZSS,
+        # IODnav for Galileo, AODE for BeiDou
+        if hasattr(dec_msg, 'iode'):
+            self.iode = dec_msg.iode
+        elif hasattr(dec_msg, 'aode'):
+            self.iode = dec_msg.aode
+        else:
+            self.iode = dec_msg.iod
         
     def __repr__(self):
         return ("Orbital elements of sat " + self.sat_id + " at epoch " +
@@ -108,123 +151,350 @@ class StateAcc:
         self.tau   = dec_msg.tau
         self.tau_c = dec_msg.tau_c
         self.ch    = dec_msg.freq
+        # GLONASS ephemeris are identified by tb
+        self.iode  = int(dec_msg.tb / 900)
         
     def __repr__(self):
         return ("State vector and acc of sat " + self.sat_id + " at epoch " +
                 str(self.tb))
         
-class Epochs:
-    def __init__(self, dec_msg, epochs=None, ephemeris=None):
-        if epochs is None:
-            self.epochs = []
-        else:
-            self.epochs = epochs
-            
-        if ephemeris is None:
-            self.ephemeris = []
-        else:
-            self.ephemeris = ephemeris
-        self.dec_msg = dec_msg
+class ReferenceTime:
+    """
+        Running statistics of the received ephemeris, i.e. mean of the
+        GLONASS n4 (without the unknown values, 0) and mean of week and
+        epoch of the GPS, Galileo and BeiDou ephemeris. The means are
+        updated when a new ephemeris is stored or an old one is removed,
+        so that n4 and the reference time are available without scanning
+        the ephemeris.
+        The reference time is given by the first system with ephemeris
+        among GPS, Galileo and BeiDou.
+    """
+    def __init__(self):
+        self.n4_sum = 0.0
+        self.n4_count = 0
+        self.time_sum = {'G': 0.0, 'E': 0.0, 'C': 0.0}
+        self.time_count = {'G': 0, 'E': 0, 'C': 0}
+        self.week_sum = {'G': 0.0, 'E': 0.0, 'C': 0.0}
+        self.week_count = {'G': 0, 'E': 0, 'C': 0}
         
-    def add_epo(self, epo):
-        if epo not in self.epochs:
-            self.epochs = np.append(self.epochs, epo) 
-            
-            if self.dec_msg.gnss_short == 'R':
-                self.ephemeris = np.append(self.ephemeris,
-                                           StateAcc(self.dec_msg))
-            else:
-                self.ephemeris = np.append(self.ephemeris,
-                                           Elements(self.dec_msg))
+    def __repr__(self):
+        return ('ReferenceTime class with objects: n4_sum, n4_count, ' + 
+                'time_sum, time_count, week_sum, week_count')
+        
+    def add_ephemeris(self, ephemeris, system, sign=1):
+        # ephemeris: decoded message, Elements or StateAcc object
+        if system == 'R':
+            if (ephemeris.n4 != 0) and not np.isnan(ephemeris.n4):
+                self.n4_sum += sign * ephemeris.n4
+                self.n4_count += sign
+        elif system in self.time_sum:
+            if not np.isnan(ephemeris.toe):
+                self.time_sum[system] += sign * ephemeris.toe
+                self.time_count[system] += sign
+            if not np.isnan(ephemeris.week):
+                self.week_sum[system] += sign * ephemeris.week
+                self.week_count[system] += sign
+    
+    def remove_ephemeris(self, ephemeris, system):
+        self.add_ephemeris(ephemeris, system, -1)
+    
+    def glo_n4(self):
+        # mean n4 of the GLONASS ephemeris, 0 if not available
+        if self.n4_count == 0:
+            return 0
+        return self.n4_sum / self.n4_count
+    
+    def system(self):
+        for system in ['G', 'E', 'C']:
+            if self.time_count[system] > 0:
+                return system
+        return None
+        
+    def week(self):
+        system = self.system()
+        if system is None:
+            return None
+        return self.week_sum[system] / self.week_count[system]
+    
+    def time(self):
+        system = self.system()
+        if system is None:
+            return None
+        return self.time_sum[system] / self.time_count[system]
+    
+    def n4(self):
+        """
+            GLONASS four-year interval number starting from 1996, from the
+            GLONASS ephemeris or from the reference time. None if neither is
+            available.
+        """
+        n4 = self.glo_n4()
+        if n4 != 0:
+            return n4
+        if self.system() is None:
+            return None
+        year = trafo.gpsTime2y_doy_hms(self.week(), self.time())[0]
+        return int((year - 1995) / 4)
 
-class Satellite:
-    def __init__(self, satellites=None):
-        if satellites is None:
-            self.prn = []
-        else:
-            self.prn = satellites
-            
-    def add_sv(self, sv):
-        if sv not in self.prn:
-            self.prn = np.append(self.prn, sv)
-            
-class GNSS:
-    def __init__(self, dec_msg=None, epo=None, sv=None, eph=None,
-                 epochs=None, satellites=None):
-        if eph is None:
-            self.eph = {}
-        else: self.eph = eph
-        
-        if epochs is None:
-            self.sat_epochs = {}
-        else:
-            self.sat_epochs = epochs
-            
-        sat = Satellite(satellites)
+WEEK_SECONDS = 604800
+DAY_SECONDS = 86400
+# validity of the ephemeris around toe (tb for GLONASS) [s]
+VALIDITY = {'G': 7200, 'R': 900, 'E': 14400, 'C': 3600, 'J': 7200}
 
-        try:
-            epoch_list = Epochs(dec_msg, self.sat_epochs[sv],
-                                self.eph[sv])
-        except KeyError:
-            epoch_list = Epochs(dec_msg)
-        
-        if dec_msg is None:
-            self.sat = []
+class SatelliteViews(Mapping):
+    """
+        Read-only dictionary of arrays per satellite, built from the lists of
+        a GNSS store when they are read after a change.
+    """
+    def __init__(self, lists, dtype):
+        self.lists = lists
+        self.dtype = dtype
+        self.arrays = {}
+        
+    def __getitem__(self, sv):
+        if sv not in self.arrays:
+            array = np.empty(len(self.lists[sv]), dtype=self.dtype)
+            array[:] = self.lists[sv]
+            self.arrays[sv] = array
+        return self.arrays[sv]
+    
+    def __iter__(self):
+        return iter(self.lists)
+    
+    def __len__(self):
+        return len(self.lists)
+    
+    def __contains__(self, sv):
+        return sv in self.lists
+    
+    def changed(self, sv):
+        self.arrays.pop(sv, None)
+
+class GNSS:
+    def __init__(self, system=None, keep=None):
+        self.system = system
+        self.keep = keep        # ephemeris kept per satellite, all if None
+        self.evicted = 0
+        # period of the epochs, i.e. week or day for GLONASS tb
+        if system == 'R':
+            self.period = DAY_SECONDS
         else:
-            sat.add_sv(sv)
-            self.sat = sat.prn
-            epoch_list.add_epo(epo)
-            self.sat_epochs[sv] = epoch_list.epochs 
-            self.eph[sv] = epoch_list.ephemeris
+            self.period = WEEK_SECONDS
+        self.validity = VALIDITY.get(system)
+        self.prn = []           # satellites in order of reception
+        self.epoch_lists = {}   # sorted epochs per satellite
+        self.eph_lists = {}     # ephemeris per satellite, as the epochs
+        self.keys = set()       # (sv, epoch, IODE) of the stored ephemeris
+        self.iods = {}          # (sv, IOD) -> [(epoch, ephemeris)], in
+                                # order of reception
+        self.arrivals = {}      # (epoch, ephemeris) per satellite, in order
+                                # of reception
+        self.sat_epochs = SatelliteViews(self.epoch_lists, float)
+        self.eph = SatelliteViews(self.eph_lists, object)
+        self._sat = None
     
     def __repr__(self):
         return ('GNSS ephemeris class with objects: sat, sat_epochs[sv],' +
                 'eph[sv]')
+    
+    @property
+    def sat(self):
+        if self._sat is None:
+            self._sat = np.array(self.prn)
+        return self._sat
+    
+    def add(self, ephemeris, epo):
+        """
+            Store an ephemeris (Elements or StateAcc) with epoch epo.
+            Return False if the ephemeris has already been stored.
+        """
+        sv = ephemeris.sat_id
+        key = (sv, epo, ephemeris.iode)
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        self.iods.setdefault((sv, self.iod(ephemeris, epo)),
+                             []).append((epo, ephemeris))
+        if sv not in self.epoch_lists:
+            self.prn.append(sv)
+            self._sat = None
+            self.epoch_lists[sv] = []
+            self.eph_lists[sv] = []
+            self.arrivals[sv] = []
+        self.arrivals[sv].append((epo, ephemeris))
+        epochs = self.epoch_lists[sv]
+        if (len(epochs) == 0) or (epo >= epochs[-1]):
+            epochs.append(epo)
+            self.eph_lists[sv].append(ephemeris)
+        else:
+            # ephemeris older than the last one
+            i = bisect.bisect_right(epochs, epo)
+            epochs.insert(i, epo)
+            self.eph_lists[sv].insert(i, ephemeris)
+        self.sat_epochs.changed(sv)
+        self.eph.changed(sv)
+        return True
+    
+    def trim(self, sv):
+        """
+            Remove the earliest received ephemeris of sv exceeding keep.
+            Return the removed ephemeris.
+        """
+        removed = []
+        if self.keep is None:
+            return removed
+        arrivals = self.arrivals.get(sv, [])
+        while len(arrivals) > self.keep:
+            [epo, ephemeris] = arrivals.pop(0)
+            epochs = self.epoch_lists[sv]
+            first = bisect.bisect_left(epochs, epo)
+            last = bisect.bisect_right(epochs, epo)
+            for i in range(first, last):
+                if self.eph_lists[sv][i] is ephemeris:
+                    del epochs[i]
+                    del self.eph_lists[sv][i]
+                    break
+            self.keys.discard((sv, epo, ephemeris.iode))
+            iod = (sv, self.iod(ephemeris, epo))
+            entries = self.iods.get(iod, [])
+            for i in range(len(entries)):
+                if entries[i][1] is ephemeris:
+                    del entries[i]
+                    break
+            if not entries:
+                self.iods.pop(iod, None)
+            removed.append(ephemeris)
+        if removed:
+            self.evicted += len(removed)
+            self.sat_epochs.changed(sv)
+            self.eph.changed(sv)
+        return removed
+    
+    def iod(self, ephemeris, epo):
+        # IOD of the ephemeris used by the SSR messages
+        if self.system == 'C':
+            return int(epo / 720) % 240
+        return int(ephemeris.iode)
+    
+    def iod_ephemeris(self, sv, iod, epo, window=None):
+        """
+            Ephemeris of sv with the IOD iod closest to epo, the last
+            received one if equally distant. None if no ephemeris with the
+            IOD is within the window.
+        """
+        selected = None
+        d_min = None
+        for [epoch, ephemeris] in self.iods.get((sv, iod), []):
+            d = self.distance(epoch, epo)
+            if (window is not None) and (d > window):
+                continue
+            if (d_min is None) or (d <= d_min):
+                selected = ephemeris
+                d_min = d
+        return selected
+    
+    def distance(self, epoch, epo):
+        # time difference modulo the period of the epochs
+        dt = abs(epoch - epo) % self.period
+        return min(dt, self.period - dt)
+    
+    def closest(self, sv, epo, window=None):
+        """
+            Indices of the ephemeris of sv closest to epo, more than one if
+            equally distant. Empty if no ephemeris is within the window.
+        """
+        epochs = self.epoch_lists.get(sv)
+        if not epochs:
+            return []
+        n = len(epochs)
+        i = bisect.bisect_left(epochs, epo)
+        # neighbours of epo and, across the end of the period, first and
+        # last epoch
+        candidates = sorted({k for k in [i - 1, i, 0, n - 1] if 0 <= k < n})
+        distances = [self.distance(epochs[k], epo) for k in candidates]
+        d_min = min(distances)
+        if (window is not None) and (d_min > window):
+            return []
+        indices = []
+        for [k, d] in zip(candidates, distances):
+            if d == d_min:
+                # all the ephemeris with this epoch
+                first = bisect.bisect_left(epochs, epochs[k])
+                last = bisect.bisect_right(epochs, epochs[k])
+                indices.extend(range(first, last))
+        return sorted(set(indices))
+    
+    def select(self, epo, sats=None, window=None):
+        """
+            Closest ephemeris to epo of the satellites sats (all if None),
+            dictionary sat -> ephemeris without the satellites that have no
+            ephemeris within the window.
+        """
+        if sats is None:
+            sats = self.prn
+        selected = {}
+        for sv in sats:
+            indices = self.closest(sv, epo, window)
+            if indices:
+                selected[sv] = self.eph_lists[sv][indices[0]]
+        return selected
 
 class Ephemeris:
-    def __init__(self):
+    def __init__(self, keep=None):
         
         self.systems = []
-        self.gps = GNSS()
-        self.glo = GNSS()
-        self.gal = GNSS()
-        self.bds = GNSS()
-        self.qzs = GNSS()
+        self.gps = GNSS('G', keep)
+        self.glo = GNSS('R', keep)
+        self.gal = GNSS('E', keep)
+        self.bds = GNSS('C', keep)
+        self.qzs = GNSS('J', keep)
+        self.reference = ReferenceTime()
         
 
     def add_ephemeris_msg(self, dec_msg, system):
-        if system == 'G':
-            self.gps = GNSS(dec_msg, dec_msg.toe, dec_msg.sat_id,
-                            self.gps.eph, self.gps.sat_epochs, self.gps.sat)
-        elif system == 'R':
-            self.glo = GNSS(dec_msg, dec_msg.tb, dec_msg.sat_id,
-                            self.glo.eph, self.glo.sat_epochs, self.glo.sat)
-        elif system == 'E':
-            self.gal = GNSS(dec_msg, dec_msg.toe, dec_msg.sat_id,
-                            self.gal.eph, self.gal.sat_epochs, self.gal.sat)
-        elif system == 'C':
-            self.bds = GNSS(dec_msg, dec_msg.toe, dec_msg.sat_id,
-                            self.bds.eph, self.bds.sat_epochs, self.bds.sat)
-        elif system == 'J':
-            self.qzs = GNSS(dec_msg, dec_msg.toe, dec_msg.sat_id,
-                            self.qzs.eph, self.qzs.sat_epochs, self.qzs.sat)
-        
+        if system == 'R':
+            new = self.glo.add(StateAcc(dec_msg), dec_msg.tb)
+        elif system in ['G', 'E', 'C', 'J']:
+            new = self.gnss(system).add(Elements(dec_msg), dec_msg.toe)
+        else:
+            new = False
+        if new:
+            self.reference.add_ephemeris(dec_msg, system)
+            for old in self.gnss(system).trim(dec_msg.sat_id):
+                self.reference.remove_ephemeris(old, system)
+    
+    @property
+    def evicted(self):
+        # number of ephemeris removed by the retention of all the GNSS
+        return (self.gps.evicted + self.glo.evicted + self.gal.evicted +
+                self.bds.evicted + self.qzs.evicted)
         
     def __repr__(self):
         return ('Ephemeris class with objects: systems, gps, glo, gal, bds,' + 
                 'qzs')
             
+    def gnss(self, system):
+        return {'G': self.gps, 'R': self.glo, 'E': self.gal, 'C': self.bds,
+                'J': self.qzs}.get(system)
+    
     def add_system(self, system):
         if system not in self.systems:
             self.systems = np.append(self.systems, system)
     
-    def get_closest_epo(self, epo, gnss, sv):
-        try:
-            index = np.where(np.abs(gnss.sat_epochs[sv] - epo) ==
-                             np.min(np.abs(gnss.sat_epochs[sv] - epo)))
-            closest_eph = gnss.eph[sv][index[0]]
-        except KeyError:
+    def get_closest_epo(self, epo, gnss, sv, window=None):
+        if sv not in gnss.sat_epochs:
             # In this case, there is no ephemeris for that satellite
-            closest_eph = []
-        return closest_eph
-        
\ No newline at end of file
+            return []
+        indices = gnss.closest(sv, epo, window)
+        if not indices:
+            # no ephemeris within the window
+            return []
+        return gnss.eph[sv][indices]
+    
+    def get_iod_ephemeris(self, system, sv, iod, epo):
+        # ephemeris of sv with the IOD of the SSR messages closest to epo
+        # (tb for GLONASS), None if unknown or not within the validity
+        gnss = self.gnss(system)
+        if (gnss is None) or (iod is None):
+            return None
+        return gnss.iod_ephemeris(sv, int(iod), epo, gnss.validity)
@@ -241,22 +241,18 @@ class IonoComputation:
         return vtec
  
 # =============================================================================
-#                        Global ionospheric corerctions
-# =============================================================================    
-    def compute_global_iono(self):
-        """ Computation of IONO correction per satellite
-            
+#                   Spherical harmonics coefficients
+# =============================================================================
+    def sh_coefficients(c, s, order, deg):
+        """ Cosine and sine coefficients c_nm[m][0][n], s_nm[m - 1][0][n]
+            of the spherical harmonics from the coefficients of the message
         """
-        
         c_nm = []
         s_nm = []
-        c_print = np.array(self.c)
-        s_print = np.array(self.s)
-        order = self.sh_ord
-        deg   = self.sh_deg
-        nc    = len(self.c)
-        ns    = len(self.s)
-        h     = self.height
+        c_print = np.array(c)
+        s_print = np.array(s)
+        nc    = len(c)
+        ns    = len(s)
         index = 0
             
         for j in range(int(order) + 1):
@@ -278,6 +274,21 @@ class IonoComputation:
                                             (int(deg) - j)]), axis=0)
                 s_nm[j].append(s2append)
             index = index + (int(deg) - j)
+        return [c_nm, s_nm]
+
+# =============================================================================
+#                        Global ionospheric corerctions
+# =============================================================================    
+    def compute_global_iono(self):
+        """ Computation of IONO correction per satellite
+            
+        """
+        
+        order = self.sh_ord
+        deg   = self.sh_deg
+        h     = self.height
+        [c_nm, s_nm] = IonoComputation.sh_coefficients(self.c, self.s,
+                                                       order, deg)
 
         # *********************************************************** #
         #                                                             #
@@ -464,4 +475,131 @@ class PiercePoint:
         slant_factor = 1.0 / np.sin(el + psi_pp)
     
         return np.array([psi_pp, lambda_pp, phi_pp, slant_factor,
-                         sun_shift, lon_s])
\ No newline at end of file
+                         sun_shift, lon_s])
+
+# =============================================================================
+#          Global ionosphere of several satellites and receivers
+# =============================================================================
+class IonoBatch:
+    """
+        Ionospheric influence of the global ionosphere message for several
+        pairs of satellite and receiver, computed with array operations
+        with the same formulas of IonoComputation and PiercePoint, without
+        the debug output.
+        Input:
+            - epoch : epoch considered for the computation
+            - sat   : satellite positions, shape (n, 3)
+            - rec   : receiver positions, shape (n, 3) or (3,)
+            - f1    : frequencies considered, shape (n,)
+            - iono  : content of ionospheric RTCM-SSR message 1264
+        Output:
+            - stec_corr_f1: ionospheric influence [m] of each pair
+    """
+    def __init__(self, epoch, sat, rec, f1, iono):
+        sat = np.asarray(sat, dtype=float)
+        rec = np.broadcast_to(np.asarray(rec, dtype=float), sat.shape)
+        f1 = np.asarray(f1, dtype=float)
+        self.stec_corr_f1 = np.zeros(len(sat))
+        for l in range(iono.n_layers):
+            [c_nm, s_nm] = IonoComputation.sh_coefficients(iono.c[l][:],
+                                                           iono.s[l][:],
+                                                           iono.order[l],
+                                                           iono.degree[l])
+            [vtec, sf] = IonoBatch.compute_global_iono(epoch, sat, rec,
+                                                       iono.height[l] * 1000,
+                                                       iono.order[l],
+                                                       iono.degree[l],
+                                                       c_nm, s_nm)
+            stec = vtec * sf
+            self.stec_corr_f1 += 40.3 * 1e16 / (f1 * f1) * stec
+    
+    def __repr__(self):
+        return 'IonoBatch objects: stec_corr_f1'
+    
+    def compute_global_iono(epoch, sat, rec, layer_h, order, deg,
+                            c_nm, s_nm):
+        """ VTEC and slant factor of the pairs at the layer height [m]
+        """
+        pp = PiercePoint(sat, rec, layer_h)
+        
+        # satellite spin correction
+        rng = np.sqrt((sat[:, 0] - rec[:, 0]) ** 2 +
+                      (sat[:, 1] - rec[:, 1]) ** 2 +
+                      (sat[:, 2] - rec[:, 2]) ** 2)
+        spin = pp.omega_zero_dot * (rng / pp.c)
+        sat_spin = np.stack([sat[:, 0] + sat[:, 1] * spin,
+                             sat[:, 1] - sat[:, 0] * spin,
+                             sat[:, 2]], axis=-1)
+        
+        # spherical coordinates of the receivers
+        height = LA.norm(rec, axis=1) - pp.re
+        lat = np.arctan2(rec[:, 2], LA.norm(rec[:, 0:2], axis=1))
+        lon = np.arctan2(rec[:, 1], rec[:, 0])
+        
+        # az and el using spherical coordinates
+        d = sat_spin - rec
+        s_e = -np.sin(lon) * d[:, 0] + np.cos(lon) * d[:, 1]
+        s_n = (-np.sin(lat) * np.cos(lon) * d[:, 0] -
+               np.sin(lat) * np.sin(lon) * d[:, 1] +
+               np.cos(lat) * d[:, 2])
+        s_u = (np.cos(lat) * np.cos(lon) * d[:, 0] +
+               np.cos(lat) * np.sin(lon) * d[:, 1] +
+               np.sin(lat) * d[:, 2])
+        az = np.arctan2(s_e, s_n)
+        az = np.where(az < 0, az + 2 * np.pi, az)
+        el = np.arctan2(s_u, np.sqrt(s_e ** 2 + s_n ** 2))
+        
+        # pierce point
+        tmp = ((pp.re + height) / (pp.re + layer_h) * np.cos(el))
+        psi_pp = np.pi / 2 - el - np.arcsin(tmp)
+        tmp    = np.tan(psi_pp) * np.cos(az)
+        ctg_lat = 1 / np.tan(lat)
+        phi_pp = (np.arcsin(np.sin(lat) * np.cos(psi_pp) +
+                  np.cos(lat) * np.sin(psi_pp) * np.cos(az)))
+        ang = np.arcsin(np.sin(psi_pp) * np.sin(az) / np.cos(phi_pp))
+        lambda_pp = np.where(((lat >= 0) & (+tmp > ctg_lat)) |
+                             ((lat <  0) & (-tmp > ctg_lat)),
+                             lon + np.pi - ang, lon + ang)
+        sun_shift = math.fmod((epoch - 50400) * np.pi / 43200, 2 * np.pi)
+        lon_s = np.fmod(lambda_pp + sun_shift, 2 * np.pi)
+        sf = 1.0 / np.sin(el + psi_pp)
+        
+        # Legendre polynomials, as IonoComputation.compute_legendre_poly
+        x = np.sin(phi_pp)
+        nmax = int(np.max([order, deg]) + 1)
+        p = np.zeros((nmax, nmax, len(x)))
+        p[0][0] = 1.0
+        for m in range(1, nmax, 1):
+            p[m  ][m] = (2 * m - 1) * np.sqrt((1 - x * x)) * p[m - 1][m - 1]
+        for m in range(1, nmax - 1, 1):
+            p[m + 1][m] = (2 * x + 1) * x * p[m][m]
+        for m in range(0, nmax, 1):
+            for n in range(m + 1, nmax, 1):
+                p[n][m] = 1 / (n - m) * ((2 * n - 1) * x * p[n - 1][m] -
+                                         (n + m - 1) * p[n - 2][m])
+        p_cos = []
+        p_sin = []
+        for n in range(0, nmax, 1):
+            for m in range(0, n + 1, 1):
+                s2 = (((2 * n + 1) * math.factorial(n - m)) /
+                      (math.factorial(n + m)))
+                if(m == 0):
+                    n_nm = np.sqrt(1 * s2) * p[n][m]
+                else:
+                    n_nm = np.sqrt(2 * s2) * p[n][m]
+                p_cos.append(n_nm * np.cos(m * lon_s))
+                p_sin.append(n_nm * np.sin(m * lon_s))
+        
+        # VTEC, as IonoComputation.compute_vtec
+        vtec = np.zeros(len(x))
+        i = 0
+        for n in range(0, int(deg + 1), 1):
+            mmax = int(np.min([n, order])) + 1
+            for m in range(0, mmax, 1):
+                if m == 0:
+                    vtec = vtec + c_nm[m][0][n] * p_cos[i]
+                else:
+                    vtec = vtec + (c_nm[m  ][0][n  ] * p_cos[i] +
+                                   s_nm[m - 1][0][n - 1] * p_sin[i])
+                i = i + 1
+        return [vtec, sf]
@@ -25,7 +25,7 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import bitstruct
+import bit_layouts
 import numpy as np
 import sys
 import coord_and_time_transformations as trafo
@@ -91,812 +91,939 @@ import coord_and_time_transformations as trafo
     References:
        - RTCM c10403.3
        
+    The decoder classes are collected in the DECODERS dictionary, whose keys
+    are the message types. A class is added by the register decorator, which
+    also defines the method of the rtcm_decoder class used to print the
+    decoded message (renderer) and whether the class needs the year and the
+    day of year of the message reception (dated). The is_supported function
+    tells if a message type can be decoded, without unpacking the message.
+    If the rtcm_decoder is created with lazy=True, only the common SSR header
+    is decoded (header member), while the complete message is decoded at the
+    first access to dec_msg.
+    The bit fields are unpacked with the compiled layouts cached by the
+    bit_layouts module. The messages with a variable number of fields per
+    satellite or layer (code bias, phase bias and VTEC) are read in a single
+    pass by its BitCursor.
 """
 
+DECODERS = {}
+
+def register(msg_type, renderer, dated=False):
+    def add_decoder(decoder):
+        decoder.msg_type = msg_type
+        decoder.renderer = renderer
+        decoder.dated = dated
+        DECODERS[msg_type] = decoder
+        return decoder
+    return add_decoder
+
+def is_supported(msg_type):
+    return msg_type in DECODERS
+
+""" Per-satellite content of the SSR messages
+
+    The satellite parameters of the SSR orbit, clock, URA, high-rate clock
+    and bias messages are stored in a structured array, sat, with one row per
+    satellite and a dtype fixed by the message type. The columns are filled
+    at once from the unpacked satellite blocks and the attributes used so far,
+    e.g. gnss_id, dr or dc0, are views on the columns of the array.
+    The satellite ID is stored as string, the other parameters as float.
+    The signal specific parameters of the bias messages (track, name, bias,
+    ...) remain lists, since the number of signals changes per satellite.
+    The messages also have the dictionary rows, satellite ID -> row of sat,
+    and the bias messages the dictionary biases, (satellite ID, signal) ->
+    bias, so that the corrections of a satellite are found without
+    searching the satellite IDs and the signal names.
+"""
+
+def sat_dtype(fields):
+    return np.dtype([('gnss_id', 'U3')] + [(f, 'f8') for f in fields])
+
+ORBIT_FIELDS = ('gnss_iod', 'p', 'dr', 'dt', 'dn', 'dot_dr', 'dot_dt',
+                'dot_dn')
+CLOCK_FIELDS = ('dc0', 'dc1', 'dc2')
+
+ORBIT_DTYPE           = sat_dtype(ORBIT_FIELDS)
+CLOCK_DTYPE           = sat_dtype(CLOCK_FIELDS)
+ORBIT_CLOCK_DTYPE     = sat_dtype(ORBIT_FIELDS + CLOCK_FIELDS)
+BDS_ORBIT_DTYPE       = sat_dtype(('toe',) + ORBIT_FIELDS)
+BDS_ORBIT_CLOCK_DTYPE = sat_dtype(('toe',) + ORBIT_FIELDS + CLOCK_FIELDS)
+URA_DTYPE             = sat_dtype(('ura_class', 'ura_value', 'ura'))
+HR_CLOCK_DTYPE        = sat_dtype(('hr_clock',))
+CODE_BIAS_DTYPE       = sat_dtype(('number',))
+PHASE_BIAS_DTYPE      = sat_dtype(('number', 'yaw_angle', 'yaw_rate'))
+
+def sat_rows(values, first, stride, n_sat, width=None):
+    # row i, column k is values[first + stride * i + k]
+    if width is None:
+        width = stride
+    index = (first + stride * np.arange(n_sat)[:, np.newaxis] +
+             np.arange(width))
+    return np.array(values, dtype=np.int64)[index]
+
+def sat_id(number):
+    if number < 10:
+        return '0' + f'{number}'
+    return f'{number}'
+
+def sat_ids(numbers):
+    return [sat_id(number) for number in numbers]
+
+def sat_index(gnss_id):
+    # satellite ID -> row of the first occurrence
+    rows = {}
+    for [i, sv] in enumerate(gnss_id.tolist()):
+        rows.setdefault(sv, i)
+    return rows
+
+def bias_index(gnss_id, name, bias):
+    # (satellite ID, signal) -> bias, the last one if repeated
+    biases = {}
+    for [sv, signals, values] in zip(gnss_id.tolist(), name, bias):
+        for [signal, value] in zip(signals, values):
+            biases[(sv, signal)] = value
+    return biases
+
+""" Common header of the SSR messages
+
+    The ssr_header class decodes only the part of an SSR message common to
+    all its types, i.e. message type, epoch time, update interval, multiple
+    message indicator, IOD SSR, provider and solution ID and number of
+    satellites (number of layers for the VTEC message), according to the
+    header layouts of RTCM c10403.3. It is used by the lazy mode of the
+    rtcm_decoder class: scanning the headers of a stream, e.g. for
+    statistics, indexing or selecting a time window, avoids unpacking the
+    satellite blocks. For messages without SSR header, e.g. ephemeris, only
+    the message type and the GNSS are available.
+"""
+
+GPS_SSR = (1057, 1058, 1059, 1060, 1061, 1062, 1265)
+GLO_SSR = (1063, 1064, 1065, 1066, 1067, 1068, 1266)
+GAL_SSR = (1240, 1241, 1242, 1243, 1244, 1245, 1267)
+QZS_SSR = (1246, 1247, 1248, 1249, 1250, 1251, 1268)
+BDS_SSR = (1258, 1259, 1260, 1261, 1262, 1263, 1270)
+SSR_SYSTEMS = {}
+for [gnss_short, types] in [['G', GPS_SSR], ['R', GLO_SSR], ['E', GAL_SSR],
+                            ['J', QZS_SSR], ['C', BDS_SSR]]:
+    for msg_type in types:
+        SSR_SYSTEMS[msg_type] = gnss_short
+EPHEMERIS_SYSTEMS = {1019: 'G', 1020: 'R', 1042: 'C', 1044: 'J', 1045: 'E',
+                     1046: 'E'}
+# messages with the satellite reference datum flag
+SSR_DATUM = (1057, 1060, 1063, 1066, 1240, 1243, 1246, 1249, 1258, 1261)
+SSR_PHASE_BIAS = (1265, 1266, 1267, 1268, 1270)
+VTEC = 1264
+
+def ssr_header_layout(msg_type):
+    if msg_type == VTEC:
+        return 'u12u20u4u1u4u16u4u9u2'
+    if msg_type not in SSR_SYSTEMS:
+        return None
+    # GLONASS epoch time is 17 bits long
+    if SSR_SYSTEMS[msg_type] == 'R':
+        layout = 'u12u17u4u1'
+    else:
+        layout = 'u12u20u4u1'
+    if msg_type in SSR_DATUM:
+        layout = layout + 'u1'
+    layout = layout + 'u4u16u4'
+    if msg_type in SSR_PHASE_BIAS:
+        layout = layout + 'u1u1'
+    return layout + 'u6'
+
+class ssr_header:
+    def __init__(self, message, msg_type):
+        self.msg_type = msg_type
+        if msg_type in EPHEMERIS_SYSTEMS:
+            self.gnss_short = EPHEMERIS_SYSTEMS[msg_type]
+        else:
+            self.gnss_short = SSR_SYSTEMS.get(msg_type)
+        self.epoch = None
+        self.ui = None
+        self.mmi = None
+        self.iod = None
+        self.provider_id = None
+        self.solution_id = None
+        self.n_sat = None
+        layout = ssr_header_layout(msg_type)
+        if layout is None:
+            return
+        unpack_bits = bit_layouts.unpack(layout, message)
+        ui_list = [1, 2, 5, 10, 15, 30, 60, 120, 240, 300, 600, 900, 1800,
+                   3600, 7200, 10800]
+        self.epoch = unpack_bits[1]
+        self.ui = ui_list[int(unpack_bits[2])]
+        self.mmi = f'{unpack_bits[3]}'
+        # skip the satellite reference datum
+        k = 4 + (msg_type in SSR_DATUM)
+        self.iod = unpack_bits[k]
+        self.provider_id = unpack_bits[k + 1]
+        self.solution_id = unpack_bits[k + 2]
+        if msg_type == VTEC:
+            self.n_layers = unpack_bits[8] + 1
+        else:
+            self.n_sat = unpack_bits[-1]
+
+    def __repr__(self):
+        return ('SSR header of message ' + str(self.msg_type) +
+                ' at epoch ' + str(self.epoch))
+
 class rtcm_decoder:
-    def __init__(self, message, type_len, year, doy):
+    def __init__(self, message, type_len, year, doy, lazy=False):
         self.msg = message
         self.type_len = type_len
+        self.year = year
+        self.doy = doy
         try:
-            message_type = bitstruct.unpack('u12', message)[0]
+            message_type = bit_layouts.unpack('u12', message)[0]
         except:
             print('The rtcm-file considered does not contained ' +
                   'the RTCM-SSR messages considered in the demo.')
             sys.exit()
             
         self.msg_type = message_type
-          
-        if message_type == 1019:
-            self.dec_msg = gps_ephemeris(message, year, doy)
-        elif message_type == 1057:
-            self.dec_msg = gps_orbit(message)
-        elif message_type == 1058:
-            self.dec_msg = gps_clock(message)
-        elif message_type == 1059:
-            self.dec_msg = gps_code_bias(message)
-        elif message_type == 1060:
-            self.dec_msg = gps_orbit_clock(message)
-        elif message_type == 1061:
-            self.dec_msg = gps_ura(message)
-        elif message_type == 1265:
-            self.dec_msg = gps_phase_bias(message)
-        elif message_type == 1020:
-            self.dec_msg = glo_ephemeris(message)
-        elif message_type == 1063:
-            self.dec_msg = glo_orbit(message)    
-        elif message_type == 1064:
-            self.dec_msg = glo_clock(message)   
-        elif message_type == 1065:
-            self.dec_msg = glo_code_bias(message)   
-        elif message_type == 1066:
-            self.dec_msg = glo_orbit_clock(message) 
-        elif message_type == 1067:
-            self.dec_msg = glo_ura(message) 
-        elif message_type == 1266:
-            self.dec_msg = glo_phase_bias(message) 
-        elif message_type == 1045:
-            self.dec_msg = gal_ephemeris_fnav(message)         
-        elif message_type == 1046:
-            self.dec_msg = gal_ephemeris_inav(message)   
-        elif message_type == 1240:
-            self.dec_msg = gal_orbit(message)         
-        elif message_type == 1241:
-            self.dec_msg = gal_clock(message)  
-        elif message_type == 1242:
-            self.dec_msg = gal_code_bias(message)         
-        elif message_type == 1243:
-            self.dec_msg = gal_orbit_clock(message) 
-        elif message_type == 1244:
-            self.dec_msg = gal_ura(message)         
-        elif message_type == 1245:
-            self.dec_msg = gal_hr_clock(message)
-        elif message_type == 1267:
-            self.dec_msg = gal_phase_bias(message)
-        elif message_type == 1264:
-            self.dec_msg = iono_sph(message)    
-        elif message_type == 1042:
-            self.dec_msg = bds_ephemeris(message)  
-        elif message_type == 1258:
-            self.dec_msg = bds_orbit(message)    
-        elif message_type == 1259:
-            self.dec_msg = bds_clock(message)  
-        elif message_type == 1260:
-            self.dec_msg = bds_code_bias(message) 
-        elif message_type == 1261:
-            self.dec_msg = bds_orbit_clock(message)  
-        elif message_type == 1262:
-            self.dec_msg = bds_ura(message) 
-        elif message_type == 1270:
-            self.dec_msg = bds_phase_bias(message) 
-        elif message_type == 1044:
-            self.dec_msg = qzs_ephemeris(message) 
-        elif message_type == 1246:
-            self.dec_msg = qzs_orbit(message) 
-        elif message_type == 1247:
-            self.dec_msg = qzs_clock(message)
-        elif message_type == 1248:
-            self.dec_msg = qzs_code_bias(message) 
-        elif message_type == 1249:
-            self.dec_msg = qzs_orbit_clock(message)
-        elif message_type == 1250:
-            self.dec_msg = qzs_ura(message) 
-        elif message_type == 1251:
-            self.dec_msg = qzs_hr_clock(message)
-        elif message_type == 1268:
-            self.dec_msg = qzs_phase_bias(message) 
+        self._dec_msg = None
+        self._decoded = False
+        self._header = None
+        if lazy:
+            # only the common SSR header, the message is decoded at the
+            # first access to dec_msg
+            self._header = ssr_header(message, message_type)
         else:
-            self.dec_msg = None            
+            self.decode()
+
+    def decode(self):
+        if not self._decoded:
+            decoder = DECODERS.get(self.msg_type)
+            if decoder is None:
+                self._dec_msg = None
+            elif decoder.dated:
+                self._dec_msg = decoder(self.msg, self.year, self.doy)
+            else:
+                self._dec_msg = decoder(self.msg)
+            self._decoded = True
+        return self._dec_msg
+
+    @property
+    def dec_msg(self):
+        return self.decode()
+
+    @dec_msg.setter
+    def dec_msg(self, dec_msg):
+        self._dec_msg = dec_msg
+        self._decoded = True
+
+    @property
+    def header(self):
+        if self._header is None:
+            self._header = ssr_header(self.msg, self.msg_type)
+        return self._header
+
+    @property
+    def decoded(self):
+        return self._decoded
 # =============================================================================
 #                              Printing method        
 # =============================================================================
+    def __str__(self):
+        decoder = DECODERS.get(self.msg_type)
+        if decoder is None:
+            # unknown message type, nothing to print
+            return
+        return getattr(self, '_str_' + decoder.renderer)()
+
 # *************************************************************************** #
 #                                                                             #
 #                       Ephemeris (Kepler elements)                           #
 #                                                                             #
 # *************************************************************************** #
-    def __str__(self):
-        if ((self.msg_type == 1019) | (self.msg_type == 1045) | 
-            (self.msg_type == 1046) | (self.msg_type == 1042) |
-            (self.msg_type == 1044)):
-            strg = ('### RTCM 3 - ' + self.dec_msg.gnss +
-                    ' Ephemeris Message ' + '<' + str(self.msg_type) + '>' +
-                    '\n' +
-                    ' Message size [bytes] :  ' + str(self.type_len + 6) +
-                    '\n' +
-                    ' Data  length [bytes] :  ' + str(self.type_len)   +
-                    '\n' +
-                    '{:''8} {:''2} {}'.format(' PRN                 ', ':', 
-                                              self.dec_msg.sat_id) + '\n'  + 
-                    '{:''8} {:''2} {}'.format(' WEEK                ', ':', 
-                    self.dec_msg.week)) 
-            if ((self.msg_type == 1019)| (self.msg_type == 1044)):
-                strg = (strg + '\n' + 
-                       '{:''8} {:''1} {:>13.6e}'.format(' TGD                 ',
-                       ':', self.dec_msg.tgd) +
-                       '\n' +                       
-                       '{:''8} {:''2} {}'.format(' IODC                ', ':',
-                        self.dec_msg.iodc) + '\n'
-                       '{:''8} {:''2} {}'.format(' IODE                ', ':',
-                       self.dec_msg.iode))
-            elif (self.msg_type == 1045) | (self.msg_type == 1046): 
-                strg = (strg + '\n' + 
-                       '{:''8} {:''1} {:>13.6e}'.format(' BGD5AE1             ',
-                       ':', self.dec_msg.bgd_a) +
-                       '\n' +
-                       '{:''8} {:''1} {:>13.6e}'.format(' BGD5BE1             ',
-                       ':', self.dec_msg.bgd_b) +
-                       '\n' + 
-                       '{:''8} {:''2} {}'.format(' IODNAV              ', ':',
-                        self.dec_msg.iod))
-            elif (self.msg_type == 1042): 
-                strg = (strg + '\n' + 
-                       '{:''8} {:''1} {:>13.6e}'.format(' TGD1             [s]',
-                       ':', self.dec_msg.tgd1) +
-                       '\n' +
-                       '{:''8} {:''1} {:>13.6e}'.format(' TGD2             [s]',
-                       ':', self.dec_msg.tgd2) +
-                       '\n' + 
-                       '{:''8} {:''2} {}'.format(' AODC             [h]',
-                       ':', self.dec_msg.aodc) +
-                       '\n' +
-                       '{:''8} {:''2} {}'.format(' AODE             [h]',
-                       ':', self.dec_msg.aode))
-            strg = (strg + '\n' +                       
-                    '{:''8} {:''2} {}'.format(' T0C              [s]', ':',
-                    self.dec_msg.toc) + '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' AF2          [s/s/s]',
-                    ':', self.dec_msg.af_two) + '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' AF1            [s/s]',
-                    ':', self.dec_msg.af_one) + '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' AF0              [s]',
-                    ':', self.dec_msg.af_zero) + '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' DN           [rad/s]', 
-                    ':', self.dec_msg.dn) + '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' M0             [ras]',
-                    ':', self.dec_msg.m0) + '\n' +  
-                    '{:''8} {:''1} {:>13.6e}'.format(' E                   ', 
-                    ':', self.dec_msg.ecc) + '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' ROOTA        [m^0.5]', 
-                    ':', self.dec_msg.root_a) + '\n' + 
-                    '{:''8} {:''2} {}'.format(' T0E              [s]', ':',
-                    self.dec_msg.toe) + '\n' + 
-                    '{:''8} {:''1} {:>13.8e}'.format(' CIC            [rad]', 
-                    ':', self.dec_msg.cic) + '\n' + 
-                    '{:''8} {:''1} {:>13.8e}'.format(' CRC              [m]', 
-                    ':', self.dec_msg.crc) + '\n' + 
-                    '{:''8} {:''1} {:>13.8e}'.format(' CIS            [rad]', 
-                     ':', self.dec_msg.cis) + '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' CRS              [m]', 
-                     ':', self.dec_msg.crs) + '\n' +  
-                    '{:''8} {:''1} {:>13.6e}'.format(' CUC            [rad]', 
-                    ':', self.dec_msg.cuc) + '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' CUS            [rad]', 
-                    ':', self.dec_msg.cus) + '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' OMEGA0         [rad]', 
-                    ':', self.dec_msg.omega_0) + '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' omega          [rad]', 
-                    ':', self.dec_msg.omega) + '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' I0             [rad]', 
-                    ':', self.dec_msg.i0) + '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' OMEGA.       [rad/s]', 
-                    ':', self.dec_msg.omega_dot) + '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' IDOT         [rad/s]', 
-                    ':', self.dec_msg.idot) + '\n' + 
-                    '{:''8} {:''2} {}'.format(' HEALTH              ', ':',
-                    self.dec_msg.health))
-            if ((self.msg_type == 1019) | (self.msg_type == 1044)):
-                strg = (strg + '\n' + 
-                       '{:''8} {:''2} {}'.format(' URA                 ', ':',
-                       self.dec_msg.ura) + '\n' +  
-                       '{:''8} {:''2} {}'.format(' FIT                 ', ':', 
-                       self.dec_msg.interval) + '\n')
-            if  (self.msg_type == 1045) | (self.msg_type == 1046):
-                strg = (strg + '\n' + 
-                       '{:''8} {:''2} {}'.format(' SISA                ', ':',
-                       self.dec_msg.sisa) + '\n')            
-            if (self.msg_type == 1042):
-                strg = (strg + '\n' + 
-                       '{:''8} {:''2} {}'.format(' URA                 ', ':',
-                       self.dec_msg.ura))  
-            
-            return strg          
+    def _str_kepler_ephemeris(self):
+        strg = ('### RTCM 3 - ' + self.dec_msg.gnss +
+                ' Ephemeris Message ' + '<' + str(self.msg_type) + '>' +
+                '\n' +
+                ' Message size [bytes] :  ' + str(self.type_len + 6) +
+                '\n' +
+                ' Data  length [bytes] :  ' + str(self.type_len)   +
+                '\n' +
+                '{:''8} {:''2} {}'.format(' PRN                 ', ':', 
+                                          self.dec_msg.sat_id) + '\n'  + 
+                '{:''8} {:''2} {}'.format(' WEEK                ', ':', 
+                self.dec_msg.week)) 
+        if ((self.msg_type == 1019)| (self.msg_type == 1044)):
+            strg = (strg + '\n' + 
+                   '{:''8} {:''1} {:>13.6e}'.format(' TGD                 ',
+                   ':', self.dec_msg.tgd) +
+                   '\n' +                       
+                   '{:''8} {:''2} {}'.format(' IODC                ', ':',
+                    self.dec_msg.iodc) + '\n'
+                   '{:''8} {:''2} {}'.format(' IODE                ', ':',
+                   self.dec_msg.iode))
+        elif (self.msg_type == 1045) | (self.msg_type == 1046): 
+            strg = (strg + '\n' + 
+                   '{:''8} {:''1} {:>13.6e}'.format(' BGD5AE1             ',
+                   ':', self.dec_msg.bgd_a) +
+                   '\n' +
+                   '{:''8} {:''1} {:>13.6e}'.format(' BGD5BE1             ',
+                   ':', self.dec_msg.bgd_b) +
+                   '\n' + 
+                   '{:''8} {:''2} {}'.format(' IODNAV              ', ':',
+                    self.dec_msg.iod))
+        elif (self.msg_type == 1042): 
+            strg = (strg + '\n' + 
+                   '{:''8} {:''1} {:>13.6e}'.format(' TGD1             [s]',
+                   ':', self.dec_msg.tgd1) +
+                   '\n' +
+                   '{:''8} {:''1} {:>13.6e}'.format(' TGD2             [s]',
+                   ':', self.dec_msg.tgd2) +
+                   '\n' + 
+                   '{:''8} {:''2} {}'.format(' AODC             [h]',
+                   ':', self.dec_msg.aodc) +
+                   '\n' +
+                   '{:''8} {:''2} {}'.format(' AODE             [h]',
+                   ':', self.dec_msg.aode))
+        strg = (strg + '\n' +                       
+                '{:''8} {:''2} {}'.format(' T0C              [s]', ':',
+                self.dec_msg.toc) + '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' AF2          [s/s/s]',
+                ':', self.dec_msg.af_two) + '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' AF1            [s/s]',
+                ':', self.dec_msg.af_one) + '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' AF0              [s]',
+                ':', self.dec_msg.af_zero) + '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' DN           [rad/s]', 
+                ':', self.dec_msg.dn) + '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' M0             [ras]',
+                ':', self.dec_msg.m0) + '\n' +  
+                '{:''8} {:''1} {:>13.6e}'.format(' E                   ', 
+                ':', self.dec_msg.ecc) + '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' ROOTA        [m^0.5]', 
+                ':', self.dec_msg.root_a) + '\n' + 
+                '{:''8} {:''2} {}'.format(' T0E              [s]', ':',
+                self.dec_msg.toe) + '\n' + 
+                '{:''8} {:''1} {:>13.8e}'.format(' CIC            [rad]', 
+                ':', self.dec_msg.cic) + '\n' + 
+                '{:''8} {:''1} {:>13.8e}'.format(' CRC              [m]', 
+                ':', self.dec_msg.crc) + '\n' + 
+                '{:''8} {:''1} {:>13.8e}'.format(' CIS            [rad]', 
+                 ':', self.dec_msg.cis) + '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' CRS              [m]', 
+                 ':', self.dec_msg.crs) + '\n' +  
+                '{:''8} {:''1} {:>13.6e}'.format(' CUC            [rad]', 
+                ':', self.dec_msg.cuc) + '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' CUS            [rad]', 
+                ':', self.dec_msg.cus) + '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' OMEGA0         [rad]', 
+                ':', self.dec_msg.omega_0) + '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' omega          [rad]', 
+                ':', self.dec_msg.omega) + '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' I0             [rad]', 
+                ':', self.dec_msg.i0) + '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' OMEGA.       [rad/s]', 
+                ':', self.dec_msg.omega_dot) + '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' IDOT         [rad/s]', 
+                ':', self.dec_msg.idot) + '\n' + 
+                '{:''8} {:''2} {}'.format(' HEALTH              ', ':',
+                self.dec_msg.health))
+        if ((self.msg_type == 1019) | (self.msg_type == 1044)):
+            strg = (strg + '\n' + 
+                   '{:''8} {:''2} {}'.format(' URA                 ', ':',
+                   self.dec_msg.ura) + '\n' +  
+                   '{:''8} {:''2} {}'.format(' FIT                 ', ':', 
+                   self.dec_msg.interval) + '\n')
+        if  (self.msg_type == 1045) | (self.msg_type == 1046):
+            strg = (strg + '\n' + 
+                   '{:''8} {:''2} {}'.format(' SISA                ', ':',
+                   self.dec_msg.sisa) + '\n')            
+        if (self.msg_type == 1042):
+            strg = (strg + '\n' + 
+                   '{:''8} {:''2} {}'.format(' URA                 ', ':',
+                   self.dec_msg.ura))  
+        
+        return strg          
 # *************************************************************************** #
 #                                                                             #
 #                      Ephemeris (state vector)                               #
 #                                                                             #
 # *************************************************************************** #                     
-        elif (self.msg_type == 1020):
-            strg = ('### RTCM 3 - ' + self.dec_msg.gnss +
-                    ' Ephemeris Message ' + '<' + str(self.msg_type) +  '>' +
-                    '\n' +
-                    ' Message size [bytes] :  ' + str(self.type_len + 6) +
-                    '\n' +
-                    ' Data  length [bytes] :  ' + str(self.type_len) +
-                    '\n' +
-                    '{:''8} {:''2} {}'.format(' GLO SLOT            ', ':', 
-                    self.dec_msg.sat_id) + '\n' +
-                    '{:''8} {:''2} {}'.format(' FREQ                ', ':',
-                    self.dec_msg.freq) + '\n' +
-                    '{:''8} {:''2} {}'.format(' DAY NUMBER          ', ':',
-                    self.dec_msg.nt) + '\n' +
-                    '{:''8} {:''1} {:>13.6e}'.format(' T_K [s]             ',
-                    ':', self.dec_msg.tk) + '\n' +
-                    '{:''8} {:''1} {:>13.6e}'.format(' T_B [s]             ',
-                    ':', self.dec_msg.tb) + '\n' +  
-                    '{:''8} {:''2} {}'.format(' HEALTH Bn           ', ':',
-                    self.dec_msg.bn) + '\n' +
-                    '{:''8} {:''2} {}'.format(' HEALTH Cn           ', ':',
-                    self.dec_msg.cn) + '\n' +
-                    '{:''8} {:''2} {}'.format(' HEALTH 2            ', ':',
-                    self.dec_msg.msb_bn) + '\n' + 
-                    '{:''8} {:''2} {}'.format(' Flag P              ', ':',
-                    self.dec_msg.p) + '\n' +
-                    '{:''8} {:''2} {}'.format(' Flag P1             ', ':',
-                    self.dec_msg.p1) + '\n' +
-                    '{:''8} {:''2} {}'.format(' Flag P2             ', ':',
-                    self.dec_msg.p2) + '\n' +
-                    '{:''8} {:''2} {}'.format(' Flag P3             ', ':',
-                    self.dec_msg.p3) + '\n' +
-                    '{:''8} {:''2} {}'.format(' Flag P4             ', ':',
-                    self.dec_msg.p4) + '\n' +
-                    '{:''8} {:''2} {}'.format(' FT                  ', ':',
-                    self.dec_msg.ft) + '\n' +
-                    '{:''8} {:''2} {}'.format(' MODIFICAT.          ', ':',
-                    self.dec_msg.m) + '\n' +
-                    '{:''8} {:''1} {:>13.6e}'.format(' GAMMA          [s/s]', 
-                    ':', self.dec_msg.gamma) + '\n' +
-                    '{:''8} {:''1} {:>13.6e}'.format(' TAU              [s]',
-                    ':', self.dec_msg.tau) + '\n' +
-                    '{:''8} {:''1} {:>13.6e}'.format(' DELTA TAU        [s]',
-                    ':', self.dec_msg.dtau) + '\n' +
-                    '{:''8} {:''2} {}'.format(' AGE              [d]',
-                    ':', self.dec_msg.en) + '\n' +
-                    '{:''8} {:''1} {:>+9.6f}'.format(' X               [km]',
-                    ':', self.dec_msg.xn) +  '\n' +
-                    '{:''8} {:''1} {:>+9.6f}'.format(' Y               [km]',
-                    ':', self.dec_msg.yn) + '\n' +
-                    '{:''8} {:''1} {:>+9.6f}'.format(' Z               [km]',
-                    ':', self.dec_msg.zn) + '\n' +
-                    '{:''8} {:''1} {:>+9.6f}'.format(' XDOT          [km/s]',
-                    ':', self.dec_msg.dxn) + '\n' +
-                    '{:''8} {:''1} {:>+9.6f}'.format(' YDOT          [km/s]',
-                    ':', self.dec_msg.dyn) + '\n' +
-                    '{:''8} {:''1} {:>+9.6f}'.format(' ZDOT          [km/s]',
-                    ':', self.dec_msg.dzn) + '\n' +
-                    '{:''8} {:''1} {:>13.6e}'.format(' XDOTDOT     [km/s^2]',
-                    ':', self.dec_msg.ddxn) + '\n' +
-                    '{:''8} {:''1} {:>13.6e}'.format(' YDOTDOT     [km/s^2]',
-                    ':', self.dec_msg.ddyn) + '\n' +
-                    '{:''8} {:''1} {:>13.6e}'.format(' ZDOTDOT     [km/s^2]',
-                    ':', self.dec_msg.ddzn) + '\n' +            
-                    '{:''8} {:''1} {:>13.6e}'.format(' avail. add. data 0/1',
-                             ':', self.dec_msg.ava) +
-                             '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' TauC                ', 
-                             ':', self.dec_msg.tau_c) +
-                             '\n' + 
-                    '{:''8} {:''1} {:>13.6e}'.format(' N4                  ',
-                    ':', self.dec_msg.n4) + '\n')
-
-            return strg
+    def _str_glo_ephemeris(self):
+        strg = ('### RTCM 3 - ' + self.dec_msg.gnss +
+                ' Ephemeris Message ' + '<' + str(self.msg_type) +  '>' +
+                '\n' +
+                ' Message size [bytes] :  ' + str(self.type_len + 6) +
+                '\n' +
+                ' Data  length [bytes] :  ' + str(self.type_len) +
+                '\n' +
+                '{:''8} {:''2} {}'.format(' GLO SLOT            ', ':', 
+                self.dec_msg.sat_id) + '\n' +
+                '{:''8} {:''2} {}'.format(' FREQ                ', ':',
+                self.dec_msg.freq) + '\n' +
+                '{:''8} {:''2} {}'.format(' DAY NUMBER          ', ':',
+                self.dec_msg.nt) + '\n' +
+                '{:''8} {:''1} {:>13.6e}'.format(' T_K [s]             ',
+                ':', self.dec_msg.tk) + '\n' +
+                '{:''8} {:''1} {:>13.6e}'.format(' T_B [s]             ',
+                ':', self.dec_msg.tb) + '\n' +  
+                '{:''8} {:''2} {}'.format(' HEALTH Bn           ', ':',
+                self.dec_msg.bn) + '\n' +
+                '{:''8} {:''2} {}'.format(' HEALTH Cn           ', ':',
+                self.dec_msg.cn) + '\n' +
+                '{:''8} {:''2} {}'.format(' HEALTH 2            ', ':',
+                self.dec_msg.msb_bn) + '\n' + 
+                '{:''8} {:''2} {}'.format(' Flag P              ', ':',
+                self.dec_msg.p) + '\n' +
+                '{:''8} {:''2} {}'.format(' Flag P1             ', ':',
+                self.dec_msg.p1) + '\n' +
+                '{:''8} {:''2} {}'.format(' Flag P2             ', ':',
+                self.dec_msg.p2) + '\n' +
+                '{:''8} {:''2} {}'.format(' Flag P3             ', ':',
+                self.dec_msg.p3) + '\n' +
+                '{:''8} {:''2} {}'.format(' Flag P4             ', ':',
+                self.dec_msg.p4) + '\n' +
+                '{:''8} {:''2} {}'.format(' FT                  ', ':',
+                self.dec_msg.ft) + '\n' +
+                '{:''8} {:''2} {}'.format(' MODIFICAT.          ', ':',
+                self.dec_msg.m) + '\n' +
+                '{:''8} {:''1} {:>13.6e}'.format(' GAMMA          [s/s]', 
+                ':', self.dec_msg.gamma) + '\n' +
+                '{:''8} {:''1} {:>13.6e}'.format(' TAU              [s]',
+                ':', self.dec_msg.tau) + '\n' +
+                '{:''8} {:''1} {:>13.6e}'.format(' DELTA TAU        [s]',
+                ':', self.dec_msg.dtau) + '\n' +
+                '{:''8} {:''2} {}'.format(' AGE              [d]',
+                ':', self.dec_msg.en) + '\n' +
+                '{:''8} {:''1} {:>+9.6f}'.format(' X               [km]',
+                ':', self.dec_msg.xn) +  '\n' +
+                '{:''8} {:''1} {:>+9.6f}'.format(' Y               [km]',
+                ':', self.dec_msg.yn) + '\n' +
+                '{:''8} {:''1} {:>+9.6f}'.format(' Z               [km]',
+                ':', self.dec_msg.zn) + '\n' +
+                '{:''8} {:''1} {:>+9.6f}'.format(' XDOT          [km/s]',
+                ':', self.dec_msg.dxn) + '\n' +
+                '{:''8} {:''1} {:>+9.6f}'.format(' YDOT          [km/s]',
+                ':', self.dec_msg.dyn) + '\n' +
+                '{:''8} {:''1} {:>+9.6f}'.format(' ZDOT          [km/s]',
+                ':', self.dec_msg.dzn) + '\n' +
+                '{:''8} {:''1} {:>13.6e}'.format(' XDOTDOT     [km/s^2]',
+                ':', self.dec_msg.ddxn) + '\n' +
+                '{:''8} {:''1} {:>13.6e}'.format(' YDOTDOT     [km/s^2]',
+                ':', self.dec_msg.ddyn) + '\n' +
+                '{:''8} {:''1} {:>13.6e}'.format(' ZDOTDOT     [km/s^2]',
+                ':', self.dec_msg.ddzn) + '\n' +            
+                '{:''8} {:''1} {:>13.6e}'.format(' avail. add. data 0/1',
+                         ':', self.dec_msg.ava) +
+                         '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' TauC                ', 
+                         ':', self.dec_msg.tau_c) +
+                         '\n' + 
+                '{:''8} {:''1} {:>13.6e}'.format(' N4                  ',
+                ':', self.dec_msg.n4) + '\n')
+
+        return strg
 
 # *************************************************************************** #
 #                                                                             #
 #                                   Orbit                                     #
 #                                                                             #
 # *************************************************************************** #
-        elif ((self.msg_type == 1057) | (self.msg_type == 1063) |
-              (self.msg_type == 1240) | (self.msg_type == 1246) |
-              (self.msg_type == 1258)) :
-            strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
-                    ' Orbit Message <' + str(self.msg_type) + '>' + '\n' +
-                    'Message size [bytes]   : ' + str(self.type_len + 6) + 
-                    '\n' +
-                    'Data  length [bytes]   : ' + str(self.type_len) +
-                    '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s] : ' +
-                    str(self.dec_msg.epoch) + '\n' +
-                    'Update Interval [s]    : ' + str(self.dec_msg.ui) +
-                    '\n' +
-                    'MMI                    : ' + str(self.dec_msg.mmi) +
-                    '\n' +
-                    'IOD_ssr                : ' + str(self.dec_msg.iod) +
-                    '\n' +
-                    'ssrP_ID                : ' + 
-                    str(self.dec_msg.provider_id)  + '\n' +
-                    'ssrS_ID                : ' + 
-                    str(self.dec_msg.solution_id) + '\n' +
-                    'Reference datum        : ' + 
-                    str(self.dec_msg.datum) + '\n' +
-                    'Number of satellites   : ' +  str(self.dec_msg.n_sat) + 
-                    '\n') 
-            if self.dec_msg.gnss_short == 'C':
-                strg = (strg + '{:^6s}'.format(' SVnr'    ) + 
-                        '{:^6s}'.format('toe'       ) +                      
-                        '{:^6s}'.format('IOD'     ) +
-                        '{:^9s}'.format('Rad [m]' ) +
-                        '{:^9s}'.format('Al T [m]') +
-                        '{:^9s}'.format('Cr T [m]') +
-                        '{:^27s}'.format('DotDelta [mm/s]') + '\n') 
-                for j in range(self.dec_msg.n_sat):
-                    strg = (strg + ' ' + self.dec_msg.gnss_short +
-                            '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
-                            ''  + '{:>3.0f}'.format(int(self.dec_msg.toe[j])) +                         
-                            ' ' +
-                            '{:>3.0f}'.format(int(self.dec_msg.gnss_iod[j])) +
-                            ' ' + '{:>+8.4f}'.format(self.dec_msg.dr[j]) +
-                            ' ' + '{:>+8.4f}'.format(self.dec_msg.dt[j]) +
-                            ' ' + '{:>+8.4f}'.format(self.dec_msg.dn[j]) +
-                            ' ' + '{:>+8.4f}'.format(self.dec_msg.dot_dr[j]) +
-                            ' ' + '{:>+8.4f}'.format(self.dec_msg.dot_dt[j]) +
-                            ' ' + '{:>+8.4f}'.format(self.dec_msg.dot_dn[j]) +
-                            '\n')
-            else:
-                strg = (strg + '{:^6s}'.format(' SVnr'    ) + 
-                        '{:^8s}'.format('IOD  '     ) +
-                        '{:^10s}'.format('Rad [m] ' ) +
-                        '{:^11s}'.format('Al T [m] ') +
-                        '{:^10s}'.format('Cr T [m] ') +
-                        '{:^27s}'.format(' DotDelta [mm/s]') + '\n') 
-                for j in range(self.dec_msg.n_sat):
-                    strg = (strg + ' ' + self.dec_msg.gnss_short +
-                            '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
-                            '  ' + 
-                            '{:>3.0f}'.format(int(self.dec_msg.gnss_iod[j])) +
-                            '   ' + '{:>+8.4f}'.format(self.dec_msg.dr[j]) +
-                            '  ' + '{:>+8.4f}'.format(self.dec_msg.dt[j]) +
-                            '   ' + '{:>+8.4f}'.format(self.dec_msg.dn[j]) +
-                            '    ' + '{:>+8.4f}'.format(self.dec_msg.dot_dr[j]) +
-                            '  ' + '{:>+8.4f}'.format(self.dec_msg.dot_dt[j]) +
-                            '  ' + '{:>+8.4f}'.format(self.dec_msg.dot_dn[j]) +
-                            '\n')
-            return strg     
+    def _str_orbit(self):
+        strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
+                ' Orbit Message <' + str(self.msg_type) + '>' + '\n' +
+                'Message size [bytes]   : ' + str(self.type_len + 6) + 
+                '\n' +
+                'Data  length [bytes]   : ' + str(self.type_len) +
+                '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s] : ' +
+                str(self.dec_msg.epoch) + '\n' +
+                'Update Interval [s]    : ' + str(self.dec_msg.ui) +
+                '\n' +
+                'MMI                    : ' + str(self.dec_msg.mmi) +
+                '\n' +
+                'IOD_ssr                : ' + str(self.dec_msg.iod) +
+                '\n' +
+                'ssrP_ID                : ' + 
+                str(self.dec_msg.provider_id)  + '\n' +
+                'ssrS_ID                : ' + 
+                str(self.dec_msg.solution_id) + '\n' +
+                'Reference datum        : ' + 
+                str(self.dec_msg.datum) + '\n' +
+                'Number of satellites   : ' +  str(self.dec_msg.n_sat) + 
+                '\n') 
+        if self.dec_msg.gnss_short == 'C':
+            strg = (strg + '{:^6s}'.format(' SVnr'    ) + 
+                    '{:^6s}'.format('toe'       ) +                      
+                    '{:^6s}'.format('IOD'     ) +
+                    '{:^9s}'.format('Rad [m]' ) +
+                    '{:^9s}'.format('Al T [m]') +
+                    '{:^9s}'.format('Cr T [m]') +
+                    '{:^27s}'.format('DotDelta [mm/s]') + '\n') 
+            for j in range(self.dec_msg.n_sat):
+                strg = (strg + ' ' + self.dec_msg.gnss_short +
+                        '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
+                        ''  + '{:>3.0f}'.format(int(self.dec_msg.toe[j])) +                         
+                        ' ' +
+                        '{:>3.0f}'.format(int(self.dec_msg.gnss_iod[j])) +
+                        ' ' + '{:>+8.4f}'.format(self.dec_msg.dr[j]) +
+                        ' ' + '{:>+8.4f}'.format(self.dec_msg.dt[j]) +
+                        ' ' + '{:>+8.4f}'.format(self.dec_msg.dn[j]) +
+                        ' ' + '{:>+8.4f}'.format(self.dec_msg.dot_dr[j]) +
+                        ' ' + '{:>+8.4f}'.format(self.dec_msg.dot_dt[j]) +
+                        ' ' + '{:>+8.4f}'.format(self.dec_msg.dot_dn[j]) +
+                        '\n')
+        else:
+            strg = (strg + '{:^6s}'.format(' SVnr'    ) + 
+                    '{:^8s}'.format('IOD  '     ) +
+                    '{:^10s}'.format('Rad [m] ' ) +
+                    '{:^11s}'.format('Al T [m] ') +
+                    '{:^10s}'.format('Cr T [m] ') +
+                    '{:^27s}'.format(' DotDelta [mm/s]') + '\n') 
+            for j in range(self.dec_msg.n_sat):
+                strg = (strg + ' ' + self.dec_msg.gnss_short +
+                        '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
+                        '  ' + 
+                        '{:>3.0f}'.format(int(self.dec_msg.gnss_iod[j])) +
+                        '   ' + '{:>+8.4f}'.format(self.dec_msg.dr[j]) +
+                        '  ' + '{:>+8.4f}'.format(self.dec_msg.dt[j]) +
+                        '   ' + '{:>+8.4f}'.format(self.dec_msg.dn[j]) +
+                        '    ' + '{:>+8.4f}'.format(self.dec_msg.dot_dr[j]) +
+                        '  ' + '{:>+8.4f}'.format(self.dec_msg.dot_dt[j]) +
+                        '  ' + '{:>+8.4f}'.format(self.dec_msg.dot_dn[j]) +
+                        '\n')
+        return strg     
            
 # *************************************************************************** #
 #                                                                             #
 #                                   Clock                                     #
 #                                                                             #
 # *************************************************************************** #
-        elif ((self.msg_type == 1058) | (self.msg_type == 1064) | 
-              (self.msg_type == 1241) | (self.msg_type == 1247) |
-              (self.msg_type == 1259)):
-            strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
-                    ' Clock Message <' + str(self.msg_type) + '>' + '\n' +
-                    'Message size [bytes]   : ' + str(self.type_len + 6) + 
-                    '\n' +
-                    'Data  length [bytes]   : ' + str(self.type_len) +
-                    '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s] : ' +
-                    str(self.dec_msg.epoch) + '\n' +
-                    'Update Interval [s]    : ' + str(self.dec_msg.ui) +
-                    '\n' +
-                    'MMI                    : ' + str(self.dec_msg.mmi) +
-                    '\n' +
-                    'IOD_ssr                : ' + str(self.dec_msg.iod) +
-                    '\n' +
-                    'ssrP_ID                : ' + 
-                    str(self.dec_msg.provider_id)  + '\n' +
-                    'ssrS_ID                : ' + 
-                    str(self.dec_msg.solution_id) + '\n' +
-                    'Number of satellites   : ' +  str(self.dec_msg.n_sat) + 
-                    '\n' + '{:^6s}'.format('SVnr'    ) + 
-                    '{:^9s}'.format('  C0 [m]   ' ) +
-                    '{:^9s}'.format(' C1 [mm/s] ') + 
-                    '{:^9s}'.format(' C2 [mm/s^2]') + '\n')
-            
-            for j in range(self.dec_msg.n_sat):
-                strg = (strg + ' ' + self.dec_msg.gnss_short + 
-                        '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
-                        '   ' +  '{:>+8.4f}'.format(self.dec_msg.dc0[j] / 1000) + 
-                        '    ' + '{:>+8.4f}'.format(self.dec_msg.dc1[j]) +
-                        '    ' + '{:>+8.4f}'.format(self.dec_msg.dc2[j]) +
-                        '\n')
-            return strg
+    def _str_clock(self):
+        strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
+                ' Clock Message <' + str(self.msg_type) + '>' + '\n' +
+                'Message size [bytes]   : ' + str(self.type_len + 6) + 
+                '\n' +
+                'Data  length [bytes]   : ' + str(self.type_len) +
+                '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s] : ' +
+                str(self.dec_msg.epoch) + '\n' +
+                'Update Interval [s]    : ' + str(self.dec_msg.ui) +
+                '\n' +
+                'MMI                    : ' + str(self.dec_msg.mmi) +
+                '\n' +
+                'IOD_ssr                : ' + str(self.dec_msg.iod) +
+                '\n' +
+                'ssrP_ID                : ' + 
+                str(self.dec_msg.provider_id)  + '\n' +
+                'ssrS_ID                : ' + 
+                str(self.dec_msg.solution_id) + '\n' +
+                'Number of satellites   : ' +  str(self.dec_msg.n_sat) + 
+                '\n' + '{:^6s}'.format('SVnr'    ) + 
+                '{:^9s}'.format('  C0 [m]   ' ) +
+                '{:^9s}'.format(' C1 [mm/s] ') + 
+                '{:^9s}'.format(' C2 [mm/s^2]') + '\n')
+        
+        for j in range(self.dec_msg.n_sat):
+            strg = (strg + ' ' + self.dec_msg.gnss_short + 
+                    '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
+                    '   ' +  '{:>+8.4f}'.format(self.dec_msg.dc0[j] / 1000) + 
+                    '    ' + '{:>+8.4f}'.format(self.dec_msg.dc1[j]) +
+                    '    ' + '{:>+8.4f}'.format(self.dec_msg.dc2[j]) +
+                    '\n')
+        return strg
 
 # *************************************************************************** #
 #                                                                             #
 #                             High Rate Clock                                 #
 #                                                                             #
 # *************************************************************************** #        
-        elif ((self.msg_type == 1245) | (self.msg_type == 1263) |
-              (self.msg_type == 1251)):
-            strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
-                    ' High Rate Clock Message <' +
-                    str(self.msg_type) + '>' + '\n' +
-                    'Message size [bytes]   : ' + str(self.type_len + 6) + 
-                    '\n' +
-                    'Data  length [bytes]   : ' + str(self.type_len) +
-                    '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s] : ' +
-                    str(self.dec_msg.epoch) + '\n' +
-                    'Update Interval [s]    : ' + str(self.dec_msg.ui) +
-                    '\n' +
-                    'MMI                    : ' + str(self.dec_msg.mmi) +
-                    '\n' +
-                    'IOD_ssr                : ' + str(self.dec_msg.iod) +
-                    '\n' +
-                    'ssrP_ID                : ' + 
-                    str(self.dec_msg.provider_id)  + '\n' +
-                    'ssrS_ID                : ' + 
-                    str(self.dec_msg.solution_id) + '\n' +
-                    'Number of satellites   : ' +  str(self.dec_msg.n_sat) + 
-                    '\n' + '{:^6s}'.format('SVnr'    ) + 
-                    '{:^9s}'.format('  High Rate Clock [m]   ' ) + '\n')
-            
-            for j in range(self.dec_msg.n_sat):
-                strg = (strg + ' ' + self.dec_msg.gnss_short + 
-                        '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
-                        '   ' +  '{:>+7.4f}'.format(self.dec_msg.hr_clock[j]) + 
-                        '\n')
-            return strg
+    def _str_hr_clock(self):
+        strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
+                ' High Rate Clock Message <' +
+                str(self.msg_type) + '>' + '\n' +
+                'Message size [bytes]   : ' + str(self.type_len + 6) + 
+                '\n' +
+                'Data  length [bytes]   : ' + str(self.type_len) +
+                '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s] : ' +
+                str(self.dec_msg.epoch) + '\n' +
+                'Update Interval [s]    : ' + str(self.dec_msg.ui) +
+                '\n' +
+                'MMI                    : ' + str(self.dec_msg.mmi) +
+                '\n' +
+                'IOD_ssr                : ' + str(self.dec_msg.iod) +
+                '\n' +
+                'ssrP_ID                : ' + 
+                str(self.dec_msg.provider_id)  + '\n' +
+                'ssrS_ID                : ' + 
+                str(self.dec_msg.solution_id) + '\n' +
+                'Number of satellites   : ' +  str(self.dec_msg.n_sat) + 
+                '\n' + '{:^6s}'.format('SVnr'    ) + 
+                '{:^9s}'.format('  High Rate Clock [m]   ' ) + '\n')
+        
+        for j in range(self.dec_msg.n_sat):
+            strg = (strg + ' ' + self.dec_msg.gnss_short + 
+                    '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
+                    '   ' +  '{:>+7.4f}'.format(self.dec_msg.hr_clock[j]) + 
+                    '\n')
+        return strg
 
 # *************************************************************************** #
 #                                                                             #
 #                              Code bias                                      #
 #                                                                             #
 # *************************************************************************** #
-        elif ((self.msg_type == 1059) | (self.msg_type == 1065) |
-              (self.msg_type == 1242) | (self.msg_type == 1248) |
-              (self.msg_type == 1260)):
-            strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
-                    ' Code Bias Message <' + str(self.msg_type) + '>' + '\n' +
-                    'Message size [bytes]   : ' + str(self.type_len + 6) + 
-                    '\n' +
-                    'Data  length [bytes]   : ' + str(self.type_len) +
-                    '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s] : ' +
-                    str(self.dec_msg.epoch) + '\n' +
-                    'Update Interval [s]    : ' + str(self.dec_msg.ui) +
-                    '\n' +
-                    'MMI                    : ' + str(self.dec_msg.mmi) +
-                    '\n' +
-                    'IOD_ssr                : ' + str(self.dec_msg.iod) +
-                    '\n' +
-                    'ssrP_ID                : ' + 
-                    str(self.dec_msg.provider_id)  + '\n' +
-                    'ssrS_ID                : ' + 
-                    str(self.dec_msg.solution_id) + '\n' +
-                    'Number of satellites   : ' +  str(self.dec_msg.n_sat) + 
-                    '\n' + '{:^6s}'.format('SVnr'    ) + 
-                    '{:^9s}'.format('num biases' ) + 
-                    '{:^8s}'.format('type') + 
-                    '{:^6s}'.format('signal ') + 
-                    '{:^9s}'.format('code bias [m] ') + 
-                    '{:^9s}'.format('type ') + '{:^6s}'.format('signal ') +
-                    '{:^9s}'.format('code bias [m] ') +
-                    '{:^9s}'.format('[...] ') + '\n') 
-            
-            for j in range(self.dec_msg.n_sat):
-                if j == 0:
-                    strg = (strg + ' ' + self.dec_msg.gnss_short +
-                            '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
-                            '{:>3s}'.format('  ') + 
-                            '{:>3.0f}'.format(int(self.dec_msg.number[j])) + 
-                            '{:>5s}'.format('       '))                    
-                else:    
-                    strg = (strg + '\n ' + self.dec_msg.gnss_short +
-                            '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
-                            '{:>3s}'.format('  ') + 
-                            '{:>3.0f}'.format(int(self.dec_msg.number[j])) + 
-                            '{:>5s}'.format('       '))                   
-                        
-                for k in range(int(self.dec_msg.number[j])):
-                    strg = (strg + 
-                           '{:>2.0f}'.format(self.dec_msg.track[j][k]) +
-                           '{:>3s}'.format('    ') + 
-                           '{:>4s}'.format(self.dec_msg.name[j][k]) +
-                           '{:>3s}'.format('    ') +
-                           '{:>+8.4f}'.format(self.dec_msg.bias[j][k]) +
-                           '{:>8}'.format('        ') )
-            return strg + '\n'
+    def _str_code_bias(self):
+        strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
+                ' Code Bias Message <' + str(self.msg_type) + '>' + '\n' +
+                'Message size [bytes]   : ' + str(self.type_len + 6) + 
+                '\n' +
+                'Data  length [bytes]   : ' + str(self.type_len) +
+                '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s] : ' +
+                str(self.dec_msg.epoch) + '\n' +
+                'Update Interval [s]    : ' + str(self.dec_msg.ui) +
+                '\n' +
+                'MMI                    : ' + str(self.dec_msg.mmi) +
+                '\n' +
+                'IOD_ssr                : ' + str(self.dec_msg.iod) +
+                '\n' +
+                'ssrP_ID                : ' + 
+                str(self.dec_msg.provider_id)  + '\n' +
+                'ssrS_ID                : ' + 
+                str(self.dec_msg.solution_id) + '\n' +
+                'Number of satellites   : ' +  str(self.dec_msg.n_sat) + 
+                '\n' + '{:^6s}'.format('SVnr'    ) + 
+                '{:^9s}'.format('num biases' ) + 
+                '{:^8s}'.format('type') + 
+                '{:^6s}'.format('signal ') + 
+                '{:^9s}'.format('code bias [m] ') + 
+                '{:^9s}'.format('type ') + '{:^6s}'.format('signal ') +
+                '{:^9s}'.format('code bias [m] ') +
+                '{:^9s}'.format('[...] ') + '\n') 
+        
+        for j in range(self.dec_msg.n_sat):
+            if j == 0:
+                strg = (strg + ' ' + self.dec_msg.gnss_short +
+                        '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
+                        '{:>3s}'.format('  ') + 
+                        '{:>3.0f}'.format(int(self.dec_msg.number[j])) + 
+                        '{:>5s}'.format('       '))                    
+            else:    
+                strg = (strg + '\n ' + self.dec_msg.gnss_short +
+                        '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
+                        '{:>3s}'.format('  ') + 
+                        '{:>3.0f}'.format(int(self.dec_msg.number[j])) + 
+                        '{:>5s}'.format('       '))                   
+                    
+            for k in range(int(self.dec_msg.number[j])):
+                strg = (strg + 
+                       '{:>2.0f}'.format(self.dec_msg.track[j][k]) +
+                       '{:>3s}'.format('    ') + 
+                       '{:>4s}'.format(self.dec_msg.name[j][k]) +
+                       '{:>3s}'.format('    ') +
+                       '{:>+8.4f}'.format(self.dec_msg.bias[j][k]) +
+                       '{:>8}'.format('        ') )
+        return strg + '\n'
         
 # *************************************************************************** #
 #                                                                             #
 #                          Combined orbit and clock                           #
 #                                                                             #
 # *************************************************************************** #
-        elif ((self.msg_type == 1060) | (self.msg_type == 1066) |
-              (self.msg_type == 1243) | (self.msg_type == 1261)):
-            strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
-                    ' Orbit and Clock Message <' + str(self.msg_type) + '>' + 
-                    '\n' +
-                    'Message size [bytes]   : ' + str(self.type_len + 6) + 
-                    '\n' +
-                    'Data  length [bytes]   : ' + str(self.type_len) +
-                    '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s] : ' +
-                    str(self.dec_msg.epoch) + '\n' +
-                    'Update Interval [s]    : ' + str(self.dec_msg.ui) +
-                    '\n' +
-                    'MMI                    : ' + str(self.dec_msg.mmi) +
-                    '\n' +
-                    'IOD_ssr                : ' + str(self.dec_msg.iod) +
-                    '\n' +
-                    'ssrP_ID                : ' + 
-                    str(self.dec_msg.provider_id)  + '\n' +
-                    'ssrS_ID                : ' + 
-                    str(self.dec_msg.solution_id) + '\n' +
-                    'Reference datum        : ' + 
-                    str(self.dec_msg.datum) + '\n' +
-                    'Number of satellites   : ' +  str(self.dec_msg.n_sat) + 
-                    '\n') 
-            if self.dec_msg.gnss_short == 'C':
-                strg = (strg + '{:^6s}'.format(' SVnr'    ) + 
-                        '{:^6s}'.format('toe_mod'       ) +                      
-                        '    ' +
-                        '{:^6s}'.format('IOD'     ) +
-                        '    ' +
-                        '{:^9s}'.format('Rad [m]' ) +
-                        ' ' +
-                        '{:^9s}'.format('Al T [m]') +
-                        '  ' +
-                        '{:^9s}'.format('Cr T [m]') +
-                        '    ' +
-                        '{:^27s}'.format('DotDelta [mm/s]') + 
+    def _str_orbit_clock(self):
+        strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
+                ' Orbit and Clock Message <' + str(self.msg_type) + '>' + 
+                '\n' +
+                'Message size [bytes]   : ' + str(self.type_len + 6) + 
+                '\n' +
+                'Data  length [bytes]   : ' + str(self.type_len) +
+                '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s] : ' +
+                str(self.dec_msg.epoch) + '\n' +
+                'Update Interval [s]    : ' + str(self.dec_msg.ui) +
+                '\n' +
+                'MMI                    : ' + str(self.dec_msg.mmi) +
+                '\n' +
+                'IOD_ssr                : ' + str(self.dec_msg.iod) +
+                '\n' +
+                'ssrP_ID                : ' + 
+                str(self.dec_msg.provider_id)  + '\n' +
+                'ssrS_ID                : ' + 
+                str(self.dec_msg.solution_id) + '\n' +
+                'Reference datum        : ' + 
+                str(self.dec_msg.datum) + '\n' +
+                'Number of satellites   : ' +  str(self.dec_msg.n_sat) + 
+                '\n') 
+        if self.dec_msg.gnss_short == 'C':
+            strg = (strg + '{:^6s}'.format(' SVnr'    ) + 
+                    '{:^6s}'.format('toe_mod'       ) +                      
+                    '    ' +
+                    '{:^6s}'.format('IOD'     ) +
+                    '    ' +
+                    '{:^9s}'.format('Rad [m]' ) +
+                    ' ' +
+                    '{:^9s}'.format('Al T [m]') +
+                    '  ' +
+                    '{:^9s}'.format('Cr T [m]') +
+                    '    ' +
+                    '{:^27s}'.format('DotDelta [mm/s]') + 
+                    '   ' +
+                    '{:^9s}'.format(' A0 [m]  ' ) +
+                    '{:^9s}'.format(' A1 [mm/s] ') + 
+                    '{:^9s}'.format(' A2 [mm/s^2]') + '\n')
+            for j in range(self.dec_msg.n_sat):
+                strg = (strg + ' ' + self.dec_msg.gnss_short +
+                        '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
+                        '  '  + '{:>3.0f}'.format(int(self.dec_msg.toe[j])) +                         
                         '   ' +
-                        '{:^9s}'.format(' A0 [m]  ' ) +
-                        '{:^9s}'.format(' A1 [mm/s] ') + 
-                        '{:^9s}'.format(' A2 [mm/s^2]') + '\n')
-                for j in range(self.dec_msg.n_sat):
-                    strg = (strg + ' ' + self.dec_msg.gnss_short +
-                            '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
-                            '  '  + '{:>3.0f}'.format(int(self.dec_msg.toe[j])) +                         
-                            '   ' +
-                            '{:>10.0f}'.format(int(self.dec_msg.gnss_iod[j])) +
-                            '   ' +'{:>+8.4f}'.format(self.dec_msg.dr[j]) +
-                            '  ' + '{:>+8.4f}'.format(self.dec_msg.dt[j]) +
-                            '   ' + '{:>+8.4f}'.format(self.dec_msg.dn[j]) +
-                            '    ' + '{:>+8.4f}'.format(self.dec_msg.dot_dr[j]) +
-                            '  ' + '{:>+8.4f}'.format(self.dec_msg.dot_dt[j]) +
-                            '  ' + '{:>+8.4f}'.format(self.dec_msg.dot_dn[j]) +
-                            '   ' +  '{:>+8.4f}'.format(self.dec_msg.dc0[j]*1e-3) + 
-                            '    ' + '{:>+7.4f}'.format(self.dec_msg.dc1[j]) +
-                            '    ' + '{:>+7.4f}'.format(self.dec_msg.dc2[j]) +
-                            '\n')
-            else:
-                strg = (strg + '{:^6s}'.format(' SVnr'    ) + 
-                        '{:^6s}'.format('IOD'     ) +
-                        '{:^6s}'.format('P'     ) +
-                        '{:^10s}'.format('Rad [m] ' ) +
-                        ' ' +
-                        '{:^10s}'.format('Al T [m] ') +
-                        ' ' +
-                        '{:^10s}'.format('Cr T [m] ') +
+                        '{:>10.0f}'.format(int(self.dec_msg.gnss_iod[j])) +
+                        '   ' +'{:>+8.4f}'.format(self.dec_msg.dr[j]) +
+                        '  ' + '{:>+8.4f}'.format(self.dec_msg.dt[j]) +
+                        '   ' + '{:>+8.4f}'.format(self.dec_msg.dn[j]) +
+                        '    ' + '{:>+8.4f}'.format(self.dec_msg.dot_dr[j]) +
+                        '  ' + '{:>+8.4f}'.format(self.dec_msg.dot_dt[j]) +
+                        '  ' + '{:>+8.4f}'.format(self.dec_msg.dot_dn[j]) +
+                        '   ' +  '{:>+8.4f}'.format(self.dec_msg.dc0[j]*1e-3) + 
+                        '    ' + '{:>+7.4f}'.format(self.dec_msg.dc1[j]) +
+                        '    ' + '{:>+7.4f}'.format(self.dec_msg.dc2[j]) +
+                        '\n')
+        else:
+            strg = (strg + '{:^6s}'.format(' SVnr'    ) + 
+                    '{:^6s}'.format('IOD'     ) +
+                    '{:^6s}'.format('P'     ) +
+                    '{:^10s}'.format('Rad [m] ' ) +
+                    ' ' +
+                    '{:^10s}'.format('Al T [m] ') +
+                    ' ' +
+                    '{:^10s}'.format('Cr T [m] ') +
+                    '  ' +
+                    '{:^27s}'.format('DotDelta [mm/s]') +
+                    '    ' +
+                    '{:^9s}'.format(' A0 [m]  ' ) +
+                    '{:^9s}'.format(' A1 [mm/s] ') + 
+                    '{:^9s}'.format(' A2 [mm/s^2]') + '\n')
+            for j in range(self.dec_msg.n_sat):
+                strg = (strg + ' ' + self.dec_msg.gnss_short +
+                        '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
+                        '  ' + 
+                        '{:>3.0f}'.format(int(self.dec_msg.gnss_iod[j])) +
                         '  ' +
-                        '{:^27s}'.format('DotDelta [mm/s]') +
-                        '    ' +
-                        '{:^9s}'.format(' A0 [m]  ' ) +
-                        '{:^9s}'.format(' A1 [mm/s] ') + 
-                        '{:^9s}'.format(' A2 [mm/s^2]') + '\n')
-                for j in range(self.dec_msg.n_sat):
-                    strg = (strg + ' ' + self.dec_msg.gnss_short +
-                            '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
-                            '  ' + 
-                            '{:>3.0f}'.format(int(self.dec_msg.gnss_iod[j])) +
-                            '  ' +
-                            '{:>3.0f}'.format(int(self.dec_msg.p[j])) +
-                            '   ' +'{:>+8.4f}'.format(self.dec_msg.dr[j]) +
-                            '  ' + '{:>+8.4f}'.format(self.dec_msg.dt[j]) +
-                            '   ' + '{:>+8.4f}'.format(self.dec_msg.dn[j]) +
-                            '    ' + '{:>+8.4f}'.format(self.dec_msg.dot_dr[j]) +
-                            '  ' + '{:>+8.4f}'.format(self.dec_msg.dot_dt[j]) +
-                            '  ' + '{:>+8.4f}'.format(self.dec_msg.dot_dn[j]) +
-                            '   ' +  '{:>+8.4f}'.format(self.dec_msg.dc0[j]*1e-3) + 
-                            '    ' + '{:>+7.4f}'.format(self.dec_msg.dc1[j]) +
-                            '    ' + '{:>+7.4f}'.format(self.dec_msg.dc2[j]) +
-                            '\n')
-            return strg
+                        '{:>3.0f}'.format(int(self.dec_msg.p[j])) +
+                        '   ' +'{:>+8.4f}'.format(self.dec_msg.dr[j]) +
+                        '  ' + '{:>+8.4f}'.format(self.dec_msg.dt[j]) +
+                        '   ' + '{:>+8.4f}'.format(self.dec_msg.dn[j]) +
+                        '    ' + '{:>+8.4f}'.format(self.dec_msg.dot_dr[j]) +
+                        '  ' + '{:>+8.4f}'.format(self.dec_msg.dot_dt[j]) +
+                        '  ' + '{:>+8.4f}'.format(self.dec_msg.dot_dn[j]) +
+                        '   ' +  '{:>+8.4f}'.format(self.dec_msg.dc0[j]*1e-3) + 
+                        '    ' + '{:>+7.4f}'.format(self.dec_msg.dc1[j]) +
+                        '    ' + '{:>+7.4f}'.format(self.dec_msg.dc2[j]) +
+                        '\n')
+        return strg
 
 # *************************************************************************** #
 #                                                                             #
 #                                    URA                                      #
 #                                                                             #
 # *************************************************************************** #
-        elif ((self.msg_type == 1061) | (self.msg_type == 1067) | 
-              (self.msg_type == 1244) | (self.msg_type == 1262)):
-            strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
-                    ' URA Message <' + str(self.msg_type) + '>' + '\n' +
-                    'Message size [bytes]   : ' + str(self.type_len + 6) + 
-                    '\n' +
-                    'Data  length [bytes]   : ' + str(self.type_len) +
-                    '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s] : ' +
-                    str(self.dec_msg.epoch) + '\n' +
-                    'Update Interval [s]    : ' + str(self.dec_msg.ui) +
-                    '\n' +
-                    'MMI                    : ' + str(self.dec_msg.mmi) +
-                    '\n' +
-                    'IOD_ssr                : ' + str(self.dec_msg.iod) +
-                    '\n' +
-                    'ssrP_ID                : ' + 
-                    str(self.dec_msg.provider_id)  + '\n' +
-                    'ssrS_ID                : ' + 
-                    str(self.dec_msg.solution_id) + '\n' +
-                    'Number of satellites   : ' +  str(self.dec_msg.n_sat) + 
-                    '\n' + '{:^6s}'.format(' SVnr  '    ) + ' ' +
-                    '{:^8s}'.format(' URA [m] ') + '\n')
-            
-            for j in range(self.dec_msg.n_sat):
-                strg = (strg + ' ' + self.dec_msg.gnss_short + 
-                        '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
-                        '   ' +  '{:>+7.4f}'.format(self.dec_msg.ura[j]) + 
-                        '  [class =' + 
-                        '{:2.0f}'.format(int(self.dec_msg.ura_class[j])) +
-                        ', value =' + 
-                        '{:2.0f}'.format(int(self.dec_msg.ura_value[j])) +
-                        ']' + '\n')
-            return strg
+    def _str_ura(self):
+        strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
+                ' URA Message <' + str(self.msg_type) + '>' + '\n' +
+                'Message size [bytes]   : ' + str(self.type_len + 6) + 
+                '\n' +
+                'Data  length [bytes]   : ' + str(self.type_len) +
+                '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s] : ' +
+                str(self.dec_msg.epoch) + '\n' +
+                'Update Interval [s]    : ' + str(self.dec_msg.ui) +
+                '\n' +
+                'MMI                    : ' + str(self.dec_msg.mmi) +
+                '\n' +
+                'IOD_ssr                : ' + str(self.dec_msg.iod) +
+                '\n' +
+                'ssrP_ID                : ' + 
+                str(self.dec_msg.provider_id)  + '\n' +
+                'ssrS_ID                : ' + 
+                str(self.dec_msg.solution_id) + '\n' +
+                'Number of satellites   : ' +  str(self.dec_msg.n_sat) + 
+                '\n' + '{:^6s}'.format(' SVnr  '    ) + ' ' +
+                '{:^8s}'.format(' URA [m] ') + '\n')
+        
+        for j in range(self.dec_msg.n_sat):
+            strg = (strg + ' ' + self.dec_msg.gnss_short + 
+                    '{:3s}'.format(self.dec_msg.gnss_id[j]) + 
+                    '   ' +  '{:>+7.4f}'.format(self.dec_msg.ura[j]) + 
+                    '  [class =' + 
+                    '{:2.0f}'.format(int(self.dec_msg.ura_class[j])) +
+                    ', value =' + 
+                    '{:2.0f}'.format(int(self.dec_msg.ura_value[j])) +
+                    ']' + '\n')
+        return strg
         
 # *************************************************************************** #
 #                                                                             #
 #                                Phase bias                                   #
 #                                                                             #
 # *************************************************************************** #
-        elif ((self.msg_type == 1265) | (self.msg_type == 1266) | 
-              (self.msg_type == 1267) | (self.msg_type == 1268) |
-              (self.msg_type == 1270)):
-            strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
-                    ' Phase bias Message <' + str(self.msg_type) + '>' + '\n' +
-                    'Message size [bytes]      : ' + str(self.type_len + 6) + 
-                    '\n' +
-                    'Data  length [bytes]      : ' + str(self.type_len) +
-                    '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s]    : ' +
-                    str(self.dec_msg.epoch) + '\n' +
-                    'Update Interval [s]       : ' + str(self.dec_msg.ui) +
-                    '\n' +
-                    'MMI                       : ' + str(self.dec_msg.mmi) +
-                    '\n' +
-                    'IOD_ssr                   : ' + str(self.dec_msg.iod) +
-                    '\n' +
-                    'ssrP_ID                   : ' + 
-                    str(self.dec_msg.provider_id)  + '\n' +
-                    'ssrS_ID                   : ' + 
-                    str(self.dec_msg.solution_id) + '\n' +
-                    'DispersiveSignalIndicator : ' +
-                    str(self.dec_msg.disp_bias) + '\n' + 
-                    'MWConsistencyIndicator    : '+
-                     str(self.dec_msg.mw) + '\n' + 
-                    'Number of satellites      : ' +  str(self.dec_msg.n_sat) + 
-                    '\n' + '{:^6s}'.format(' SVnr  '    ) + ' ' +
-                    '{:^8s}'.format('Yaw[deg]'     )  +
-                    '{:^11s}'.format(' YawRate[deg/s]' )  +
-                    '{:^5s}'.format(' nPh ') + 
-                    '{:^4s}'.format(' Typ') + 
-                    '{:^7s}'.format('    Sig') + 
-                    '{:^9s}'.format('    i    ') + 
-                    '{:^4s}'.format('w'  ) + 
-                    '{:^8s}'.format('dis') + 
-                    '{:^9s}'.format('  Bias[m]     ') +
-                    '{:^4s}'.format(' Typ') + 
-                    '{:^7s}'.format('    Sig') + 
-                    '{:^9s}'.format('    i    ') + 
-                    '{:^4s}'.format('w'  ) + 
-                    '{:^8s}'.format('dis') + 
-                    '{:^8s}'.format('  Bias[m]     ') + 
-                    '{:^8s}'.format('[...]')  + '\n')
-            
-            for j in range(self.dec_msg.n_sat):
-                if j == 0:
-                    strg = (strg + ' ' + self.dec_msg.gnss_short + 
-                            '{:>2s}'.format(self.dec_msg.gnss_id[j]) +
-                            '{:>3s}'.format('   ') +
-                            '{:>8.4f}'.format(self.dec_msg.yaw_angle[j]) +
-                            '{:>3s}'.format('   ') +
-                            '{:>8.4f}'.format(self.dec_msg.yaw_rate[j]) +
-                            '{:>5s}'.format('      ') +
-                            '{:>2.0f}'.format(int(self.dec_msg.number[j])) + '')
-                else:
-                    strg = (strg + '\n ' + self.dec_msg.gnss_short + 
-                            '{:>2s}'.format(self.dec_msg.gnss_id[j]) +
-                            '{:>3s}'.format('   ') +
-                            '{:>8.4f}'.format(self.dec_msg.yaw_angle[j]) +
-                            '{:>3s}'.format('   ') +
-                            '{:>8.4f}'.format(self.dec_msg.yaw_rate[j]) +
-                            '{:>5s}'.format('      ') +
-                            '{:>2.0f}'.format(int(self.dec_msg.number[j])) + '')
-
-                for k in range(int(self.dec_msg.number[j])):
-                    strg = (strg + '{:>3s}'.format('   ') + 
-                            '{:>2.0f}'.format(int(self.dec_msg.track[j][k])) + 
-                            '{:>3s}'.format('     ') +
-                            '{:>3s}'.format(self.dec_msg.name[j][k]) +
-                            '{:>3s}'.format('   ') +
-                            '{:>2.0f}'.format(int(self.dec_msg.sig_i[j][k])) +
-                            '{:>3s}'.format('    ') +
-                            '{:>2.0f}'.format(self.dec_msg.sig_wl[j][k]) + 
-                            '{:>3s}'.format('    ') +
-                            '{:>2.0f}'.format(self.dec_msg.sig_dis[j][k]) +
-                            '{:>3s}'.format('    ') +
-                            '{:>+8.4f}'.format(self.dec_msg.bias[j][k]) + 
-                            '{:>3s}'.format('    '))    
-                
-            return strg + '\n'
+    def _str_phase_bias(self):
+        strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
+                ' Phase bias Message <' + str(self.msg_type) + '>' + '\n' +
+                'Message size [bytes]      : ' + str(self.type_len + 6) + 
+                '\n' +
+                'Data  length [bytes]      : ' + str(self.type_len) +
+                '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s]    : ' +
+                str(self.dec_msg.epoch) + '\n' +
+                'Update Interval [s]       : ' + str(self.dec_msg.ui) +
+                '\n' +
+                'MMI                       : ' + str(self.dec_msg.mmi) +
+                '\n' +
+                'IOD_ssr                   : ' + str(self.dec_msg.iod) +
+                '\n' +
+                'ssrP_ID                   : ' + 
+                str(self.dec_msg.provider_id)  + '\n' +
+                'ssrS_ID                   : ' + 
+                str(self.dec_msg.solution_id) + '\n' +
+                'DispersiveSignalIndicator : ' +
+                str(self.dec_msg.disp_bias) + '\n' + 
+                'MWConsistencyIndicator    : '+
+                 str(self.dec_msg.mw) + '\n' + 
+                'Number of satellites      : ' +  str(self.dec_msg.n_sat) + 
+                '\n' + '{:^6s}'.format(' SVnr  '    ) + ' ' +
+                '{:^8s}'.format('Yaw[deg]'     )  +
+                '{:^11s}'.format(' YawRate[deg/s]' )  +
+                '{:^5s}'.format(' nPh ') + 
+                '{:^4s}'.format(' Typ') + 
+                '{:^7s}'.format('    Sig') + 
+                '{:^9s}'.format('    i    ') + 
+                '{:^4s}'.format('w'  ) + 
+                '{:^8s}'.format('dis') + 
+                '{:^9s}'.format('  Bias[m]     ') +
+                '{:^4s}'.format(' Typ') + 
+                '{:^7s}'.format('    Sig') + 
+                '{:^9s}'.format('    i    ') + 
+                '{:^4s}'.format('w'  ) + 
+                '{:^8s}'.format('dis') + 
+                '{:^8s}'.format('  Bias[m]     ') + 
+                '{:^8s}'.format('[...]')  + '\n')
+        
+        for j in range(self.dec_msg.n_sat):
+            if j == 0:
+                strg = (strg + ' ' + self.dec_msg.gnss_short + 
+                        '{:>2s}'.format(self.dec_msg.gnss_id[j]) +
+                        '{:>3s}'.format('   ') +
+                        '{:>8.4f}'.format(self.dec_msg.yaw_angle[j]) +
+                        '{:>3s}'.format('   ') +
+                        '{:>8.4f}'.format(self.dec_msg.yaw_rate[j]) +
+                        '{:>5s}'.format('      ') +
+                        '{:>2.0f}'.format(int(self.dec_msg.number[j])) + '')
+            else:
+                strg = (strg + '\n ' + self.dec_msg.gnss_short + 
+                        '{:>2s}'.format(self.dec_msg.gnss_id[j]) +
+                        '{:>3s}'.format('   ') +
+                        '{:>8.4f}'.format(self.dec_msg.yaw_angle[j]) +
+                        '{:>3s}'.format('   ') +
+                        '{:>8.4f}'.format(self.dec_msg.yaw_rate[j]) +
+                        '{:>5s}'.format('      ') +
+                        '{:>2.0f}'.format(int(self.dec_msg.number[j])) + '')
+
+            for k in range(int(self.dec_msg.number[j])):
+                strg = (strg + '{:>3s}'.format('   ') + 
+                        '{:>2.0f}'.format(int(self.dec_msg.track[j][k])) + 
+                        '{:>3s}'.format('     ') +
+                        '{:>3s}'.format(self.dec_msg.name[j][k]) +
+                        '{:>3s}'.format('   ') +
+                        '{:>2.0f}'.format(int(self.dec_msg.sig_i[j][k])) +
+                        '{:>3s}'.format('    ') +
+                        '{:>2.0f}'.format(self.dec_msg.sig_wl[j][k]) + 
+                        '{:>3s}'.format('    ') +
+                        '{:>2.0f}'.format(self.dec_msg.sig_dis[j][k]) +
+                        '{:>3s}'.format('    ') +
+                        '{:>+8.4f}'.format(self.dec_msg.bias[j][k]) + 
+                        '{:>3s}'.format('    '))    
+            
+        return strg + '\n'
         
 # *************************************************************************** #
 #                                                                             #
 #                       Ionosphere Spherical Harmonics                        #
 #                                                                             #
 # *************************************************************************** #
-        elif self.msg_type == 1264:
-            strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
-                    ' <' + str(self.msg_type) + '>' + '\n' +
-                    'Message size [bytes]      : ' + str(self.type_len + 6) + 
-                    '\n' +
-                    'Data  length [bytes]      : ' + str(self.type_len) +
-                    '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s]    : ' +
-                    str(self.dec_msg.epoch) + '\n' +
-                    'Update Interval [s]       : ' + str(self.dec_msg.ui) +
-                    '\n' +
-                    'MMI                       : ' + str(self.dec_msg.mmi) +
-                    '\n' +
-                    'IOD_ssr                   : ' + str(self.dec_msg.iod) +
-                    '\n' +
-                    'ssrP_ID                   : ' + 
-                    str(self.dec_msg.provider_id)  + '\n' +
-                    'ssrS_ID                   : ' + 
-                    str(self.dec_msg.solution_id) + '\n' +
-                    'quality indicator [TECU]       : ' + 
-                    str(self.dec_msg.quality) +
-                    '\n' +
-                    'Number of layers               : ' + 
-                    str(self.dec_msg.n_layers) +
-                    '\n') 
+    def _str_iono(self):
+        strg = ('### RTCM 3 - SSR ' + self.dec_msg.gnss +
+                ' <' + str(self.msg_type) + '>' + '\n' +
+                'Message size [bytes]      : ' + str(self.type_len + 6) + 
+                '\n' +
+                'Data  length [bytes]      : ' + str(self.type_len) +
+                '\n' + self.dec_msg.gnss[0:3] + ' SSR Epoch time [s]    : ' +
+                str(self.dec_msg.epoch) + '\n' +
+                'Update Interval [s]       : ' + str(self.dec_msg.ui) +
+                '\n' +
+                'MMI                       : ' + str(self.dec_msg.mmi) +
+                '\n' +
+                'IOD_ssr                   : ' + str(self.dec_msg.iod) +
+                '\n' +
+                'ssrP_ID                   : ' + 
+                str(self.dec_msg.provider_id)  + '\n' +
+                'ssrS_ID                   : ' + 
+                str(self.dec_msg.solution_id) + '\n' +
+                'quality indicator [TECU]       : ' + 
+                str(self.dec_msg.quality) +
+                '\n' +
+                'Number of layers               : ' + 
+                str(self.dec_msg.n_layers) +
+                '\n') 
+
+        for l in range(self.dec_msg.n_layers):
+                strg = (strg + 
+                        'h [km]                         : ' + 
+                        str(self.dec_msg.height[l]) + '\n' + 
+                        'Spherical Harmonic degree      : ' +
+                        str(int(self.dec_msg.degree[l])) + '\n' + 
+                        'Spherical Harmonic order       : ' +
+                        str(int(self.dec_msg.order[l])) + '\n' +
+                        'Number of Cosine coefficients  : ' +
+                        str(int(self.dec_msg.n_c[l])) + '\n' + 
+                        'Number of Sine   coefficients  : ' + 
+                        str(int(self.dec_msg.n_s[l])) + '\n') 
     
-            for l in range(self.dec_msg.n_layers):
-                    strg = (strg + 
-                            'h [km]                         : ' + 
-                            str(self.dec_msg.height[l]) + '\n' + 
-                            'Spherical Harmonic degree      : ' +
-                            str(int(self.dec_msg.degree[l])) + '\n' + 
-                            'Spherical Harmonic order       : ' +
-                            str(int(self.dec_msg.order[l])) + '\n' +
-                            'Number of Cosine coefficients  : ' +
-                            str(int(self.dec_msg.n_c[l])) + '\n' + 
-                            'Number of Sine   coefficients  : ' + 
-                            str(int(self.dec_msg.n_s[l])) + '\n') 
-        
-            index = 0        
-            C_print = []
-            S_print = []
-            for k in range(int(self.dec_msg.n_c[l])):
-                if np.abs(self.dec_msg.c[0][k]) == 163.84:
-                    C_print = np.append(C_print,
-                                        np.str('{:+7.3f}'.format(self.dec_msg.c[0][k])
-                                        ) + '!')
-                else:
-                    C_print = np.append(C_print,
-                                        np.str('{:+7.3f}'.format(self.dec_msg.c[0][k])))
-             
-            for k in range(int(self.dec_msg.n_s[l])):
-                if np.abs(self.dec_msg.s[0][k]) == 163.84:
-                    S_print = np.append(S_print,
-                                        np.str('{:+7.3f}'.format(self.dec_msg.s[0][k])
-                                        ) + '!')
-                else:
-                    S_print = np.append(S_print,
-                                        np.str('{:+7.3f}'.format(self.dec_msg.s[0][k])))
-            for j in range(int(self.dec_msg.order[l]) + 1):
-                if index < self.dec_msg.n_c[l]:
-                    strg = (strg + 'C' + f'{j}' + '[TECU]' + 
-                              ': ' +  ",".join(C_print[index: index +
-                                                    (int(self.dec_msg.degree[l]) +
-                                                     1 - 
-                                                     j)] ).replace(",", " ") + 
-                            '\n')
-                index = index + (int(self.dec_msg.degree[l]) + 1 - j)
+        index = 0        
+        C_print = []
+        S_print = []
+        for k in range(int(self.dec_msg.n_c[l])):
+            if np.abs(self.dec_msg.c[0][k]) == 163.84:
+                C_print = np.append(C_print,
+                                    np.str('{:+7.3f}'.format(self.dec_msg.c[0][k])
+                                    ) + '!')
+            else:
+                C_print = np.append(C_print,
+                                    np.str('{:+7.3f}'.format(self.dec_msg.c[0][k])))
+         
+        for k in range(int(self.dec_msg.n_s[l])):
+            if np.abs(self.dec_msg.s[0][k]) == 163.84:
+                S_print = np.append(S_print,
+                                    np.str('{:+7.3f}'.format(self.dec_msg.s[0][k])
+                                    ) + '!')
+            else:
+                S_print = np.append(S_print,
+                                    np.str('{:+7.3f}'.format(self.dec_msg.s[0][k])))
+        for j in range(int(self.dec_msg.order[l]) + 1):
+            if index < self.dec_msg.n_c[l]:
+                strg = (strg + 'C' + f'{j}' + '[TECU]' + 
+                          ': ' +  ",".join(C_print[index: index +
+                                                (int(self.dec_msg.degree[l]) +
+                                                 1 - 
+                                                 j)] ).replace(",", " ") + 
+                        '\n')
+            index = index + (int(self.dec_msg.degree[l]) + 1 - j)
   
-            index = 0        
-            for j in range(int(self.dec_msg.order[l])):
-                if index < self.dec_msg.n_s[l]:
-                    strg = (strg + 'S' + f'{j+1}' + '[TECU]' + 
-                              ': ' + ",".join(S_print[index: index +
-                                                    (int(self.dec_msg.degree[l]) +
-                                                     1 - 
-                                                     (j + 1))] ).replace(",",
-                                                                " ") + '\n')                    
-                index = index + (int(self.dec_msg.degree[l]) - j)
-                
-            if (np.any(np.abs(self.dec_msg.c) == 163.84) |
-                np.any(np.abs(self.dec_msg.s) == 163.84)):
-                strg = (strg + '(Note: ! indicates value is invalid or out of' + 
-                        'range -163.835...163.835)')
-            return strg
-        else:
-            return
+        index = 0        
+        for j in range(int(self.dec_msg.order[l])):
+            if index < self.dec_msg.n_s[l]:
+                strg = (strg + 'S' + f'{j+1}' + '[TECU]' + 
+                          ': ' + ",".join(S_print[index: index +
+                                                (int(self.dec_msg.degree[l]) +
+                                                 1 - 
+                                                 (j + 1))] ).replace(",",
+                                                            " ") + '\n')                    
+            index = index + (int(self.dec_msg.degree[l]) - j)
+            
+        if (np.any(np.abs(self.dec_msg.c) == 163.84) |
+            np.any(np.abs(self.dec_msg.s) == 163.84)):
+            strg = (strg + '(Note: ! indicates value is invalid or out of' + 
+                    'range -163.835...163.835)')
+        return strg
 # =============================================================================
 #                                    GPS
 # =============================================================================
@@ -905,12 +1032,13 @@ class rtcm_decoder:
 #                       GPS Ephemeris Message Type 1019                       #
 #                                                                             #
 # *************************************************************************** #        
+@register(1019, 'kepler_ephemeris', dated=True)
 class gps_ephemeris:
     def __init__(self, message, year, doy):
         # Definition of the bits of the message
         content =  ('u12u6u10u4s2s14u8u16s8s16s22u10s16s16s32s16u32s16u32u' + 
                     '16s16s32s16s32s16s32s24s8u6s1s1')
-        unpack_bits = bitstruct.unpack(content, message)
+        unpack_bits = bit_layouts.unpack(content, message)
         self.gnss = 'GPS'
         self.gnss_short = 'G'
         # Define constants
@@ -1040,6 +1168,7 @@ class gps_ephemeris:
 #     SSR GPS combined Orbit and Clock Correction Message Type 1060           #
 #                                                                             #
 # *************************************************************************** #
+@register(1060, 'orbit_clock')
 class gps_orbit_clock:   
     def __init__(self, message):
         self.gnss = 'GPS'
@@ -1047,7 +1176,7 @@ class gps_orbit_clock:
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        unpack_bits = bit_layouts.unpack(header, message)           
         
         # **************************** Parameters *************************** #
         
@@ -1088,92 +1217,51 @@ class gps_orbit_clock:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization
-        gps_id  = []
-        gps_iod = []
-            
-        p = []
-            
-        dr = []
-        dt = []
-        dn = []
-            
-        dot_dr = []
-        dot_dt = []
-        dot_dn = []
-            
-        dc0 = []
-        dc1 = []
-        dc2 = []
-            
-        bit_sat   = self.n_sat * 'u6u8s22s20s20s21s19s19s22s21s27'
-        bit_gps_check   = self.n_sat * 'u6u1u7s22s20s20s21s19s19s22s21s27'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-        gps_check = bitstruct.unpack(header + bit_gps_check, message)
-            
-        for i in range(self.n_sat):
-        # GPS ID number,
-            if s_unpack[11 * i + 9] < 10:
-                gps_id = np.append(gps_id, '0' + f'{s_unpack[11 * i + 9]}')
-            else:
-                gps_id = np.append(gps_id, f'{s_unpack[11 * i + 9]}')
-        # GPS IOD: Issue Of Data of GPS ephemeris to reference 
-        # the geometric gradients 
-
-            gps_iod = np.append(gps_iod, s_unpack[11 * i + 10])
-            p = np.append(p, gps_check[12 * i + 10])               
-                   
-        # Delta radial
-        # Printed in [m]
-            dr = np.append(dr, s_unpack[11 * i + 11] * 0.1 * 10 ** (-3))
-            
-        # Delta along-track
-        # Printed in [m]
-            dt = np.append(dt, s_unpack[11 * i + 12] * 0.4 * 10 ** (-3))
-            
-        # Delta cross-track
-        # Printed in [m]
-            dn = np.append(dn, s_unpack[11 * i + 13] * 0.4 * 10 ** (-3))
-            
-        # Dot delta radial
-        # Printed in [mm/s]
-            dot_dr = np.append(dot_dr, s_unpack[11 * i + 14] * 0.001)
-            
-        # Dot delta along-track
-        # Printed in [mm/s]
-            dot_dt = np.append(dot_dt, s_unpack[11 * i + 15] * 0.004)
-                
-        # Dot delta along-track, DF369, Range: +-1.048572[m/s],
-        # Res: 0.004[mm/s]
-        # Printed in [mm/s]
-            dot_dn = np.append(dot_dn, s_unpack[11 * i + 16] * 0.004)
-            
-        # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s^2]) 
-            dc0 = np.append(dc0, s_unpack[11 * i + 17] * 0.1    )  
-            dc1 = np.append(dc1, s_unpack[11 * i + 18] * 0.001  )  
-            dc2 = np.append(dc2, s_unpack[11 * i + 19] * 0.00002)  
-
-        self.dr = dr
-        self.dt = dt
-        self.dn = dn
-        
-        self.dot_dr = dot_dr
-        self.dot_dt = dot_dt
-        self.dot_dn = dot_dn
-        
-        self.dc0 = dc0
-        self.dc1 = dc1
-        self.dc2 = dc2
-        
-        self.gnss_id  = gps_id
-        self.gnss_iod = gps_iod
-        self.p = p
+        # satellite parameters, one row per satellite
+        bit_sat = self.n_sat * 'u6u8s22s20s20s21s19s19s22s21s27'
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 9, 11, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=ORBIT_CLOCK_DTYPE)
+        # GPS ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # IOD of the GPS ephemeris referenced by the corrections
+        sat['gnss_iod'] = rows[:, 1]
+        # first bit of the IOD
+        sat['p'] = rows[:, 1] >> 7
+        # Delta radial, along-track and cross-track, printed in [m]
+        sat['dr'] = rows[:, 2] * 0.1 * 10 ** (-3)
+        sat['dt'] = rows[:, 3] * 0.4 * 10 ** (-3)
+        sat['dn'] = rows[:, 4] * 0.4 * 10 ** (-3)
+        # Dot delta radial, along-track and cross-track, printed in [mm/s]
+        sat['dot_dr'] = rows[:, 5] * 0.001
+        sat['dot_dt'] = rows[:, 6] * 0.004
+        sat['dot_dn'] = rows[:, 7] * 0.004
+        # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s^2])
+        sat['dc0'] = rows[:, 8] * 0.1
+        sat['dc1'] = rows[:, 9] * 0.001
+        sat['dc2'] = rows[:, 10] * 0.00002
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.gnss_iod = sat['gnss_iod']
+        self.p = sat['p']
+        self.dr = sat['dr']
+        self.dt = sat['dt']
+        self.dn = sat['dn']
+        self.dot_dr = sat['dot_dr']
+        self.dot_dt = sat['dot_dt']
+        self.dot_dn = sat['dot_dn']
+        self.dc0 = sat['dc0']
+        self.dc1 = sat['dc1']
+        self.dc2 = sat['dc2']
         
 # *************************************************************************** #
 #                                                                             #
 #                       GPS Code Bias Message Type 1059                       #
 #                                                                             #
 # *************************************************************************** #
+@register(1059, 'code_bias')
 class gps_code_bias:
     def __init__(self, message):
         # Definition of the bits of the header of the message
@@ -1182,7 +1270,8 @@ class gps_code_bias:
         header = 'u12u20u4u1u4u16u4u6'
             
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        cursor = bit_layouts.BitCursor(message)
+        unpack_bits = cursor.read(header)
         
         # **************************** Parameters *************************** #
         
@@ -1221,53 +1310,39 @@ class gps_code_bias:
         # ******************************************************************* # 
 
         # satellite parameters initialization
-        gps_id = []
-        number  = []
+        sat = np.zeros(self.n_sat, dtype=CODE_BIAS_DTYPE)
         track  = []
         bias   = []
         name   = []
-            
-        n_types = 0
-        bit_sat   = 'u6u5'
-           
+
         for i in range(self.n_sat):
-            s_unpack = bitstruct.unpack(header + bit_sat, message)
-            # GPS ID number,      
-            if s_unpack[2 * i + 2 * n_types + 8] < 10:
-                gps_id = np.append(gps_id, '0' +
-                                   f'{s_unpack[2 * i + 2 * n_types +  8]}')
-            else:
-                gps_id = np.append(gps_id,
-                                   f'{s_unpack[2 * i + 2 * n_types +  8]}')
-            
-        # N. of Code Biases Processed, DF379, Range: 0-31, Res: 1
-            number = np.append(number, s_unpack[2 * i + 2 * n_types + 9])
+            s_unpack = cursor.read('u6u5')
+            # GPS ID number
+            sat['gnss_id'][i] = sat_id(s_unpack[0])
+            # N. of Code Biases Processed, DF379, Range: 0-31, Res: 1
+            sat['number'][i] = s_unpack[1]
             track.append([])
-            bias.append([]) 
+            bias.append([])
             name.append([])
-            bit_track = 'u5s14'
-            for j in range(s_unpack[2 * i + 2 * n_types + 9]):
-                t_unpack = bitstruct.unpack(header + bit_sat + bit_track,
-                                            message)
+            # the signals of the satellite are read together
+            t_unpack = cursor.read(s_unpack[1] * 'u5s14')
+            for j in range(s_unpack[1]):
             # Track indicator, DF380, Range: 0-31, Res: 1
-                track[i].append(t_unpack[2 * i + 2 * n_types + 10 + j * 2])
+                track[i].append(t_unpack[2 * j])
             # Signal name
                 GNSS = 'GPS'
-                name[i].append(signalID.signals(GNSS,
-                               t_unpack[2 * i + 2 * n_types + 10 + j * 2]))
+                name[i].append(signalID.signals(GNSS, t_unpack[2 * j]))
             # Code bias, DF383, Range: +-81.91[m], Res: 0.01[m]
-                bias[i].append(t_unpack[2 * i + 2 * n_types + 11 +
-                                            j * 2] * 0.01)
-                if j < s_unpack[2 * i + 2 * n_types + 9] - 1:
-                    bit_track = bit_track + 'u5s14'
-            n_types = n_types + s_unpack[2 * i + 2 * n_types + 9]    
-            bit_sat = bit_sat + bit_track  + 'u6u5'
-            
-        self.gnss_id = gps_id
-        self.number = number
+                bias[i].append(t_unpack[2 * j + 1] * 0.01)
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.number = sat['number']
         self.track = track
-        self.name  = name 
+        self.name  = name
         self.bias = bias
+        self.biases = bias_index(self.gnss_id, name, bias)
                      
 
 # *************************************************************************** #
@@ -1275,12 +1350,13 @@ class gps_code_bias:
 #                          GPS Orbits Message Type 1057                       #
 #                                                                             #
 # *************************************************************************** #
+@register(1057, 'orbit')
 class gps_orbit:
     def __init__(self, message):
         # Definition of the bits of the header for the message
         header = 'u12u20u4u1u1u4u16u4u6'
         # Unpack the bits of the header
-        unpack_bits = bitstruct.unpack(header, message)
+        unpack_bits = bit_layouts.unpack(header, message)
         self.gnss = 'GPS'
         self.gnss_short = 'G'
         # **************************** Parameters *************************** #
@@ -1322,85 +1398,51 @@ class gps_orbit:
         # ******************************************************************* #
         
         # GPS orbit parameter initilization
-        GPS_ID                = []
-        GPS_IODE              = []
-        delta_radial          = []
-        delta_along_track     = []
-        delta_cross_track     = []
-        dot_delta_radial      = []
-        dot_delta_along_track = []
-        dot_delta_cross_track = []
-        
-        # Satellite specific part of message
-        bit_sat  = self.n_sat * 'u6u8s22s20s20s21s19s19' 
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-        for i in range(self.n_sat):
-            if s_unpack[8 * i + 9] < 10:
-                GPS_ID = np.append(GPS_ID, '0' + f'{s_unpack[8 * i + 9]}')
-            else:
-                GPS_ID = np.append(GPS_ID, f'{s_unpack[8 * i + 9]}')
-
-            # u8 = DF071 GPS IODE
-            GPS_IODE = np.append(GPS_IODE, s_unpack[8 * i + 10])
-            
-            # s22 = DF365 Delta Radial
-            delta_radial = np.append(delta_radial, s_unpack[8 * i + 11])
-            # convert from string to int and change units to meters
-            delta_radial[i] = float(delta_radial[i]) / 10000
-            
-            # s20 = DF366 Delta Along-Track
-            delta_along_track = np.append(delta_along_track,
-                                          s_unpack[8 * i + 12])
-            # convert from string to int and change units to meters
-            delta_along_track[i] = float(delta_along_track[i]) / 2500
-            
-            # s20 = DF367 Delta Cross-Track
-            delta_cross_track = np.append(delta_cross_track,
-                                          s_unpack[8 * i + 13])
-            # convert from string to int and change units to meters
-            delta_cross_track[i] = float(delta_cross_track[i]) / 2500
-            
-            # s21 = DF368 Dot Delta Radial
-            dot_delta_radial = np.append(dot_delta_radial,
-                                         s_unpack[8 * i + 14])
-            # convert from string to int and change units to meters
-            dot_delta_radial[i] = float(dot_delta_radial[i]) / 10000
-            
-            # s19 = DF369 Dot Delta Along-Track
-            dot_delta_along_track = np.append(dot_delta_along_track,
-                                              s_unpack[8 * i + 15])
-            # convert from string to int and change units to meters
-            dot_delta_along_track[i] = float(dot_delta_along_track[i]) / 10000
-            
-            # s19 = DF370 Dot Delta Cross-Track 
-            dot_delta_cross_track = np.append(dot_delta_cross_track,
-                                              s_unpack[8 * i + 16])
-            # convert from string to int and change units to meters
-            dot_delta_cross_track[i] = float(dot_delta_cross_track[i]) / 10000
-
-        self.dr = delta_radial
-        self.dt = delta_along_track
-        self.dn = delta_cross_track
-        
-        self.dot_dr = dot_delta_radial
-        self.dot_dt = dot_delta_along_track 
-        self.dot_dn = dot_delta_cross_track
-        
-        self.gnss_id = GPS_ID
-        self.gnss_iod = GPS_IODE
+        # satellite parameters, one row per satellite
+        bit_sat = self.n_sat * 'u6u8s22s20s20s21s19s19'
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 9, 8, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=ORBIT_DTYPE)
+        # GPS ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # IOD of the GPS ephemeris referenced by the corrections
+        sat['gnss_iod'] = rows[:, 1]
+        # first bit of the IOD
+        sat['p'] = rows[:, 1] >> 7
+        # Delta radial, along-track and cross-track, printed in [m]
+        sat['dr'] = rows[:, 2] / 10000
+        sat['dt'] = rows[:, 3] / 2500
+        sat['dn'] = rows[:, 4] / 2500
+        # Dot delta radial, along-track and cross-track, printed in [mm/s]
+        sat['dot_dr'] = rows[:, 5] / 10000
+        sat['dot_dt'] = rows[:, 6] / 10000
+        sat['dot_dn'] = rows[:, 7] / 10000
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.gnss_iod = sat['gnss_iod']
+        self.p = sat['p']
+        self.dr = sat['dr']
+        self.dt = sat['dt']
+        self.dn = sat['dn']
+        self.dot_dr = sat['dot_dr']
+        self.dot_dt = sat['dot_dt']
+        self.dot_dn = sat['dot_dn']
 
 # *************************************************************************** #
 #                                                                             #
 #                         GPS Clock Message Type 1058                         #
 #                                                                             #
 # *************************************************************************** #
+@register(1058, 'clock')
 class gps_clock:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u6'
             
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        unpack_bits = bit_layouts.unpack(header, message)
 
         self.gnss = 'GPS'
         self.gnss_short = 'G'        
@@ -1439,43 +1481,31 @@ class gps_clock:
         #                            Satellite part                           #
         #                                                                     #
         # ******************************************************************* # 
-        # satellite parameters initialization
-        GPS_ID = []
-        Dcl_A0 = []
-        Dcl_A1 = []
-        Dcl_A2 = []
-            
-        bit_sat = self.n_sat * 'u6s22s21s27'                 
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-            
-        for i in range(self.n_sat):
-            # GPS ID number 
-            if s_unpack[4 * i + 8] < 10:
-                GPS_ID = np.append(GPS_ID, '0' + f'{s_unpack[4 * i + 8]}')
-            else:
-                GPS_ID = np.append(GPS_ID, f'{s_unpack[4 * i + 8]}')
-            # Delta Clock C0
-            # Printed in [mm]
-            Dcl_A0 = np.append(Dcl_A0, s_unpack[4 * i + 9] * 0.1)
-            
-            # Delta Clock C1
-            # Printed in [mm/s]
-            Dcl_A1 = np.append(Dcl_A1, s_unpack[4 * i + 10] * 0.001)
-            
-            # Delta Clock C2
-            # Printed in [mm/s^2]
-            Dcl_A2 = np.append(Dcl_A2, s_unpack[4 * i + 11] * 0.00002)
-        
-        self.gnss_id = GPS_ID
-        self.dc0 = Dcl_A0
-        self.dc1 = Dcl_A1
-        self.dc2 = Dcl_A2
+        # satellite parameters, one row per satellite
+        bit_sat = self.n_sat * 'u6s22s21s27'
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 4, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=CLOCK_DTYPE)
+        # GPS ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s^2])
+        sat['dc0'] = rows[:, 1] * 0.1
+        sat['dc1'] = rows[:, 2] * 0.001
+        sat['dc2'] = rows[:, 3] * 0.00002
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.dc0 = sat['dc0']
+        self.dc1 = sat['dc1']
+        self.dc2 = sat['dc2']
         
 # *************************************************************************** #
 #                                                                             #
 #                          GPS URA Message Type 1061                          #
 #                                                                             #
 # *************************************************************************** #
+@register(1061, 'ura')
 class gps_ura:
     def __init__(self, message):
         # SSR User Range Accuracy (URA) (1 sigma)
@@ -1483,7 +1513,7 @@ class gps_ura:
         header = 'u12u20u4u1u4u16u4u6'
             
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        unpack_bits = bit_layouts.unpack(header, message)
         
         self.gnss = 'GPS'
         self.gnss_short = 'G'
@@ -1523,44 +1553,39 @@ class gps_ura:
         #                                                                     #
         # ******************************************************************* # 
         
-        # satellite parameters initialization
-        GPS_ID = []
-        URA = []
-        URA_class = []
-        URA_value = []
-            
-        bit_sat = self.n_sat * 'u6u3u3' 
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-            
-        for i in range(self.n_sat):
-        # GPS ID number,  
-            if s_unpack[3 * i + 8] < 10:
-                GPS_ID = np.append(GPS_ID, '0' + f'{s_unpack[3 * i + 8]}')
-            else:
-                GPS_ID = np.append(GPS_ID, f'{s_unpack[3 * i + 8]}')
-            # SSR URA, DF389, Range: bits 5 – 3: 0 – 7
-            #                        bits 2 – 0: 0 – 7
-            URA_class = np.append(URA_class, s_unpack[3 * i + 9])
-            URA_value = np.append(URA_value, s_unpack[3 * i + 10])
-            URA = np.append(URA, ((pow(3, URA_class[i]) * (1 +
-                            (URA_value[i] / 4))) - 1) / 1000)
-        self.gnss_id = GPS_ID
-        self.ura = URA
-        self.ura_class = URA_class
-        self.ura_value = URA_value
+        # satellite parameters, one row per satellite
+        bit_sat = self.n_sat * 'u6u3u3'
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 3, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=URA_DTYPE)
+        # GPS ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # URA class and value, URA printed in [m]
+        sat['ura_class'] = rows[:, 1]
+        sat['ura_value'] = rows[:, 2]
+        sat['ura'] = (3 ** rows[:, 1] * (1 + rows[:, 2] / 4) - 1) / 1000
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.ura_class = sat['ura_class']
+        self.ura_value = sat['ura_value']
+        self.ura = sat['ura']
             
 # *************************************************************************** #
 #                                                                             #
 #                       SSR GPS Phase Bias Message 1265                       #
 #                                                                             #
 # *************************************************************************** #
+@register(1265, 'phase_bias')
 class gps_phase_bias:
     def __init__(self, message):
         # SSR User Range Accuracy (URA) (1 sigma)
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u1u1u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        cursor = bit_layouts.BitCursor(message)
+        unpack_bits = cursor.read(header)
         
         self.gnss = 'GPS'
         self.gnss_short = 'G'
@@ -1604,45 +1629,27 @@ class gps_phase_bias:
         # ******************************************************************* # 
         
         # satellite parameters initialization
-        GPS_ID = []
-        num_phase = []
-        yaw_angle = []
-        yaw_rate = []
-            
+        sat = np.zeros(self.n_sat, dtype=PHASE_BIAS_DTYPE)
+
         track = []
         signal_int = []
         signal_WL = []
         signal_name = []
         signal_dis = []
         phase_bias = []
-             
-        n_types = 0
-        bit_sat   = 'u6u5u9s8'  
-           
+
         for i in range(self.n_sat):
-            s_unpack = bitstruct.unpack(header + bit_sat, message)
-            # GPS sat ID number     
-            if s_unpack[4 * i + 5 * n_types + 10] < 10:
-                GPS_ID = np.append(GPS_ID, '0' +
-                                       f'{s_unpack[4 * i + 5 * n_types + 10]}')
-            else:
-                GPS_ID = np.append(GPS_ID,
-                                       f'{s_unpack[4 * i + 5 * n_types + 10]}')  
+            s_unpack = cursor.read('u6u5u9s8')
+            # GPS sat ID number
+            sat['gnss_id'][i] = sat_id(s_unpack[0])
             # N. of Phase Biases Processed
-            num_phase = np.append(num_phase,
-                                  s_unpack[4 * i + 5 * n_types + 11])
+            sat['number'][i] = s_unpack[1]
             # Yaw Angle
             # Printed in [deg]
-            yaw_angle = np.append(yaw_angle,
-                                  (s_unpack[4 * i +
-                                            5 * n_types + 
-                                            12] * 1 / 256) * 180)           
+            sat['yaw_angle'][i] = (s_unpack[2] * 1 / 256) * 180
             # Yaw Rate
             # Printed in [deg/s]
-            yaw_rate = np.append(yaw_rate,
-                                 (s_unpack[4 * i +
-                                           5 * n_types +
-                                           13] * 1 / 8192) * 180)
+            sat['yaw_rate'][i] = (s_unpack[3] * 1 / 8192) * 180
         # ******************************************************************* #
         #                                                                     # 
         #            Phase specific part of the satellite considered          #
@@ -1655,53 +1662,37 @@ class gps_phase_bias:
             signal_name.append([])
             signal_dis.append([])
             phase_bias.append([])
-                
-            bit_phase = 'u5u1u2u4s20'
-            for j in range(s_unpack[4 * i + 5 * n_types + 11]):
-                p_unpack = bitstruct.unpack(header + 
-                                            bit_sat + bit_phase, message)
-            
+            # the signals of the satellite are read together
+            p_unpack = cursor.read(s_unpack[1] * 'u5u1u2u4s20')
+            for j in range(s_unpack[1]):
             # Track indicator
-                track[i].append(p_unpack[4 * i + 5 * n_types + 14 + j * 5])
-            
+                track[i].append(p_unpack[5 * j])
             # Signal_name:
                 GNSS_ID = 'GPS'
                 signal_name[i].append(signalID.signals(GNSS_ID,
-                                      p_unpack[4 * i + 
-                                               5 * n_types + 14 + j * 5]))
-                        
-            # Signal integer indicator,
-                signal_int[i].append(p_unpack[4 * i + 5 * n_types + 15 + 
-                                              j * 5])
-            
+                                                       p_unpack[5 * j]))
+            # Signal integer indicator
+                signal_int[i].append(p_unpack[5 * j + 1])
             # Signal wide-lane integer indicator
-                signal_WL[i].append(p_unpack[4 * i + 5 * n_types + 
-                                             16 + j * 5])
-            
+                signal_WL[i].append(p_unpack[5 * j + 2])
             # Signal discontinuity counter
-                signal_dis[i].append(p_unpack[4 * i + 5 * n_types + 17 +
-                                              j * 5])
-            
+                signal_dis[i].append(p_unpack[5 * j + 3])
             # PHASE BIAS
-                phase_bias[i].append(p_unpack[4 * i + 5 * n_types + 18 +
-                                              j * 5] * 0.0001)
-
-                if j < s_unpack[4 * i + 5 * n_types + 11] - 1:
-                    bit_phase = bit_phase + 'u5u1u2u4s20'
-                        
-            n_types = n_types + s_unpack[4 * i + 5 * n_types + 11]    
-            bit_sat = bit_sat + bit_phase  + 'u6u5u9s8'
-                          
-            self.gnss_id = GPS_ID           
-            self.number = num_phase
-            self.yaw_angle = yaw_angle
-            self.yaw_rate = yaw_rate
-            self.track = track
-            self.name = signal_name
-            self.bias = phase_bias
-            self.sig_wl = signal_WL
-            self.sig_dis = signal_dis
-            self.sig_i = signal_int                 
+                phase_bias[i].append(p_unpack[5 * j + 4] * 0.0001)
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.number = sat['number']
+        self.yaw_angle = sat['yaw_angle']
+        self.yaw_rate = sat['yaw_rate']
+        self.track = track
+        self.name = signal_name
+        self.bias = phase_bias
+        self.biases = bias_index(self.gnss_id, signal_name, phase_bias)
+        self.sig_wl = signal_WL
+        self.sig_dis = signal_dis
+        self.sig_i = signal_int
 
 # =============================================================================
 #                                 GLONASS
@@ -1711,6 +1702,7 @@ class gps_phase_bias:
 #               GLONASS Satellite Ephemeris data Message Type 1020            #
 #                                                                             #
 # *************************************************************************** #
+@register(1020, 'glo_ephemeris')
 class glo_ephemeris:
     def __init__(self, message):
         # Definition of the bits of the header of the message
@@ -1720,7 +1712,7 @@ class glo_ephemeris:
             
         header = header1 + header2 + header3
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        unpack_bits = bit_layouts.unpack(header, message)           
         
         self.gnss = 'GLONASS'
         self.gnss_short = 'R'
@@ -1906,12 +1898,13 @@ class glo_ephemeris:
 #                  GLONASS Orbit Correction Message Type 1063                 #
 #                                                                             #
 # *************************************************************************** #
+@register(1063, 'orbit')
 class glo_orbit:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u17u4u1u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        unpack_bits = bit_layouts.unpack(header, message)           
         self.gnss = 'GLONASS'
         self.gnss_short = 'R'
         
@@ -1954,79 +1947,49 @@ class glo_orbit:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization
-        GLO_ID  = []
-        GLO_IOD = []
-        p       = []
-            
-        D_r = []
-        D_t = []
-        D_n = []
-            
-        dot_D_r = []
-        dot_D_t = []
-        dot_D_n = []
-            
-        bit_sat = self.n_sat * 'u5u8s22s20s20s21s19s19' 
-        bit_GLO_check = self.n_sat * 'u5u1u7s22s20s20s21s19s19'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-        R_check = bitstruct.unpack(header + bit_GLO_check, message)
-        for i in range(self.n_sat):
-        # GLONASS ID number,
-            if s_unpack[8 * i + 9] < 10:
-                GLO_ID = np.append(GLO_ID, '0' + f'{s_unpack[8 * i +  9]}')
-            else:
-                GLO_ID = np.append(GLO_ID, f'{s_unpack[8 * i +  9]}')
-            # GLONASS IOD: Issue Of Data of GLONASS ephemeris to reference 
-            # the geometric gradients 
-            GLO_IOD = np.append(GLO_IOD, s_unpack[8 * i + 10])
-
-            p = np.append(p, R_check[9 * i +  10])
-                   
-            # Delta radial
-            # Printed in [m]
-            D_r = np.append(D_r, s_unpack[8 * i + 11] * 0.1 * 10 ** (-3))
-            
-            # Delta along-track
-            # Printed in [m]
-            D_t = np.append(D_t, s_unpack[8 * i + 12] * 0.4 * 10 ** (-3))
-            
-            # Delta cross-track
-            # Printed in [m]
-            D_n = np.append(D_n, s_unpack[8 * i + 13] * 0.4 * 10 ** (-3))
-            
-            # Dot delta radial
-            # Printed in [mm/s]
-            dot_D_r = np.append(dot_D_r, s_unpack[8 * i + 14] * 0.001)
-            
-            # Dot delta along-track
-            # Printed in [mm/s]
-            dot_D_t = np.append(dot_D_t, s_unpack[8 * i + 15] * 0.004)
-                
-            # Dot delta along-track
-            # Printed in [mm/s]
-            dot_D_n = np.append(dot_D_n, s_unpack[8 * i + 16] * 0.004)
-
-            self.gnss_id = GLO_ID
-            self.gnss_iod = GLO_IOD
-            self.dr = D_r
-            self.dt = D_t
-            self.dn = D_n
-            self.dot_dr = dot_D_r
-            self.dot_dt = dot_D_t
-            self.dot_dn = dot_D_n
-            self.p = p
+        # satellite parameters, one row per satellite
+        bit_sat = self.n_sat * 'u5u8s22s20s20s21s19s19'
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 9, 8, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=ORBIT_DTYPE)
+        # GLONASS ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # IOD of the GLONASS ephemeris referenced by the corrections
+        sat['gnss_iod'] = rows[:, 1]
+        # first bit of the IOD
+        sat['p'] = rows[:, 1] >> 7
+        # Delta radial, along-track and cross-track, printed in [m]
+        sat['dr'] = rows[:, 2] * 0.1 * 10 ** (-3)
+        sat['dt'] = rows[:, 3] * 0.4 * 10 ** (-3)
+        sat['dn'] = rows[:, 4] * 0.4 * 10 ** (-3)
+        # Dot delta radial, along-track and cross-track, printed in [mm/s]
+        sat['dot_dr'] = rows[:, 5] * 0.001
+        sat['dot_dt'] = rows[:, 6] * 0.004
+        sat['dot_dn'] = rows[:, 7] * 0.004
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.gnss_iod = sat['gnss_iod']
+        self.p = sat['p']
+        self.dr = sat['dr']
+        self.dt = sat['dt']
+        self.dn = sat['dn']
+        self.dot_dr = sat['dot_dr']
+        self.dot_dt = sat['dot_dt']
+        self.dot_dn = sat['dot_dn']
 # *************************************************************************** #
 #                                                                             #
 #                     GLONASS Clock Message Type 1064                         #
 #                                                                             #
 # *************************************************************************** #
+@register(1064, 'clock')
 class glo_clock:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u17u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        unpack_bits = bit_layouts.unpack(header, message)
         self.gnss = 'GLONASS'
         self.gnss_short = 'R'        
         # **************************** Parameters *************************** #
@@ -2065,48 +2028,38 @@ class glo_clock:
         #                                                                     #
         # ******************************************************************* # 
         
-        # satellite parameters initialization
-        GLO_ID = []
-        Dcl_C0 = []
-        Dcl_C1 = []
-        Dcl_C2 = []
-            
-        bit_sat = self.n_sat * 'u5s22s21s27' 
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-        for i in range(self.n_sat):
-            # GLONASS ID number,  
-            if s_unpack[4 * i + 8] < 10:
-                GLO_ID = np.append(GLO_ID, '0' + f'{s_unpack[4 * i + 8]}')
-            else:
-                GLO_ID = np.append(GLO_ID, f'{s_unpack[4 * i + 8]}')
-                            
-            # Delta Clock C0 [mm]
-            Dcl_C0 = np.append(Dcl_C0, s_unpack[4 * i + 9] * 0.1)
-            
-            # Delta Clock C1
-            # Printed in [mm/s]
-            Dcl_C1 = np.append(Dcl_C1, s_unpack[4 * i + 10] * 0.001)
-            
-            # Delta Clock C2
-            # Printed in [mm/s^2]
-            Dcl_C2 = np.append(Dcl_C2, s_unpack[4 * i + 11] * 0.00002)
-  
-        self.gnss_id = GLO_ID
-        self.dc0 = Dcl_C0
-        self.dc1 = Dcl_C1
-        self.dc2 = Dcl_C2
+        # satellite parameters, one row per satellite
+        bit_sat = self.n_sat * 'u5s22s21s27'
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 4, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=CLOCK_DTYPE)
+        # GLONASS ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s^2])
+        sat['dc0'] = rows[:, 1] * 0.1
+        sat['dc1'] = rows[:, 2] * 0.001
+        sat['dc2'] = rows[:, 3] * 0.00002
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.dc0 = sat['dc0']
+        self.dc1 = sat['dc1']
+        self.dc2 = sat['dc2']
             
 # *************************************************************************** #
 #                                                                             #
 #                     GLONASS Code Bias Message Type 1065                     #
 #                                                                             #
 # *************************************************************************** #
+@register(1065, 'code_bias')
 class glo_code_bias:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u17u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        cursor = bit_layouts.BitCursor(message)
+        unpack_bits = cursor.read(header)
         self.gnss = 'GLONASS'
         self.gnss_short = 'R'
         # **************************** Parameters *************************** #
@@ -2146,65 +2099,52 @@ class glo_code_bias:
         # ******************************************************************* # 
 
         # satellite parameters initialization
-        GLO_ID = []
-        types  = []
+        sat = np.zeros(self.n_sat, dtype=CODE_BIAS_DTYPE)
         track  = []
         bias   = []
         name   = []
-            
-        n_types = 0
-        bit_sat   = 'u5u5'
-            
+
         for i in range(self.n_sat):
-            s_unpack = bitstruct.unpack(header + bit_sat, message)
+            s_unpack = cursor.read('u5u5')
             # GLONASS ID number
-            if s_unpack[2 * i + 2 * n_types + 8] < 10:
-                   GLO_ID = np.append(GLO_ID, '0' +
-                                      f'{s_unpack[2 * i + 2 * n_types + 8]}')
-            else:
-                GLO_ID = np.append(GLO_ID,
-                                   f'{s_unpack[2 * i + 2 * n_types + 8]}')
-            # N. of Code Biases Processed
-            types = np.append(types,
-                              s_unpack[2 * i + 2 * n_types + 9])
+            sat['gnss_id'][i] = sat_id(s_unpack[0])
+            # N. of Code Biases Processed, DF379, Range: 0-31, Res: 1
+            sat['number'][i] = s_unpack[1]
             track.append([])
             bias.append([])
             name.append([])
-            bit_track = 'u5s14'
-            for j in range(s_unpack[2 * i + 2 * n_types + 9]):
-                t_unpack = bitstruct.unpack(header + 
-                                            bit_sat + bit_track, message)
-            # Track indicator
-                track[i].append(t_unpack[2 * i + 2 * n_types + 10 + j * 2])
+            # the signals of the satellite are read together
+            t_unpack = cursor.read(s_unpack[1] * 'u5s14')
+            for j in range(s_unpack[1]):
+            # Track indicator, DF380, Range: 0-31, Res: 1
+                track[i].append(t_unpack[2 * j])
             # Signal name
                 GNSS = 'GLONASS'
-                name[i].append(signalID.signals(GNSS,
-                               t_unpack[2 * i + 2 * n_types + 10 + j * 2]))
-            # Code bias
-                bias[i].append(t_unpack[2 * i + 2 * n_types + 11 +
-                                            j * 2] * 0.01)
-                if j < s_unpack[2 * i + 2 * n_types + 9] - 1:
-                    bit_track = bit_track + 'u5s14'
-            n_types = n_types + s_unpack[2 * i + 2 * n_types + 9]    
-            bit_sat = bit_sat + bit_track  + 'u5u5'
-        
-        self.gnss_id = GLO_ID
-        self.number = types
-        self.name = name
-        self.bias = bias
+                name[i].append(signalID.signals(GNSS, t_unpack[2 * j]))
+            # Code bias, DF383, Range: +-81.91[m], Res: 0.01[m]
+                bias[i].append(t_unpack[2 * j + 1] * 0.01)
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.number = sat['number']
         self.track = track
+        self.name  = name
+        self.bias = bias
+        self.biases = bias_index(self.gnss_id, name, bias)
 
 # *************************************************************************** #
 #                                                                             #
 #   SSR GLONASS combined Orbit and Clock Correction Message Type 1066         #
 #                                                                             #
 # *************************************************************************** #
+@register(1066, 'orbit_clock')
 class glo_orbit_clock:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u17u4u1u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        unpack_bits = bit_layouts.unpack(header, message)           
         self.gnss = 'GLONASS'
         self.gnss_short = 'R'
         # **************************** Parameters *************************** #
@@ -2245,94 +2185,57 @@ class glo_orbit_clock:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization
-        GLO_ID  = []
-        GLO_IOD = []
-            
-        p = []
-            
-        D_r = []
-        D_t = []
-        D_n = []
-            
-        dot_D_r = []
-        dot_D_t = []
-        dot_D_n = []
-            
-        D_C0 = []
-        D_C1 = []
-        D_C2 = []
-            
-        bit_sat   = self.n_sat * 'u5u8s22s20s20s21s19s19s22s21s27'
-        bit_GLO_check   = self.n_sat * 'u5u1u7s22s20s20s21s19s19s22s21s27'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-        R_check = bitstruct.unpack(header + bit_GLO_check, message)
-        for i in range(self.n_sat):
-            # GPS ID number
-            if s_unpack[11 * i + 9] < 10:
-                GLO_ID = np.append(GLO_ID, '0' + f'{s_unpack[11 * i + 9]}')
-            else:
-                GLO_ID = np.append(GLO_ID, f'{s_unpack[11 * i + 9]}')
-                                    
-            # GPS IOD: Issue Of Data of GPS ephemeris to reference 
-            # the geometric gradients 
-            GLO_IOD = np.append(GLO_IOD, s_unpack[11 * i + 10])
-                
-            p = np.append(p, R_check[12 * i + 10])               
-                   
-            # Delta radial
-            # Printed in [m]
-            D_r = np.append(D_r, s_unpack[11 * i + 11] * 0.1 * 10 ** (-3))
-            
-            # Delta along-track
-            # Printed in [m]
-            D_t = np.append(D_t, s_unpack[11 * i + 12] * 0.4 * 10 ** (-3))
-            
-            # Delta cross-track
-            # Printed in [m]
-            D_n = np.append(D_n, s_unpack[11 * i + 13] * 0.4 * 10 ** (-3))
-            
-            # Dot delta radial
-            # Printed in [mm/s]
-            dot_D_r = np.append(dot_D_r, s_unpack[11 * i + 14] * 0.001)
-            
-            # Dot delta along-track
-            # Printed in [mm/s]
-            dot_D_t = np.append(dot_D_t, s_unpack[11 * i + 15] * 0.004)
-                
-            # Dot delta along-track
-            # Printed in [mm/s]
-            dot_D_n = np.append(dot_D_n, s_unpack[11 * i + 16] * 0.004)
-            
-            # Delta clock C0, C1, C2, [mm], [mm/s], [mm/s**2]
-            D_C0 = np.append(D_C0, s_unpack[11 * i + 17] * 0.1    ) 
-            D_C1 = np.append(D_C1, s_unpack[11 * i + 18] * 0.001  ) 
-            D_C2 = np.append(D_C2, s_unpack[11 * i + 19] * 0.00002)
-
-        self.gnss_id = GLO_ID
-        self.gnss_iod = GLO_IOD
-        self.dr = D_r
-        self.dn = D_n
-        self.dt = D_t
-        self.dot_dr = dot_D_r
-        self.dot_dn = dot_D_n
-        self.dot_dt = dot_D_t
-        self.dc0 = D_C0
-        self.dc1 = D_C1
-        self.dc2 = D_C2
-        self.p = p
+        # satellite parameters, one row per satellite
+        bit_sat = self.n_sat * 'u5u8s22s20s20s21s19s19s22s21s27'
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 9, 11, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=ORBIT_CLOCK_DTYPE)
+        # GLONASS ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # IOD of the GLONASS ephemeris referenced by the corrections
+        sat['gnss_iod'] = rows[:, 1]
+        # first bit of the IOD
+        sat['p'] = rows[:, 1] >> 7
+        # Delta radial, along-track and cross-track, printed in [m]
+        sat['dr'] = rows[:, 2] * 0.1 * 10 ** (-3)
+        sat['dt'] = rows[:, 3] * 0.4 * 10 ** (-3)
+        sat['dn'] = rows[:, 4] * 0.4 * 10 ** (-3)
+        # Dot delta radial, along-track and cross-track, printed in [mm/s]
+        sat['dot_dr'] = rows[:, 5] * 0.001
+        sat['dot_dt'] = rows[:, 6] * 0.004
+        sat['dot_dn'] = rows[:, 7] * 0.004
+        # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s^2])
+        sat['dc0'] = rows[:, 8] * 0.1
+        sat['dc1'] = rows[:, 9] * 0.001
+        sat['dc2'] = rows[:, 10] * 0.00002
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.gnss_iod = sat['gnss_iod']
+        self.p = sat['p']
+        self.dr = sat['dr']
+        self.dt = sat['dt']
+        self.dn = sat['dn']
+        self.dot_dr = sat['dot_dr']
+        self.dot_dt = sat['dot_dt']
+        self.dot_dn = sat['dot_dn']
+        self.dc0 = sat['dc0']
+        self.dc1 = sat['dc1']
+        self.dc2 = sat['dc2']
         
 # *************************************************************************** #
 #                                                                             #
 #                     GLONASS SV URA Message Type 1067                        #
 #                                                                             #
 # *************************************************************************** #
+@register(1067, 'ura')
 class glo_ura:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u17u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        unpack_bits = bit_layouts.unpack(header, message)
         self.gnss = 'GLONASS'
         self.gnss_short = 'R'
         
@@ -2372,55 +2275,43 @@ class glo_ura:
         #                                                                     #
         # ******************************************************************* # 
         
-        # satellite parameters initialization
-        GLO_ID = []
-        URA    = []
-        URA_CLASS = []
-        URA_VALUE = []
-                           
+        # satellite parameters, one row per satellite
         bit_sat = self.n_sat * 'u5u3u3'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 3, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=URA_DTYPE)
+        # GLONASS ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # URA class and value, URA printed in [m]
+        sat['ura_class'] = rows[:, 1]
+        sat['ura_value'] = rows[:, 2]
+        sat['ura'] = (3 ** rows[:, 1] * (1 + rows[:, 2] / 4) - 1) / 1000
         for i in range(self.n_sat):
-            # GLONASS ID number       
-            if s_unpack[3 * i + 8] < 10:
-                GLO_ID = np.append(GLO_ID, '0' + f'{s_unpack[3 * i + 8]}')
-            else:
-                GLO_ID = np.append(GLO_ID, f'{s_unpack[3 * i + 8]}')
-                
-            # SSR URA
-            # URA_CLASS
-            Class = s_unpack[3 * i + 9]
-            URA_CLASS = np.append(URA_CLASS, Class)
-
-            # URA_VALUE 
-            Value = s_unpack[3 * i + 10]
-            URA_VALUE = np.append(URA_VALUE, Value)
-
-            if (Value == 0) & (Class == 0):
+            if (rows[i, 2] == 0) & (rows[i, 1] == 0):
                 print('URA undefined/unknown')
-            elif (Value == 7) & (Class == 7):
+            elif (rows[i, 2] == 7) & (rows[i, 1] == 7):
                 print('URA > 5466.5 [mm]')
-            # The URA is computed by the following expression:
-            # Printed in [m]
-            URA = np.append(URA, (3 ** (Class) * (1 + Value / 4) -
-                                      1) / 1000)                
-            self.ura = URA
-            self.ura_class = URA_CLASS
-            self.ura_value = URA_VALUE
-            self.gnss_id = GLO_ID
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.ura_class = sat['ura_class']
+        self.ura_value = sat['ura_value']
+        self.ura = sat['ura']
             
 # *************************************************************************** #
 #                                                                             #
 #                     SSR GLONASS Phase Bias Message 1266                     #
 #                                                                             #
 # *************************************************************************** #            
+@register(1266, 'phase_bias')
 class glo_phase_bias:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u17u4u1u4u16u4u1u1u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        cursor = bit_layouts.BitCursor(message)
+        unpack_bits = cursor.read(header)
         self.gnss = 'GLONASS'
         self.gnss_short = 'R'
         # **************************** Parameters *************************** #
@@ -2465,98 +2356,70 @@ class glo_phase_bias:
         #                                                                     #
         # ******************************************************************* # 
         # satellite parameters initialization
-        GLO_ID = []
-        Nphase = []
-        YA     = []
-        YR     = []
-        # phase parameters initialization
-        GLO_ST = []
-        SII    = []
-        w      = []
-        dis    = []
-        bias   = []               
+        sat = np.zeros(self.n_sat, dtype=PHASE_BIAS_DTYPE)
+
+        track = []
+        signal_int = []
+        signal_WL = []
         signal_name = []
-            
-        bit_sat = 'u5u5u9s8' 
-        n_phase = 0
-        for i in range(self.n_sat):               
-            s_unpack = bitstruct.unpack(header + bit_sat, message)
-                
-            # GLONASS ID number       
-            if s_unpack[4 * i + 5 * n_phase + 10] < 10:
-                GLO_ID = np.append(GLO_ID, '0' +
-                                   f'{s_unpack[4 * i + 5 * n_phase + 10]}')
-            else:
-                GLO_ID = np.append(GLO_ID,
-                                   f'{s_unpack[4 * i + 5 * n_phase + 10]}')  
-            # No. of Phase Biases Processed
-            Nphase = np.append(Nphase, s_unpack[4 * i + 5 * n_phase + 11])
-                
-            # Yaw Angle, DF480
+        signal_dis = []
+        phase_bias = []
+
+        for i in range(self.n_sat):
+            s_unpack = cursor.read('u5u5u9s8')
+            # GLONASS sat ID number
+            sat['gnss_id'][i] = sat_id(s_unpack[0])
+            # N. of Phase Biases Processed
+            sat['number'][i] = s_unpack[1]
+            # Yaw Angle
             # Printed in [deg]
-            YA = np.append(YA, (s_unpack[4 * i + 5 * n_phase +
-                                         12] * 1 / 256) * 180)
-            # YAW Rate
+            sat['yaw_angle'][i] = (s_unpack[2] * 1 / 256) * 180
+            # Yaw Rate
             # Printed in [deg/s]
-            YR = np.append(YR, (s_unpack[4 * i + 5 * n_phase + 
-                                         13] * 1 / 8192) * 180)                
-
+            sat['yaw_rate'][i] = (s_unpack[3] * 1 / 8192) * 180
         # ******************************************************************* #
         #                                                                     # 
         #            Phase specific part of the satellite considered          #
         #                                                                     #
         # ******************************************************************* # 
         # phase parameters initialization
-            GLO_ST.append([])
-            SII.append([])
-            w.append([])
+            track.append([])
+            signal_int.append([])
+            signal_WL.append([])
             signal_name.append([])
-            dis.append([])
-            bias.append([])
-               
-            bit_phase = 'u5u1u2u4s20' 
-            
-            for j in range(s_unpack[4 * i + 5 * n_phase + 11]): 
-                p_unpack = bitstruct.unpack(header + bit_sat +
-                                            bit_phase, message)
-                
-                # GLONASS Signal and Tracking Mode Indicator       
-                GLO_ST[i].append(p_unpack[4 * i + 5 * n_phase +
-                                          5 * j + 14])
-                # Signal_name:
+            signal_dis.append([])
+            phase_bias.append([])
+            # the signals of the satellite are read together
+            p_unpack = cursor.read(s_unpack[1] * 'u5u1u2u4s20')
+            for j in range(s_unpack[1]):
+            # Track indicator
+                track[i].append(p_unpack[5 * j])
+            # Signal_name:
                 GNSS_ID = 'GLONASS'
                 signal_name[i].append(signalID.signals(GNSS_ID,
-                                      p_unpack[4 * i + 
-                                               5 * n_phase + 5 * j + 14]))
-                # Signal Integer Indicator
-                SII[i].append(p_unpack[4 * i + 5 * n_phase + 5 * j + 15])
-             
-                # Signals Wide-Lane Integer Indicator
-                w[i].append(p_unpack[4 * i + 5 * n_phase + 5 * j + 16])
-            
-                # Signal Discontinuity Counter
-                dis[i].append(p_unpack[4 * i + 5 * n_phase + 5 * j + 17])
-                 
-                # Phase Bias
-                bias[i].append(p_unpack[4 * i + 5 * n_phase +
-                                        5 * j + 18] * 0.0001)
-
-                if j < s_unpack[4 * i + 5 * n_phase + 11] - 1:
-                    bit_phase = bit_phase + 'u5u1u2u4s20'
-                        
-            n_phase = n_phase + s_unpack[4 * i + 5 * n_phase + 11]                         
-            bit_sat = bit_sat + bit_phase + 'u5u5u9s8'   
-            
-            self.gnss_id = GLO_ID
-            self.yaw_angle = YA
-            self.yaw_rate = YR
-            self.number = Nphase
-            self.bias = bias
-            self.name = signal_name
-            self.track = GLO_ST
-            self.sig_i = SII
-            self.sig_wl = w
-            self.sig_dis = dis
+                                                       p_unpack[5 * j]))
+            # Signal integer indicator
+                signal_int[i].append(p_unpack[5 * j + 1])
+            # Signal wide-lane integer indicator
+                signal_WL[i].append(p_unpack[5 * j + 2])
+            # Signal discontinuity counter
+                signal_dis[i].append(p_unpack[5 * j + 3])
+            # PHASE BIAS
+                phase_bias[i].append(p_unpack[5 * j + 4] * 0.0001)
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.number = sat['number']
+        self.yaw_angle = sat['yaw_angle']
+        self.yaw_rate = sat['yaw_rate']
+        self.track = track
+        self.name = signal_name
+        self.bias = phase_bias
+        self.biases = bias_index(self.gnss_id, signal_name, phase_bias)
+        self.sig_wl = signal_WL
+        self.sig_dis = signal_dis
+        self.sig_i = signal_int
 
 # =============================================================================
 #                                Galileo
@@ -2566,6 +2429,7 @@ class glo_phase_bias:
 #           GALILEO Satellite Ephemeris F/NAV data Message Type 1045           #
 #                                                                             #
 # *************************************************************************** #
+@register(1045, 'kepler_ephemeris')
 class gal_ephemeris_fnav:
     def __init__(self, message):
         # Define constants
@@ -2573,7 +2437,7 @@ class gal_ephemeris_fnav:
         # Definition of the bits of the message
         contents = 'u12u6u12u10u8s14u14s6s21s31s16s16s32s16u32s16u32u14s16' + \
                    's32s16s32s16s32s24s10u2u1u7'
-        unpack_bits = bitstruct.unpack(contents, message)
+        unpack_bits = bit_layouts.unpack(contents, message)
         self.gnss = 'Galileo F/NAV'
         self.gnss_short = 'E'
     
@@ -2677,6 +2541,7 @@ class gal_ephemeris_fnav:
 ##           GALILEO Satellite Ephemeris I/NAVdata Message Type 1046           #
 ##                                                                             #
 ## *************************************************************************** #
+@register(1046, 'kepler_ephemeris')
 class gal_ephemeris_inav:
     def __init__(self, message):
         # Define constants
@@ -2685,7 +2550,7 @@ class gal_ephemeris_inav:
         contents = 'u12u6u12u10u8s14u14s6s21s31s16s16s32s16u32s16u32u14s16' + \
                    's32s16s32s16s32s24s10s10u2u1u2u1u2'
         
-        unpack_bits = bitstruct.unpack(contents, message)
+        unpack_bits = bit_layouts.unpack(contents, message)
         
         self.gnss = 'Galileo I/NAV'
         self.gnss_short = 'E'
@@ -2790,12 +2655,13 @@ class gal_ephemeris_inav:
 #                  SSR Galileo Orbit Correction Message Type 1240             #
 #                                                                             #
 # *************************************************************************** #
+@register(1240, 'orbit')
 class gal_orbit:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        unpack_bits = bit_layouts.unpack(header, message)           
         
         self.gnss = 'Galileo'
         self.gnss_short = 'E'
@@ -2837,70 +2703,50 @@ class gal_orbit:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization
-        GAL_ID  = []
-        GAL_IOD = []
-        p       = []
-            
-        D_r = []
-        D_t = []
-        D_n = []
-            
-        dot_D_r = []
-        dot_D_t = []
-        dot_D_n = []
-            
-        bit_sat = self.n_sat * 'u6u10s22s20s20s21s19s19' 
-        bit_GAL_check = self.n_sat * 'u6u1u9s22s20s20s21s19s19'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-        E_check = bitstruct.unpack(header + bit_GAL_check, message)
-        for i in range(self.n_sat): 
-        # Galileo ID number,   
-            if s_unpack[8 * i +  9] < 10:
-                GAL_ID = np.append(GAL_ID, '0' + f'{s_unpack[8 * i + 9]}')
-            else:
-                GAL_ID = np.append(GAL_ID, f'{s_unpack[8 * i + 9]}')
-                
-            # Galileo IOD: Issue Of Data of Galileo ephemeris to reference 
-            GAL_IOD = np.append(GAL_IOD, s_unpack[8 * i + 10])
-    
-            p = np.append(p, E_check[9 * i + 11])
-                   
-            # Delta radial (printed in [m])
-            D_r = np.append(D_r, s_unpack[8 * i + 11] * 0.1 * 10 ** (-3))
-            # Delta along-track (printed in [m])
-            D_t = np.append(D_t, s_unpack[8 * i + 12] * 0.4 * 10 ** (-3))
-            # Delta cross-track (printed in [m]
-            D_n = np.append(D_n, s_unpack[8 * i + 13] * 0.4 * 10 ** (-3))
-            
-            # Dot delta radial (printed in [mm/s])
-            dot_D_r = np.append(dot_D_r, s_unpack[8 * i + 14] * 0.001)
-            # Dot delta along-track (printed in [mm/s])
-            dot_D_t = np.append(dot_D_t, s_unpack[8 * i + 15] * 0.004)
-            # Dot delta along-track (printed in [mm/s])
-            dot_D_n = np.append(dot_D_n, s_unpack[8 * i + 16] * 0.004)
-    
-        self.dr = D_r
-        self.dt = D_t
-        self.dn = D_n
-        self.dot_dr = dot_D_r
-        self.dot_dt = dot_D_t
-        self.dot_dn = dot_D_n
-        
-        self.gnss_id = GAL_ID
-        self.gnss_iod = GAL_IOD
+        # satellite parameters, one row per satellite
+        bit_sat = self.n_sat * 'u6u10s22s20s20s21s19s19'
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 9, 8, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=ORBIT_DTYPE)
+        # Galileo ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # IOD of the Galileo ephemeris referenced by the corrections
+        sat['gnss_iod'] = rows[:, 1]
+        # first bit of the IOD
+        sat['p'] = rows[:, 1] >> 9
+        # Delta radial, along-track and cross-track, printed in [m]
+        sat['dr'] = rows[:, 2] * 0.1 * 10 ** (-3)
+        sat['dt'] = rows[:, 3] * 0.4 * 10 ** (-3)
+        sat['dn'] = rows[:, 4] * 0.4 * 10 ** (-3)
+        # Dot delta radial, along-track and cross-track, printed in [mm/s]
+        sat['dot_dr'] = rows[:, 5] * 0.001
+        sat['dot_dt'] = rows[:, 6] * 0.004
+        sat['dot_dn'] = rows[:, 7] * 0.004
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.gnss_iod = sat['gnss_iod']
+        self.p = sat['p']
+        self.dr = sat['dr']
+        self.dt = sat['dt']
+        self.dn = sat['dn']
+        self.dot_dr = sat['dot_dr']
+        self.dot_dt = sat['dot_dt']
+        self.dot_dn = sat['dot_dn']
         
 # *************************************************************************** #
 #                                                                             #
 #                   Galileo Clock Correction Message Type 1241                #
 #                                                                             #
 # *************************************************************************** #
+@register(1241, 'clock')
 class gal_clock:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        unpack_bits = bit_layouts.unpack(header, message)           
         
         self.gnss = 'Galileo'
         self.gnss_short = 'E'
@@ -2941,43 +2787,38 @@ class gal_clock:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization 
-        GAL_ID  = []
-                        
-        D_C0 = []
-        D_C1 = []
-        D_C2 = []  
-
-        bit_sat  = self.n_sat * 'u6s22s21s27'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-        for i in range(self.n_sat):
-            # Galileo ID number     
-            if s_unpack[4 * i + 8] < 10:
-                GAL_ID = np.append(GAL_ID, '0' + f'{s_unpack[4 * i + 8]}')
-            else:
-                GAL_ID = np.append(GAL_ID, f'{s_unpack[4 * i + 8]}')
-            # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s**2])
-            D_C0 = np.append(D_C0, s_unpack[4 * i +  9] * 0.1)  
-            D_C1 = np.append(D_C1, s_unpack[4 * i + 10] * 0.001  )  
-            D_C2 = np.append(D_C2, s_unpack[4 * i + 11] * 0.00002)  
-
-        self.dc0 = D_C0
-        self.dc1 = D_C1
-        self.dc2 = D_C2
-        
-        self.gnss_id = GAL_ID
+        # satellite parameters, one row per satellite
+        bit_sat = self.n_sat * 'u6s22s21s27'
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 4, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=CLOCK_DTYPE)
+        # Galileo ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s^2])
+        sat['dc0'] = rows[:, 1] * 0.1
+        sat['dc1'] = rows[:, 2] * 0.001
+        sat['dc2'] = rows[:, 3] * 0.00002
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.dc0 = sat['dc0']
+        self.dc1 = sat['dc1']
+        self.dc2 = sat['dc2']
             
 # *************************************************************************** #
 #                                                                             #
 #                   SSR Galileo Code Bias Message Type 1242                   #
 #                                                                             #
 # *************************************************************************** #
+@register(1242, 'code_bias')
 class gal_code_bias:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        cursor = bit_layouts.BitCursor(message)
+        unpack_bits = cursor.read(header)
         self.gnss = 'Galileo'
         self.gnss_short = 'E'
         # **************************** Parameters *************************** #
@@ -3016,76 +2857,53 @@ class gal_code_bias:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization 
-        GAL_ID  = []
-        n_bias = []
-                        
-        S_TMI = []
-        types = []
-        Cd_bias = []
-        cdb = 0
-        bit_sat_0 = 'u6u5'
-        bit_sat   = bit_sat_0
-        for i in range(self.n_sat):
-            s_unpack = bitstruct.unpack(header + bit_sat, message)
-            # Galileo ID number,       
-            if s_unpack[2 * i + 2 * cdb + 8] < 10:
-                GAL_ID = np.append(GAL_ID, '0' +
-                                   f'{s_unpack[2 * i + 2 * cdb + 8]}')
-            else:
-                GAL_ID = np.append(GAL_ID,
-                                   f'{s_unpack[2 * i + 2 * cdb + 8]}')
-                
-            # number of signals
-            n_bias = np.append(n_bias, s_unpack[2 * i + 2 * cdb + 9])
-                
-            # ********************************************************* #
-            #                                                           # 
-            #                   Signal part                             #
-            #                                                           #
-            # ********************************************************* #                
-            bit_sig_0 = 'u5s14'
-            bit_sig   = bit_sig_0  
-            S_TMI.append([])
-            Cd_bias.append([])
-            types.append([])
-
-            for j in range(s_unpack[2 * i + 2 * cdb + 9]):
-                sig_unpack = bitstruct.unpack(header + bit_sat +
-                                              bit_sig, message)
-            # Signal and tracking mode identifier   
-                GNSS_ID = 'Galileo'
-                types[i].append(sig_unpack[2 * i + 2 * cdb +  2 * j + 10])               
-                S_TMI[i].append(signalID.signals(GNSS_ID, 
-                                sig_unpack[2 * i + 2 * cdb +  2 * j + 10]))
-            # signal code bis
-                Cd_bias[i].append(sig_unpack[2 * i + 2 * cdb +
-                                             2 * j + 11] * 0.01)
-                                            
-                if j < s_unpack[2 * i + 2 * cdb + 9] - 1: 
-                    bit_sig = bit_sig + bit_sig_0
-                            
-            cdb = cdb + s_unpack[2 * i + 2 * cdb + 9]               
-            bit_sat = bit_sat + bit_sig + bit_sat_0                       
-            
-            self.number = n_bias
-            self.name = S_TMI
-            self.track = types
-            self.bias  = Cd_bias
-            
-            self.gnss_id = GAL_ID
+        # satellite parameters initialization
+        sat = np.zeros(self.n_sat, dtype=CODE_BIAS_DTYPE)
+        track  = []
+        bias   = []
+        name   = []
+
+        for i in range(self.n_sat):
+            s_unpack = cursor.read('u6u5')
+            # Galileo ID number
+            sat['gnss_id'][i] = sat_id(s_unpack[0])
+            # N. of Code Biases Processed, DF379, Range: 0-31, Res: 1
+            sat['number'][i] = s_unpack[1]
+            track.append([])
+            bias.append([])
+            name.append([])
+            # the signals of the satellite are read together
+            t_unpack = cursor.read(s_unpack[1] * 'u5s14')
+            for j in range(s_unpack[1]):
+            # Track indicator, DF380, Range: 0-31, Res: 1
+                track[i].append(t_unpack[2 * j])
+            # Signal name
+                GNSS = 'Galileo'
+                name[i].append(signalID.signals(GNSS, t_unpack[2 * j]))
+            # Code bias, DF383, Range: +-81.91[m], Res: 0.01[m]
+                bias[i].append(t_unpack[2 * j + 1] * 0.01)
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.number = sat['number']
+        self.track = track
+        self.name  = name
+        self.bias = bias
+        self.biases = bias_index(self.gnss_id, name, bias)
             
 # *************************************************************************** #
 #                                                                             #
 #    Galileo SSR combined Orbit and Clock Correction Message Type 1243        #
 #                                                                             #
 # *************************************************************************** #
+@register(1243, 'orbit_clock')
 class gal_orbit_clock:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        unpack_bits = bit_layouts.unpack(header, message)           
         self.gnss = 'Galileo'
         self.gnss_short = 'E'
         
@@ -3127,84 +2945,56 @@ class gal_orbit_clock:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization
-        GAL_ID  = []
-        GAL_IOD = []
-            
-        p = []
-            
-        D_r = []
-        D_t = []
-        D_n = []
-            
-        dot_D_r = []
-        dot_D_t = []
-        dot_D_n = []
-            
-        D_C0 = []
-        D_C1 = []
-        D_C2 = []
-            
+        # satellite parameters, one row per satellite
         bit_sat = self.n_sat * 'u6u10s22s20s20s21s19s19s22s21s27'
-        bit_GAL_check = self.n_sat * 'u6u1u9s22s20s20s21s19s19s22s21s27'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-        E_check = bitstruct.unpack(header + bit_GAL_check, message)
-        for i in range(self.n_sat):
-        # Galileo ID number,       
-            if s_unpack[11 * i + 9] < 10:
-                GAL_ID = np.append(GAL_ID, '0' + f'{s_unpack[11 * i + 9]}')
-            else:
-                GAL_ID = np.append(GAL_ID, f'{s_unpack[11 * i + 9]}')
-                    
-            # Galileo IOD: Issue Of Data of Galileoephemeris to reference 
-            # the geometric gradients 
-            GAL_IOD = np.append(GAL_IOD, s_unpack[11 * i + 10])
-                
-            p = np.append(p, E_check[12 * i + 10])               
-                   
-            # Delta radial (printed in [m])
-            D_r = np.append(D_r, s_unpack[11 * i + 11] * 0.1 * 10 ** (-3))
-            # Delta along-track (printed in [m])
-            D_t = np.append(D_t, s_unpack[11 * i + 12] * 0.4 * 10 ** (-3))
-            # Delta cross-track (printed in [m])
-            D_n = np.append(D_n, s_unpack[11 * i + 13] * 0.4 * 10 ** (-3))
-            
-            # Dot delta radial (printed in [mm/s])
-            dot_D_r = np.append(dot_D_r, s_unpack[11 * i + 14] * 0.001)
-            # Dot delta along-track (printed in [mm/s])
-            dot_D_t = np.append(dot_D_t, s_unpack[11 * i + 15] * 0.004)
-            # Dot delta along-track (printed in [mm/s])
-            dot_D_n = np.append(dot_D_n, s_unpack[11 * i + 16] * 0.004)
-            
-            # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s**2])
-            D_C0 = np.append(D_C0, s_unpack[11 * i + 17] * 0.1    )  
-            D_C1 = np.append(D_C1, s_unpack[11 * i + 18] * 0.001  )  
-            D_C2 = np.append(D_C2, s_unpack[11 * i + 19] * 0.00002)  
-
-        self.dr = D_r
-        self.dt = D_t
-        self.dn = D_n
-        self.dot_dr = dot_D_r
-        self.dot_dt = dot_D_t
-        self.dot_dn = dot_D_n
-        self.dc0 = D_C0
-        self.dc1 = D_C1
-        self.dc2 = D_C2
-        
-        self.gnss_id = GAL_ID
-        self.gnss_iod = GAL_IOD
-        self.p = p
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 9, 11, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=ORBIT_CLOCK_DTYPE)
+        # Galileo ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # IOD of the Galileo ephemeris referenced by the corrections
+        sat['gnss_iod'] = rows[:, 1]
+        # first bit of the IOD
+        sat['p'] = rows[:, 1] >> 9
+        # Delta radial, along-track and cross-track, printed in [m]
+        sat['dr'] = rows[:, 2] * 0.1 * 10 ** (-3)
+        sat['dt'] = rows[:, 3] * 0.4 * 10 ** (-3)
+        sat['dn'] = rows[:, 4] * 0.4 * 10 ** (-3)
+        # Dot delta radial, along-track and cross-track, printed in [mm/s]
+        sat['dot_dr'] = rows[:, 5] * 0.001
+        sat['dot_dt'] = rows[:, 6] * 0.004
+        sat['dot_dn'] = rows[:, 7] * 0.004
+        # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s^2])
+        sat['dc0'] = rows[:, 8] * 0.1
+        sat['dc1'] = rows[:, 9] * 0.001
+        sat['dc2'] = rows[:, 10] * 0.00002
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.gnss_iod = sat['gnss_iod']
+        self.p = sat['p']
+        self.dr = sat['dr']
+        self.dt = sat['dt']
+        self.dn = sat['dn']
+        self.dot_dr = sat['dot_dr']
+        self.dot_dt = sat['dot_dt']
+        self.dot_dn = sat['dot_dn']
+        self.dc0 = sat['dc0']
+        self.dc1 = sat['dc1']
+        self.dc2 = sat['dc2']
 # *************************************************************************** #
 #                                                                             #
 #                     SSR Galileo URA Message Type 1244                       #
 #                                                                             #
 # *************************************************************************** #   
+@register(1244, 'ura')
 class gal_ura:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        unpack_bits = bit_layouts.unpack(header, message)
         
         self.gnss = 'Galileo'
         self.gnss_short = 'E'
@@ -3242,56 +3032,42 @@ class gal_ura:
         #                            Satellite part                           #
         #                                                                     #
         # ******************************************************************* # 
-        # satellite parameters initialization
-        GAL_ID = []
-        URA    = []
-        URA_CLASS = []
-        URA_VALUE = []
-                           
-        bit_sat = self.n_sat * 'u5u3u3' 
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
+        # satellite parameters, one row per satellite
+        bit_sat = self.n_sat * 'u5u3u3'
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 3, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=URA_DTYPE)
+        # Galileo ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # URA class and value, URA printed in [m]
+        sat['ura_class'] = rows[:, 1]
+        sat['ura_value'] = rows[:, 2]
+        sat['ura'] = (3 ** rows[:, 1] * (1 + rows[:, 2] / 4) - 1) / 1000
         for i in range(self.n_sat):
-        # Galileo SSR ID number       
-            if s_unpack[3 * i + 8] < 10: 
-                GAL_ID = np.append(GAL_ID, '0' + f'{s_unpack[3 * i + 8]}')
-            else:
-                GAL_ID = np.append(GAL_ID, f'{s_unpack[3 * i + 8]}')
-                
-            # SSR URA
-            # URA_CLASS 
-            Class = s_unpack[3 * i + 9]
-            URA_CLASS = np.append(URA_CLASS, Class)
-
-            # URA_VALUE 
-            Value = s_unpack[3 * i + 10]
-            URA_VALUE = np.append(URA_VALUE, Value)
-
-            if (Value == 0) & (Class == 0):
+            if (rows[i, 2] == 0) & (rows[i, 1] == 0):
                 print('URA undefined/unknown')
-            elif (Value == 7) & (Class == 7):
+            elif (rows[i, 2] == 7) & (rows[i, 1] == 7):
                 print('URA > 5466.5 [mm]')
-            # The URA is computed by the following expression:
-            # Printed in [m]
-            URA = np.append(URA, (3 ** (Class) * (1 + Value / 4) -
-                                  1) / 1000)                
-        
-        self.ura = URA
-        self.ura_class = URA_CLASS
-        self.ura_value = URA_VALUE
-        
-        self.gnss_id = GAL_ID
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.ura_class = sat['ura_class']
+        self.ura_value = sat['ura_value']
+        self.ura = sat['ura']
     
 # *************************************************************************** #
 #                                                                             #
 #             SSR Galileo High Rate Clock Correction Message Type 1245        #
 #                                                                             #
 # *************************************************************************** #
+@register(1245, 'hr_clock')
 class gal_hr_clock:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        unpack_bits = bit_layouts.unpack(header, message)
         
         self.gnss = 'Galileo'
         self.gnss_short = 'E'
@@ -3330,30 +3106,28 @@ class gal_hr_clock:
         #                                                                     #
         # ******************************************************************* # 
         
-        # satellite parameters initialization
-        GAL_ID   = []
-        HR_clock = []
-                           
+        # satellite parameters, one row per satellite
         bit_sat = self.n_sat * 'u6s22'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-        for i in range(self.n_sat):
-            # Galileo ID number       
-            if s_unpack[2 * i + 8] < 10:
-                GAL_ID = np.append(GAL_ID, '0' + f'{s_unpack[2 * i + 8]}')
-            else:
-                GAL_ID = np.append(GAL_ID, f'{s_unpack[2 * i + 8]}')
-                    
-            # High-rate clock correction
-            HR_clock = np.append(HR_clock, s_unpack[2 * i +
-                                                        9] * 0.1 * 1e-3)             
-        self.gnss_id = GAL_ID
-        self.hr_clk = HR_clock
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 2, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=HR_CLOCK_DTYPE)
+        # Galileo ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # High-rate clock correction [m]
+        sat['hr_clock'] = rows[:, 1] * 0.1 * 1e-3
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.hr_clock = sat['hr_clock']
+        self.hr_clk = sat['hr_clock']
         
 # *************************************************************************** #
 #                                                                             #
 #                    SSR Galileo Phase Bias Message 1267                      #
 #                                                                             #
 # *************************************************************************** #
+@register(1267, 'phase_bias')
 class gal_phase_bias:
     def __init__(self, message):
         # SSR User Range Accuracy (URA) (1 sigma)
@@ -3361,7 +3135,8 @@ class gal_phase_bias:
         header = 'u12u20u4u1u4u16u4u1u1u6'
             
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        cursor = bit_layouts.BitCursor(message)
+        unpack_bits = cursor.read(header)
         self.gnss = 'Galileo'
         self.gnss_short = 'E'
         
@@ -3407,46 +3182,27 @@ class gal_phase_bias:
         # ******************************************************************* # 
         
         # satellite parameters initialization
-        GAL_ID = []
-        num_phase = []
-        yaw_angle = []
-        yaw_rate = []
-            
+        sat = np.zeros(self.n_sat, dtype=PHASE_BIAS_DTYPE)
+
         track = []
         signal_int = []
         signal_WL = []
+        signal_name = []
         signal_dis = []
         phase_bias = []
-        signal_name = [] 
-        n_types = 0
-        bit_sat   = 'u6u5u9s8'  
-           
+
         for i in range(self.n_sat):
-            s_unpack = bitstruct.unpack(header + bit_sat, message)
-            
-            # Galileo sat ID number 
-            if s_unpack[4 * i + 5 * n_types + 10] < 10:
-                GAL_ID = np.append(GAL_ID, '0' +
-                                   f'{s_unpack[4 * i + 5 * n_types + 10]}')
-            else:
-                GAL_ID = np.append(GAL_ID,
-                                   f'{s_unpack[4 * i + 5 * n_types + 10]}')    
+            s_unpack = cursor.read('u6u5u9s8')
+            # Galileo sat ID number
+            sat['gnss_id'][i] = sat_id(s_unpack[0])
             # N. of Phase Biases Processed
-            num_phase = np.append(num_phase,
-                                  s_unpack[4 * i + 5 * n_types + 11])
-                
+            sat['number'][i] = s_unpack[1]
             # Yaw Angle
             # Printed in [deg]
-            yaw_angle = np.append(yaw_angle,
-                                  (s_unpack[4 * i + 5 * n_types +
-                                            12] * 1 / 256) * 180)
-            
+            sat['yaw_angle'][i] = (s_unpack[2] * 1 / 256) * 180
             # Yaw Rate
             # Printed in [deg/s]
-            yaw_rate = np.append(yaw_rate, 
-                                 (s_unpack[4 * i + 5 * n_types +
-                                           13] * 1 / 8192) * 180)
-
+            sat['yaw_rate'][i] = (s_unpack[3] * 1 / 8192) * 180
         # ******************************************************************* #
         #                                                                     # 
         #            Phase specific part of the satellite considered          #
@@ -3456,59 +3212,40 @@ class gal_phase_bias:
             track.append([])
             signal_int.append([])
             signal_WL.append([])
-            signal_dis.append([])
             signal_name.append([])
+            signal_dis.append([])
             phase_bias.append([])
-                
-            bit_phase = 'u5u1u2u4s20' 
-
-            for j in range(s_unpack[4 * i + 5 * n_types + 11]):
-                p_unpack = bitstruct.unpack(header +
-                                            bit_sat + bit_phase, message)
-            
+            # the signals of the satellite are read together
+            p_unpack = cursor.read(s_unpack[1] * 'u5u1u2u4s20')
+            for j in range(s_unpack[1]):
             # Track indicator
-                track[i].append(p_unpack[4 * i + 5 * n_types + 14 + j * 5])
+                track[i].append(p_unpack[5 * j])
             # Signal_name:
                 GNSS_ID = 'Galileo'
                 signal_name[i].append(signalID.signals(GNSS_ID,
-                                                       p_unpack[4 * i +
-                                                                5 * 
-                                                                n_types +
-                                                                14 +
-                                                                j * 5]))
+                                                       p_unpack[5 * j]))
             # Signal integer indicator
-                signal_int[i].append(p_unpack[4 * i + 5 * n_types +
-                                              15 + j * 5])
-            
+                signal_int[i].append(p_unpack[5 * j + 1])
             # Signal wide-lane integer indicator
-                signal_WL[i].append(p_unpack[4 * i + 5 * n_types +
-                                             16 + j * 5])
-            
+                signal_WL[i].append(p_unpack[5 * j + 2])
             # Signal discontinuity counter
-                signal_dis[i].append(p_unpack[4 * i + 5 * n_types +
-                                              17 + j * 5])
-            
+                signal_dis[i].append(p_unpack[5 * j + 3])
             # PHASE BIAS
-                phase_bias[i].append(p_unpack[4 * i + 5 * n_types +
-                                              18 + j * 5] * 0.0001)
-
-                if j < s_unpack[4 * i + 5 * n_types + 11] - 1:
-                    bit_phase = bit_phase + 'u5u1u2u4s20'
-                        
-            n_types = n_types + s_unpack[4 * i + 5 * n_types + 11]    
-            bit_sat = bit_sat + bit_phase  + 'u6u5u9s8'
-            
-        self.number = num_phase
+                phase_bias[i].append(p_unpack[5 * j + 4] * 0.0001)
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.number = sat['number']
+        self.yaw_angle = sat['yaw_angle']
+        self.yaw_rate = sat['yaw_rate']
         self.track = track
         self.name = signal_name
         self.bias = phase_bias
+        self.biases = bias_index(self.gnss_id, signal_name, phase_bias)
         self.sig_wl = signal_WL
-        self.sig_i  = signal_int
         self.sig_dis = signal_dis
-        
-        self.gnss_id = GAL_ID
-        self.yaw_angle = yaw_angle
-        self.yaw_rate = yaw_rate
+        self.sig_i = signal_int
 
 # =============================================================================
 #                                   BeiDou
@@ -3519,6 +3256,7 @@ class gal_phase_bias:
 #                      Beidou Satellite Ephemeris Type 1042                   #
 #                                                                             #
 # *************************************************************************** #
+@register(1042, 'kepler_ephemeris')
 class bds_ephemeris:
     def __init__(self, message):
         # Define constants
@@ -3527,7 +3265,7 @@ class bds_ephemeris:
         contents = 'u12u6u13u4s14u5u17s11s22s24u5s18s16s32s18u32s18u32u17' + \
                    's18s32s18s32s18s32s24s10s10u1'
         
-        unpack_bits = bitstruct.unpack(contents, message)
+        unpack_bits = bit_layouts.unpack(contents, message)
         
         self.gnss = 'BDS'
         self.gnss_short = 'C'
@@ -3634,12 +3372,13 @@ class bds_ephemeris:
 #                   Beidou SSR Orbit Correction Message Type 1258             #
 #                                                                             #
 # *************************************************************************** #
+@register(1258, 'orbit')
 class bds_orbit:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        unpack_bits = bit_layouts.unpack(header, message)           
         
         self.gnss = 'BDS'
         self.gnss_short = 'C'
@@ -3678,76 +3417,50 @@ class bds_orbit:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization
-        BDS_ID  = []
-        BDS_IOD = []
-        BDS_toe = []
-            
-        D_r = []
-        D_t = []
-        D_n = []
-            
-        dot_D_r = []
-        dot_D_t = []
-        dot_D_n = []
-            
-        bit_sat = self.n_sat * 'u6u10u8s22s20s20s21s19s19' 
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-            
-        for i in range(self.n_sat): 
-            # Beidou ID number,       
-            if s_unpack[9 * i + 8] < 10:
-                BDS_ID = np.append(BDS_ID, '0' + f'{s_unpack[9 * i + 8]}')
-            else:
-                BDS_ID = np.append(BDS_ID, f'{s_unpack[9 * i + 8]}')
-                
-            # Beidou toe Modulo 
-            BDS_toe = np.append(BDS_toe, s_unpack[9 * i + 9] * 8)
-            # Beidou IOD: Issue Of Data Beidou ephemeris to reference 
-            BDS_IOD = np.append(BDS_IOD, s_unpack[9 * i + 10])
-            # Delta radial
-            # Printed in [m]
-            D_r = np.append(D_r, s_unpack[9 * i + 11] * 0.1 * 10 ** (-3))
-            
-            # Delta along-track
-            # Printed in [m]
-            D_t = np.append(D_t, s_unpack[9 * i + 12] * 0.4 * 10 ** (-3))
-            
-            # Delta cross-track
-            # Printed in [m]
-            D_n = np.append(D_n, s_unpack[9 * i + 13] * 0.4 * 10 ** (-3))
-            
-            # Dot delta radial
-            # Printed in [mm/s]
-            dot_D_r = np.append(dot_D_r, s_unpack[9 * i + 14] * 0.001)
-            
-            # Dot delta along-track
-            # Printed in [mm/s]
-            dot_D_t = np.append(dot_D_t, s_unpack[9 * i + 15] * 0.004)
-                
-            # Dot delta along-track
-            # Printed in [mm/s]
-            dot_D_n = np.append(dot_D_n, s_unpack[9 * i + 16] * 0.004)
-
-            self.gnss_id = BDS_ID
-            self.gnss_iod = BDS_IOD
-            self.toe = BDS_toe
-            
-            self.dr = D_r
-            self.dn = D_n
-            self.dt = D_t
+        # satellite parameters, one row per satellite
+        bit_sat = self.n_sat * 'u6u10u8s22s20s20s21s19s19'
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 9, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=BDS_ORBIT_DTYPE)
+        # Beidou ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # Toe of the Beidou ephemeris [s]
+        sat['toe'] = rows[:, 1] * 8
+        # IOD of the Beidou ephemeris referenced by the corrections
+        sat['gnss_iod'] = rows[:, 2]
+        # Delta radial, along-track and cross-track, printed in [m]
+        sat['dr'] = rows[:, 3] * 0.1 * 10 ** (-3)
+        sat['dt'] = rows[:, 4] * 0.4 * 10 ** (-3)
+        sat['dn'] = rows[:, 5] * 0.4 * 10 ** (-3)
+        # Dot delta radial, along-track and cross-track, printed in [mm/s]
+        sat['dot_dr'] = rows[:, 6] * 0.001
+        sat['dot_dt'] = rows[:, 7] * 0.004
+        sat['dot_dn'] = rows[:, 8] * 0.004
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.toe = sat['toe']
+        self.gnss_iod = sat['gnss_iod']
+        self.dr = sat['dr']
+        self.dt = sat['dt']
+        self.dn = sat['dn']
+        self.dot_dr = sat['dot_dr']
+        self.dot_dt = sat['dot_dt']
+        self.dot_dn = sat['dot_dn']
             
 # *************************************************************************** #
 #                                                                             #
 #                   Beidou Clock Correction Message Type 1259                 #
 #                                                                             #
 # *************************************************************************** #
+@register(1259, 'clock')
 class bds_clock:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        unpack_bits = bit_layouts.unpack(header, message)           
         
         self.gnss = 'BDS'
         self.gnss_short = 'C'
@@ -3786,44 +3499,38 @@ class bds_clock:
         #                            Satellite part                           #
         #                                                                     #
         # ******************************************************************* #                     
-        # satellite parameters initialization 
-        BDS_ID  = []                        
-        D_C0 = []
-        D_C1 = []
-        D_C2 = []  
-
+        # satellite parameters, one row per satellite
         bit_sat = self.n_sat * 'u6s22s21s27'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-                
-        for i in range(self.n_sat):
-            # Beidou ID number
-            if s_unpack[4 * i + 8] < 10:
-                BDS_ID = np.append(BDS_ID, '0' + f'{s_unpack[4 * i + 8]}')
-            else:
-                BDS_ID = np.append(BDS_ID, f'{s_unpack[4 * i + 8]}')
-                
-            # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s**2])
-            D_C0 = np.append(D_C0, s_unpack[4 * i +  9] * 0.1)  
-            D_C1 = np.append(D_C1, s_unpack[4 * i + 10] * 0.001  )  
-            D_C2 = np.append(D_C2, s_unpack[4 * i + 11] * 0.00002)  
-    
-        self.gnss_id = BDS_ID
-        
-        self.dc0 = D_C0
-        self.dc1 = D_C1
-        self.dc2 = D_C2
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 4, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=CLOCK_DTYPE)
+        # Beidou ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s^2])
+        sat['dc0'] = rows[:, 1] * 0.1
+        sat['dc1'] = rows[:, 2] * 0.001
+        sat['dc2'] = rows[:, 3] * 0.00002
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.dc0 = sat['dc0']
+        self.dc1 = sat['dc1']
+        self.dc2 = sat['dc2']
             
 # *************************************************************************** #
 #                                                                             #
 #                   SSR Beidou Code Bias Message Type 1260                    #
 #                                                                             #
 # *************************************************************************** #
+@register(1260, 'code_bias')
 class bds_code_bias:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        cursor = bit_layouts.BitCursor(message)
+        unpack_bits = cursor.read(header)
         
         self.gnss = 'BDS'
         self.gnss_short = 'C'
@@ -3860,75 +3567,53 @@ class bds_code_bias:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization 
-        n_bias = []
-        BDS_ID = []
-        S_TMI = []
-        types = []
-        Cd_bias = []
-        cdb = 0
-        bit_sat_0 = 'u6u5'
-        bit_sat   = bit_sat_0
-        
+        # satellite parameters initialization
+        sat = np.zeros(self.n_sat, dtype=CODE_BIAS_DTYPE)
+        track  = []
+        bias   = []
+        name   = []
+
         for i in range(self.n_sat):
-            s_unpack = bitstruct.unpack(header + bit_sat, message)
+            s_unpack = cursor.read('u6u5')
             # Beidou ID number
-            if s_unpack[2 * i + 2 * cdb + 8] < 10:
-                BDS_ID = np.append(BDS_ID, '0' + 
-                                   f'{s_unpack[2 * i + 2 * cdb + 8]}')
-            else:
-                BDS_ID = np.append(BDS_ID,
-                                   f'{s_unpack[2 * i + 2 * cdb + 8]}')
-                
-            # number of signals
-            n_bias = np.append(n_bias, s_unpack[2 * i + 2 * cdb + 9])
-                
-            # ********************************************************* #
-            #                                                           # 
-            #                   Signal part                             #
-            #                                                           #
-            # ********************************************************* #                
-            bit_sig_0 = 'u5s14'
-            bit_sig   = bit_sig_0  
-            S_TMI.append([])
-            Cd_bias.append([])
-            types.append([])
-                
-            for j in range(s_unpack[2 * i + 2 * cdb + 9]):
-                sig_unpack = bitstruct.unpack(header + bit_sat +
-                                              bit_sig, message)
-                # Signal and tracking mode identifier   
-                GNSS_ID = 'BDS'
-                S_TMI[i].append(signalID.signals(GNSS_ID,
-                                sig_unpack[2 * i + 2 * cdb +  2 * j + 10]))
-                types[i].append(sig_unpack[2 * i + 2 * cdb +  2 * j + 10])
-                # signal code bis
-                Cd_bias[i].append(sig_unpack[2 * i + 2 * cdb + 
-                                   2 * j + 11] * 0.01)
-                                            
-                if j < s_unpack[2 * i + 2 * cdb + 9] - 1:
-                            bit_sig = bit_sig + bit_sig_0
-                            
-            cdb = cdb + s_unpack[2 * i + 2 * cdb + 9]               
-            bit_sat = bit_sat + bit_sig + bit_sat_0                       
-            
-            self.gnss_id = BDS_ID
-            self.number = n_bias
-            self.track = types
-            self.name = S_TMI
-            self.bias = Cd_bias
+            sat['gnss_id'][i] = sat_id(s_unpack[0])
+            # N. of Code Biases Processed, DF379, Range: 0-31, Res: 1
+            sat['number'][i] = s_unpack[1]
+            track.append([])
+            bias.append([])
+            name.append([])
+            # the signals of the satellite are read together
+            t_unpack = cursor.read(s_unpack[1] * 'u5s14')
+            for j in range(s_unpack[1]):
+            # Track indicator, DF380, Range: 0-31, Res: 1
+                track[i].append(t_unpack[2 * j])
+            # Signal name
+                GNSS = 'BDS'
+                name[i].append(signalID.signals(GNSS, t_unpack[2 * j]))
+            # Code bias, DF383, Range: +-81.91[m], Res: 0.01[m]
+                bias[i].append(t_unpack[2 * j + 1] * 0.01)
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.number = sat['number']
+        self.track = track
+        self.name  = name
+        self.bias = bias
+        self.biases = bias_index(self.gnss_id, name, bias)
             
 # *************************************************************************** #
 #                                                                             #
 #    SSR Beidou combined Orbit and Clock Correction Message Type 1261         #
 #                                                                             #
 # *************************************************************************** #
+@register(1261, 'orbit_clock')
 class bds_orbit_clock:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        unpack_bits = bit_layouts.unpack(header, message)           
         
         self.gnss = 'BDS'
         self.gnss_short = 'C'
@@ -3969,95 +3654,57 @@ class bds_orbit_clock:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization
-        BDS_ID  = []
-        BDS_IOD = []
-            
-        BDS_toe = []
-            
-        D_r = []
-        D_t = []
-        D_n = []
-            
-        dot_D_r = []
-        dot_D_t = []
-        dot_D_n = []
-            
-        D_C0 = []
-        D_C1 = []
-        D_C2 = []
-            
+        # satellite parameters, one row per satellite
         bit_sat = self.n_sat * 'u6u10u8s22s20s20s21s19s19s22s21s27'
-            
-        # number of parameters
-        n = 12
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-            
-        for i in range(self.n_sat):      
-            # Beidou ID number
-            if s_unpack[n * i + 9] < 10:
-                BDS_ID = np.append(BDS_ID, '0' + f'{s_unpack[n * i + 9]}')
-            else:
-                BDS_ID = np.append(BDS_ID, f'{s_unpack[n * i + 9]}')
-            # BDS toe Modulo
-            BDS_toe = np.append(BDS_toe, s_unpack[n * i + 10] * 8)
-            # Beidou IOD: Issue Of Data of QZSS ephemeris to reference 
-            # the geometric gradients 
-            BDS_IOD = np.append(BDS_IOD, s_unpack[n * i + 11])
-                   
-            # Delta radial 
-            # Printed in [m]
-            D_r = np.append(D_r, s_unpack[n * i + 12] * 0.1 * 10 ** (-3))
-            
-            # Delta along-track
-            # Printed in [m]
-            D_t = np.append(D_t, s_unpack[n * i + 13] * 0.4 * 10 ** (-3))
-            
-            # Delta cross-track
-            # Printed in [m]
-            D_n = np.append(D_n, s_unpack[n * i + 14] * 0.4 * 10 ** (-3))
-            
-            # Dot delta radial
-            # Printed in [mm/s]
-            dot_D_r = np.append(dot_D_r, s_unpack[n * i + 15] * 0.001)
-            
-            # Dot delta along-track
-            # Printed in [mm/s]
-            dot_D_t = np.append(dot_D_t, s_unpack[n * i + 16] * 0.004)
-                
-            # Dot delta along-track
-            # Printed in [mm/s]
-            dot_D_n = np.append(dot_D_n, s_unpack[n * i + 17] * 0.004)
-            
-            # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s**2])
-            D_C0 = np.append(D_C0, s_unpack[n * i + 18] * 0.1    )  
-            D_C1 = np.append(D_C1, s_unpack[n * i + 19] * 0.001  )  
-            D_C2 = np.append(D_C2, s_unpack[n * i + 20] * 0.00002)  
-                                
-            self.gnss_id = BDS_ID
-            self.gnss_iod = BDS_IOD
-            self.toe = BDS_toe
-            self.dr = D_r
-            self.dn = D_n
-            self.dt = D_t
-            self.dot_dr = dot_D_r
-            self.dot_dn = dot_D_n
-            self.dot_dt = dot_D_t
-            self.dc0 = D_C0
-            self.dc1 = D_C1
-            self.dc2 = D_C2
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 9, 12, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=BDS_ORBIT_CLOCK_DTYPE)
+        # Beidou ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # Toe of the Beidou ephemeris [s]
+        sat['toe'] = rows[:, 1] * 8
+        # IOD of the Beidou ephemeris referenced by the corrections
+        sat['gnss_iod'] = rows[:, 2]
+        # Delta radial, along-track and cross-track, printed in [m]
+        sat['dr'] = rows[:, 3] * 0.1 * 10 ** (-3)
+        sat['dt'] = rows[:, 4] * 0.4 * 10 ** (-3)
+        sat['dn'] = rows[:, 5] * 0.4 * 10 ** (-3)
+        # Dot delta radial, along-track and cross-track, printed in [mm/s]
+        sat['dot_dr'] = rows[:, 6] * 0.001
+        sat['dot_dt'] = rows[:, 7] * 0.004
+        sat['dot_dn'] = rows[:, 8] * 0.004
+        # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s^2])
+        sat['dc0'] = rows[:, 9] * 0.1
+        sat['dc1'] = rows[:, 10] * 0.001
+        sat['dc2'] = rows[:, 11] * 0.00002
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.toe = sat['toe']
+        self.gnss_iod = sat['gnss_iod']
+        self.dr = sat['dr']
+        self.dt = sat['dt']
+        self.dn = sat['dn']
+        self.dot_dr = sat['dot_dr']
+        self.dot_dt = sat['dot_dt']
+        self.dot_dn = sat['dot_dn']
+        self.dc0 = sat['dc0']
+        self.dc1 = sat['dc1']
+        self.dc2 = sat['dc2']
                 
 # *************************************************************************** #
 #                                                                             #
 #                     SSR Beidou URA Message Type 1262                        #
 #                                                                             #
 # *************************************************************************** #
+@register(1262, 'ura')
 class bds_ura:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        unpack_bits = bit_layouts.unpack(header, message)
         
         self.gnss = 'BDS'
         self.gnss_short = 'C'
@@ -4095,44 +3742,29 @@ class bds_ura:
         #                                                                     #
         # ******************************************************************* # 
         
-        # satellite parameters initialization
-        BDS_ID = []
-        URA    = []
-        URA_CLASS = []
-        URA_VALUE = []
-                           
+        # satellite parameters, one row per satellite
         bit_sat = self.n_sat * 'u6u3u3'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-            
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 3, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=URA_DTYPE)
+        # Beidou ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # URA class and value, URA printed in [m]
+        sat['ura_class'] = rows[:, 1]
+        sat['ura_value'] = rows[:, 2]
+        sat['ura'] = (3 ** rows[:, 1] * (1 + rows[:, 2] / 4) - 1) / 1000
         for i in range(self.n_sat):
-            # Beidou ID number
-            if s_unpack[3 * i + 8] < 10:
-                BDS_ID = np.append(BDS_ID, '0' + f'{s_unpack[3 * i + 8]}')
-            else:
-                BDS_ID = np.append(BDS_ID, f'{s_unpack[3 * i + 8]}')
-                
-            # SSR URA
-            # URA_CLASS 
-            Class = s_unpack[3 * i + 9]
-            URA_CLASS = np.append(URA_CLASS, Class)
-
-            # URA_VALUE 
-            Value = s_unpack[3 * i + 10]
-            URA_VALUE = np.append(URA_VALUE, Value)
-
-            if (Value == 0) & (Class == 0):
+            if (rows[i, 2] == 0) & (rows[i, 1] == 0):
                 print('URA undefined/unknown')
-            elif (Value == 7) & (Class == 7):
+            elif (rows[i, 2] == 7) & (rows[i, 1] == 7):
                 print('URA > 5466.5 [mm]')
-            # The URA is computed by the following expression:
-            # Printed in [m]
-            URA = np.append(URA, (3 ** (Class) * (1 + Value / 4) -
-                                  1) / 1000)                
-            
-            self.gnss_id = BDS_ID
-            self.ura = URA
-            self.ura_class = URA_CLASS
-            self.ura_value = URA_VALUE
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.ura_class = sat['ura_class']
+        self.ura_value = sat['ura_value']
+        self.ura = sat['ura']
 
 # *************************************************************************** #
 #                                                                             #
@@ -4144,7 +3776,7 @@ class bds_hr_clock:
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        unpack_bits = bit_layouts.unpack(header, message)
         
         self.gnss = 'BDS'
         self.gnss_short = 'C'
@@ -4183,39 +3815,35 @@ class bds_hr_clock:
         #                                                                     #
         # ******************************************************************* # 
         
-        # satellite parameters initialization
-        BDS_ID   = []
-        HR_clock = []
-                           
+        # satellite parameters, one row per satellite
         bit_sat = self.n_sat * 'u6s22'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-            
-        for i in range(self.n_sat):
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 2, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=HR_CLOCK_DTYPE)
         # Beidou ID number
-            if s_unpack[2 * i + 8] < 10:
-                BDS_ID = np.append(BDS_ID, '0' + f'{s_unpack[2 * i + 8]}')
-            else:
-                BDS_ID = np.append(BDS_ID, f'{s_unpack[2 * i + 8]}')
-                
-            # High-rate clock correction
-                HR_clock = np.append(HR_clock,
-                                     s_unpack[2 * i + 9] * 0.1 * 1e-3)             
-                               
-        self.gnss_id = BDS_ID
-        self.hr_clock = HR_clock
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # High-rate clock correction [m]
+        sat['hr_clock'] = rows[:, 1] * 0.1 * 1e-3
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.hr_clock = sat['hr_clock']
            
 # *************************************************************************** #
 #                                                                             #
 #                      Beidou Phase Bias Message Type 1270                    #
 #                                                                             #
 # *************************************************************************** #
+@register(1270, 'phase_bias')
 class bds_phase_bias:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u1u1u6'
             
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        cursor = bit_layouts.BitCursor(message)
+        unpack_bits = cursor.read(header)
         
         self.gnss = 'BDS'
         self.gnss_short = 'C'
@@ -4260,47 +3888,27 @@ class bds_phase_bias:
         # ******************************************************************* # 
         
         # satellite parameters initialization
-        BDS_ID = []
-        num_phase = []
-        yaw_angle = []
-        yaw_rate = []
-            
+        sat = np.zeros(self.n_sat, dtype=PHASE_BIAS_DTYPE)
+
         track = []
         signal_int = []
         signal_WL = []
         signal_name = []
         signal_dis = []
         phase_bias = []
-             
-        n_types = 0
-        bit_sat_0   = 'u6u5u9s8'
-        bit_sat     = bit_sat_0
-            
+
         for i in range(self.n_sat):
-            s_unpack = bitstruct.unpack(header + bit_sat, message)
-            # BDS sat ID number     
-            if s_unpack[4 * i + 5 * n_types + 10] < 10:
-                BDS_ID = np.append(BDS_ID, '0' + 
-                                   f'{s_unpack[4 * i + 5 * n_types + 10]}')
-            else:
-                BDS_ID = np.append(BDS_ID, 
-                                   f'{s_unpack[4 * i + 5 * n_types + 10]}')  
+            s_unpack = cursor.read('u6u5u9s8')
+            # Beidou sat ID number
+            sat['gnss_id'][i] = sat_id(s_unpack[0])
             # N. of Phase Biases Processed
-            num_phase = np.append(num_phase, 
-                                  s_unpack[4 * i + 5 * n_types + 11])
-                
+            sat['number'][i] = s_unpack[1]
             # Yaw Angle
             # Printed in [deg]
-            yaw_angle = np.append(yaw_angle, 
-                                  (s_unpack[4 * i + 
-                                            5 * n_types +
-                                            12] * 1 / 256) * 180)
+            sat['yaw_angle'][i] = (s_unpack[2] * 1 / 256) * 180
             # Yaw Rate
             # Printed in [deg/s]
-            yaw_rate = np.append(yaw_rate, (s_unpack[4 * i + 
-                                                     5 * n_types +
-                                                     13] * 1 / 8192) * 180)
-
+            sat['yaw_rate'][i] = (s_unpack[3] * 1 / 8192) * 180
         # ******************************************************************* #
         #                                                                     # 
         #            Phase specific part of the satellite considered          #
@@ -4313,55 +3921,37 @@ class bds_phase_bias:
             signal_name.append([])
             signal_dis.append([])
             phase_bias.append([])
-                
-            bit_phase_0 = 'u5u1u2u4s20' 
-            bit_phase   = bit_phase_0
-            for j in range(s_unpack[4 * i + 5 * n_types + 11]):
-                p_unpack = bitstruct.unpack(header + 
-                                            bit_sat +
-                                            bit_phase, message)
-
+            # the signals of the satellite are read together
+            p_unpack = cursor.read(s_unpack[1] * 'u5u1u2u4s20')
+            for j in range(s_unpack[1]):
             # Track indicator
-                track[i].append(p_unpack[4 * i + 5 * n_types + 14 + j * 5])
-
+                track[i].append(p_unpack[5 * j])
             # Signal_name:
                 GNSS_ID = 'BDS'
-                signal_name[i].append(signalID.signals(GNSS_ID, 
-                                          p_unpack[4 * i + 
-                                                   5 * n_types + 14 + j * 5]))
-            
+                signal_name[i].append(signalID.signals(GNSS_ID,
+                                                       p_unpack[5 * j]))
             # Signal integer indicator
-                signal_int[i].append(p_unpack[4 * i + 5 * n_types +
-                                              15 + j * 5])
-            
+                signal_int[i].append(p_unpack[5 * j + 1])
             # Signal wide-lane integer indicator
-                signal_WL[i].append(p_unpack[4 * i + 5 * n_types +
-                                             16 + j * 5])
-            
+                signal_WL[i].append(p_unpack[5 * j + 2])
             # Signal discontinuity counter
-                signal_dis[i].append(p_unpack[4 * i + 5 * n_types +
-                                              17 + j * 5])
-            
+                signal_dis[i].append(p_unpack[5 * j + 3])
             # PHASE BIAS
-                phase_bias[i].append(p_unpack[4 * i + 5 * n_types + 18 +
-                                                  j * 5] * 0.0001)
-
-                if j < s_unpack[4 * i + 5 * n_types + 11] - 1:
-                    bit_phase = bit_phase + bit_phase_0
-                        
-            n_types = n_types + s_unpack[4 * i + 5 * n_types + 11]    
-            bit_sat = bit_sat + bit_phase  + bit_sat_0
-
-            self.gnss_id = BDS_ID           
-            self.number = num_phase
-            self.yaw_angle = yaw_angle
-            self.yaw_rate = yaw_rate
-            self.track = track
-            self.name = signal_name
-            self.bias = phase_bias
-            self.sig_wl = signal_WL
-            self.sig_dis = signal_dis
-            self.sig_i = signal_int  
+                phase_bias[i].append(p_unpack[5 * j + 4] * 0.0001)
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.number = sat['number']
+        self.yaw_angle = sat['yaw_angle']
+        self.yaw_rate = sat['yaw_rate']
+        self.track = track
+        self.name = signal_name
+        self.bias = phase_bias
+        self.biases = bias_index(self.gnss_id, signal_name, phase_bias)
+        self.sig_wl = signal_WL
+        self.sig_dis = signal_dis
+        self.sig_i = signal_int
 
 # =============================================================================
 #                                   QZSS
@@ -4372,6 +3962,7 @@ class bds_phase_bias:
 #                        QZSS Satellite Ephemeris Type 1044                   #
 #                                                                             #
 # *************************************************************************** #
+@register(1044, 'kepler_ephemeris')
 class qzs_ephemeris:
     def __init__(self, message):
         # Define constants
@@ -4380,7 +3971,7 @@ class qzs_ephemeris:
         contents = 'u12u4u16s8s16s22u8s16s16s32s16u32s16u32u16s16s32s16s' + \
                    '32s16s32s24s14u2u10u4u6s8u10u1'
         
-        unpack_bits = bitstruct.unpack(contents, message)
+        unpack_bits = bit_layouts.unpack(contents, message)
         
         self.gnss = 'QZSS'
         self.gnss_short = 'J'
@@ -4488,12 +4079,13 @@ class qzs_ephemeris:
 #                   QZSS SSR Orbit Correction Message Type 1246               #
 #                                                                             #
 # *************************************************************************** #
+@register(1246, 'orbit')
 class qzs_orbit:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        unpack_bits = bit_layouts.unpack(header, message)           
         
         self.gnss = 'QZSS'
         self.gnss_short = 'J'
@@ -4533,72 +4125,47 @@ class qzs_orbit:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization
-        QZS_ID  = []
-        QZS_IOD = []
-
-        D_r = []
-        D_t = []
-        D_n = []
-            
-        dot_D_r = []
-        dot_D_t = []
-        dot_D_n = []
-            
-        bit_sat = self.n_sat * 'u4u8s22s20s20s21s19s19' 
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-        n = 8
-        for i in range(self.n_sat):
-            #  ID number,       
-            QZS_ID = np.append(QZS_ID, f'{s_unpack[n * i + 8] + 192}')
-                    
-            #  IOD: Issue Of Data ephemeris to reference 
-            QZS_IOD = np.append(QZS_IOD, s_unpack[n * i + 10])
-                
-            # Delta radial
-            # Printed in [m]
-            D_r = np.append(D_r, s_unpack[n * i + 11] * 0.1 * 10 ** (-3))
-            
-            # Delta along-track
-            # Printed in [m]
-            D_t = np.append(D_t, s_unpack[n * i + 12] * 0.4 * 10 ** (-3))
-            
-            # Delta cross-track
-            # Printed in [m]
-            D_n = np.append(D_n, s_unpack[n * i + 13] * 0.4 * 10 ** (-3))
-            
-            # Dot delta radial
-            # Printed in [mm/s]
-            dot_D_r = np.append(dot_D_r, s_unpack[n * i + 14] * 0.001)
-            
-            # Dot delta along-track
-            # Printed in [mm/s]
-            dot_D_t = np.append(dot_D_t, s_unpack[n * i + 15] * 0.004)
-                
-            # Dot delta along-track
-            # Printed in [mm/s]
-            dot_D_n = np.append(dot_D_n, s_unpack[n * i + 16] * 0.004)
-                
-            self.gnss_id = QZS_ID
-            self.gnss_iod = QZS_IOD
-            self.dr = D_r
-            self.dn = D_n
-            self.dt = D_t
-            self.dot_dr = dot_D_r
-            self.dot_dn = dot_D_n
-            self.dot_dt = dot_D_t
+        # satellite parameters, one row per satellite
+        bit_sat = self.n_sat * 'u4u8s22s20s20s21s19s19'
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 8, self.n_sat, 9)
+        sat = np.zeros(self.n_sat, dtype=ORBIT_DTYPE)
+        # QZSS ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0] + 192)
+        # IOD of the QZSS ephemeris referenced by the corrections
+        sat['gnss_iod'] = rows[:, 2]
+        # Delta radial, along-track and cross-track, printed in [m]
+        sat['dr'] = rows[:, 3] * 0.1 * 10 ** (-3)
+        sat['dt'] = rows[:, 4] * 0.4 * 10 ** (-3)
+        sat['dn'] = rows[:, 5] * 0.4 * 10 ** (-3)
+        # Dot delta radial, along-track and cross-track, printed in [mm/s]
+        sat['dot_dr'] = rows[:, 6] * 0.001
+        sat['dot_dt'] = rows[:, 7] * 0.004
+        sat['dot_dn'] = rows[:, 8] * 0.004
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.gnss_iod = sat['gnss_iod']
+        self.dr = sat['dr']
+        self.dt = sat['dt']
+        self.dn = sat['dn']
+        self.dot_dr = sat['dot_dr']
+        self.dot_dt = sat['dot_dt']
+        self.dot_dn = sat['dot_dn']
             
 # *************************************************************************** #
 #                                                                             #
 #                     QZSS Clock Correction Message Type 1247                 #
 #                                                                             #
 # *************************************************************************** #
+@register(1247, 'clock')
 class qzs_clock:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        unpack_bits = bit_layouts.unpack(header, message)           
         self.gnss = 'QZSS'
         self.gnss_short = 'J'
         
@@ -4636,42 +4203,38 @@ class qzs_clock:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization 
-        QZS_ID  = []
-        D_C0 = []
-        D_C1 = []
-        D_C2 = []  
-
+        # satellite parameters, one row per satellite
         bit_sat = self.n_sat * 'u4s22s21s27'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-        for i in range(self.n_sat):
-            # QZSS ID number       
-            if s_unpack[4 * i + 8] < 10:
-                QZS_ID = np.append(QZS_ID, '0' + f'{s_unpack[4*i +  8]}')
-            else:
-                QZS_ID = np.append(QZS_ID, f'{s_unpack[4*i +  8]}')
-                    
-            # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s**2])
-            D_C0 = np.append(D_C0, s_unpack[4 * i +  9] * 0.1)  
-            D_C1 = np.append(D_C1, s_unpack[4 * i + 10] * 0.001  )  
-            D_C2 = np.append(D_C2, s_unpack[4 * i + 11] * 0.00002)  
-
-        self.gnss = QZS_ID
-        self.dc0 = D_C0
-        self.dc1 = D_C1
-        self.dc2 = D_C2
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 4, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=CLOCK_DTYPE)
+        # QZSS ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s^2])
+        sat['dc0'] = rows[:, 1] * 0.1
+        sat['dc1'] = rows[:, 2] * 0.001
+        sat['dc2'] = rows[:, 3] * 0.00002
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.dc0 = sat['dc0']
+        self.dc1 = sat['dc1']
+        self.dc2 = sat['dc2']
             
 # *************************************************************************** #
 #                                                                             #
 #                   SSR QZSS Code Bias Message Type 1248                      #
 #                                                                             #
 # *************************************************************************** #
+@register(1248, 'code_bias')
 class qzs_code_bias:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        cursor = bit_layouts.BitCursor(message)
+        unpack_bits = cursor.read(header)
         
         # **************************** Parameters *************************** #
         
@@ -4707,78 +4270,53 @@ class qzs_code_bias:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization 
-        QZS_ID  = []
-        n_bias = []
-                        
-        S_TMI = []
-        Cd_bias = []
-        types = []
-        cdb = 0
-        bit_sat_0 = 'u4u5'
-        bit_sat   = bit_sat_0
-        
+        # satellite parameters initialization
+        sat = np.zeros(self.n_sat, dtype=CODE_BIAS_DTYPE)
+        track  = []
+        bias   = []
+        name   = []
+
         for i in range(self.n_sat):
-            s_unpack = bitstruct.unpack(header + bit_sat, message)
-                # QZSS ID number
-            if s_unpack[2 * i + 2 * cdb + 8] < 10:
-                QZS_ID = np.append(QZS_ID, '0' + 
-                                   f'{s_unpack[2 * i + 2 * cdb + 8]}')
-            else:
-                QZS_ID = np.append(QZS_ID, 
-                                   f'{s_unpack[2 * i + 2 * cdb + 8]}')
-            # number of signals
-            n_bias = np.append(n_bias, 
-                                  s_unpack[2 * i + 2 * cdb + 9])
-                
-            # ********************************************************* #
-            #                                                           # 
-            #                   Signal part                             #
-            #                                                           #
-            # ********************************************************* #                
-            bit_sig_0 = 'u5s14'
-            bit_sig   = bit_sig_0  
-            S_TMI.append([])
-            Cd_bias.append([])
-            types.append([])
-                
-            for j in range(s_unpack[2 * i + 2 * cdb + 9]):
-                sig_unpack = bitstruct.unpack(header + 
-                                              bit_sat + bit_sig, message)
-                # Signal and tracking mode identifier   
-                GNSS_ID = 'QZSS'
-                    
-                types[i].append(sig_unpack[2 * i + 
-                                2 * cdb +  2 * j +  10])
-                S_TMI[i].append(signalID.signals(GNSS_ID, 
-                                sig_unpack[2 * i + 2 * cdb +  2 * j + 10]))
-                                       
-                Cd_bias[i].append(sig_unpack[2 * i + 2 * cdb +
-                                             2 * j +  11] * 0.01)
-                                            
-                if j < s_unpack[2 * i + 2 * cdb + 9] - 1:
-                    bit_sig = bit_sig + bit_sig_0
-                            
-            cdb = cdb + s_unpack[2 * i + 2 * cdb + 9]               
-            bit_sat = bit_sat + bit_sig + bit_sat_0                       
-            
-            self.gnss_id = QZS_ID
-            self.number = n_bias
-            self.track = types
-            self.bias = Cd_bias
-            self.name = S_TMI
+            s_unpack = cursor.read('u4u5')
+            # QZSS ID number
+            sat['gnss_id'][i] = sat_id(s_unpack[0])
+            # N. of Code Biases Processed, DF379, Range: 0-31, Res: 1
+            sat['number'][i] = s_unpack[1]
+            track.append([])
+            bias.append([])
+            name.append([])
+            # the signals of the satellite are read together
+            t_unpack = cursor.read(s_unpack[1] * 'u5s14')
+            for j in range(s_unpack[1]):
+            # Track indicator, DF380, Range: 0-31, Res: 1
+                track[i].append(t_unpack[2 * j])
+            # Signal name
+                GNSS = 'QZSS'
+                name[i].append(signalID.signals(GNSS, t_unpack[2 * j]))
+            # Code bias, DF383, Range: +-81.91[m], Res: 0.01[m]
+                bias[i].append(t_unpack[2 * j + 1] * 0.01)
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.number = sat['number']
+        self.track = track
+        self.name  = name
+        self.bias = bias
+        self.biases = bias_index(self.gnss_id, name, bias)
             
 # *************************************************************************** #
 #                                                                             #
 #      SSR QZSS combined Orbit and Clock Correction Message Type 1249         #
 #                                                                             #
 # *************************************************************************** #
+@register(1249, 'orbit_clock')
 class qzs_orbit_clock:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)           
+        unpack_bits = bit_layouts.unpack(header, message)           
         
         self.gnss = 'QZSS'
         self.gnss_short = 'J'
@@ -4821,91 +4359,54 @@ class qzs_orbit_clock:
         #                                                                     #
         # ******************************************************************* #             
         
-        # satellite parameters initialization
-        QZS_ID  = []
-        QZS_IOD = []
-            
-        D_r = []
-        D_t = []
-        D_n = []
-            
-        dot_D_r = []
-        dot_D_t = []
-        dot_D_n = []
-            
-        D_C0 = []
-        D_C1 = []
-        D_C2 = []
-            
+        # satellite parameters, one row per satellite
         bit_sat = self.n_sat * 'u4u8s22s20s20s21s19s19s22s21s27'
-            
-        # number of parameters
-        n = 11
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-        for i in range(self.n_sat):
-            # QZSS ID number,  
-            if s_unpack[n * i + 9] < 10:
-                QZS_ID = np.append(QZS_ID, '0' + f'{s_unpack[n * i + 9]}')
-            else:
-                QZS_ID = np.append(QZS_ID, f'{s_unpack[n * i + 9]}')
-                
-            # QZSS IOD: Issue Of Data of QZSS ephemeris to reference 
-            # the geometric gradients 
-
-            QZS_IOD = np.append(QZS_IOD, s_unpack[n * i + 11])
-                   
-            # Delta radial
-            # Printed in [m]
-            D_r = np.append(D_r, s_unpack[n * i + 12] * 0.1 * 10 ** (-3))
-            
-            # Delta along-track
-            # Printed in [m]
-            D_t = np.append(D_t, s_unpack[n * i + 13] * 0.4 * 10 ** (-3))
-            
-            # Delta cross-track
-            # Printed in [m]
-            D_n = np.append(D_n, s_unpack[n * i + 14] * 0.4 * 10 ** (-3))
-            
-            # Dot delta radial
-            # Printed in [mm/s]
-            dot_D_r = np.append(dot_D_r, s_unpack[n * i + 15] * 0.001)
-            
-            # Dot delta along-track
-            # Printed in [mm/s]
-            dot_D_t = np.append(dot_D_t, s_unpack[n * i + 16] * 0.004)
-                
-            # Dot delta along-track
-            # Printed in [mm/s]
-            dot_D_n = np.append(dot_D_n, s_unpack[n * i + 17] * 0.004)
-            
-            # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s**2])
-            D_C0 = np.append(D_C0, s_unpack[n * i +  18] * 0.1    )  
-            D_C1 = np.append(D_C1, s_unpack[n * i +  19] * 0.001  )  
-            D_C2 = np.append(D_C2, s_unpack[n * i +  20] * 0.00002)  
-                
-        self.gnss_id = QZS_ID
-        self.gnss_iod = QZS_IOD
-        self.dr = D_r
-        self.dn = D_n
-        self.dt = D_t
-        self.dot_dr = dot_D_r
-        self.dot_dn = dot_D_n
-        self.dot_dt = dot_D_t
-        self.dc0 = D_C0
-        self.dc1 = D_C1
-        self.dc2 = D_C2
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 9, 11, self.n_sat, 12)
+        sat = np.zeros(self.n_sat, dtype=ORBIT_CLOCK_DTYPE)
+        # QZSS ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # IOD of the QZSS ephemeris referenced by the corrections
+        sat['gnss_iod'] = rows[:, 2]
+        # Delta radial, along-track and cross-track, printed in [m]
+        sat['dr'] = rows[:, 3] * 0.1 * 10 ** (-3)
+        sat['dt'] = rows[:, 4] * 0.4 * 10 ** (-3)
+        sat['dn'] = rows[:, 5] * 0.4 * 10 ** (-3)
+        # Dot delta radial, along-track and cross-track, printed in [mm/s]
+        sat['dot_dr'] = rows[:, 6] * 0.001
+        sat['dot_dt'] = rows[:, 7] * 0.004
+        sat['dot_dn'] = rows[:, 8] * 0.004
+        # Delta clock C0, C1, C2 ([mm], [mm/s], [mm/s^2])
+        sat['dc0'] = rows[:, 9] * 0.1
+        sat['dc1'] = rows[:, 10] * 0.001
+        sat['dc2'] = rows[:, 11] * 0.00002
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.gnss_iod = sat['gnss_iod']
+        self.dr = sat['dr']
+        self.dt = sat['dt']
+        self.dn = sat['dn']
+        self.dot_dr = sat['dot_dr']
+        self.dot_dt = sat['dot_dt']
+        self.dot_dn = sat['dot_dn']
+        self.dc0 = sat['dc0']
+        self.dc1 = sat['dc1']
+        self.dc2 = sat['dc2']
         
 # *************************************************************************** #
 #                                                                             #
 #                     SSR QZSS URA Message Type 1250                          #
 #                                                                             #
 # *************************************************************************** #
+@register(1250, 'ura')
 class qzs_ura:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        unpack_bits = bit_layouts.unpack(header, message)
         
         self.gnss = 'QZSS'
         self.gnss_short = 'J'
@@ -4944,55 +4445,42 @@ class qzs_ura:
         #                                                                     #
         # ******************************************************************* # 
         
-        # satellite parameters initialization
-        QZS_ID = []
-        URA    = []
-        URA_CLASS = []
-        URA_VALUE = []
-                           
+        # satellite parameters, one row per satellite
         bit_sat = self.n_sat * 'u4u3u3'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-            
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 3, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=URA_DTYPE)
+        # QZSS ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # URA class and value, URA printed in [m]
+        sat['ura_class'] = rows[:, 1]
+        sat['ura_value'] = rows[:, 2]
+        sat['ura'] = (3 ** rows[:, 1] * (1 + rows[:, 2] / 4) - 1) / 1000
         for i in range(self.n_sat):
-            # QZSS ID number       
-            if s_unpack[3 * i + 8] < 10:
-                QZS_ID = np.append(QZS_ID, '0' + f'{s_unpack[3 * i +  8]}')
-            else:
-                QZS_ID = np.append(QZS_ID, f'{s_unpack[3 * i +  8]}')
-                
-            # SSR URA
-            # URA_CLASS             
-            Class = s_unpack[3 * i +  9]
-            URA_CLASS = np.append(URA_CLASS, Class)
-
-            # URA_VALUE 
-            Value = s_unpack[3 * i + 10]
-            URA_VALUE = np.append(URA_VALUE, Value)
-
-            if (Value == 0) & (Class == 0):
+            if (rows[i, 2] == 0) & (rows[i, 1] == 0):
                 print('URA undefined/unknown')
-            elif (Value == 7) & (Class == 7):
+            elif (rows[i, 2] == 7) & (rows[i, 1] == 7):
                 print('URA > 5466.5 [mm]')
-            # The URA is computed by the following expression:
-            # Printed in [m]
-            URA = np.append(URA, (3 ** (Class) * (1 +
-                                      Value / 4) - 1) / 1000)                
 
-        self.ura = URA
-        self.ura_class = URA_CLASS
-        self.ura_value = URA_VALUE
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.ura_class = sat['ura_class']
+        self.ura_value = sat['ura_value']
+        self.ura = sat['ura']
         
 # *************************************************************************** #
 #                                                                             #
 #                SSR QZSS High Rate Clock Correction Message Type 1251        #
 #                                                                             #
 # *************************************************************************** #
+@register(1251, 'hr_clock')
 class qzs_hr_clock:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        unpack_bits = bit_layouts.unpack(header, message)
         
         self.gnss = 'QZSS'
         self.gnss_short = 'J'
@@ -5032,37 +4520,34 @@ class qzs_hr_clock:
         #                                                                     #
         # ******************************************************************* # 
         
-        # satellite parameters initialization
-        QZS_ID   = []
-        HR_clock = []
-                           
+        # satellite parameters, one row per satellite
         bit_sat = self.n_sat * 'u4s22'
-        s_unpack = bitstruct.unpack(header + bit_sat, message)
-            
-        for i in range(self.n_sat):
-            # QZSS ID number  
-            if s_unpack[2 * i + 8] < 10:
-                QZS_ID = np.append(QZS_ID, '0' + f'{s_unpack[2 * i + 8]}')
-            else:
-                QZS_ID = np.append(QZS_ID, f'{s_unpack[2 * i + 8]}')
-                
-            # High-rate clock correction
-            HR_clock = np.append(HR_clock, s_unpack[2 * i + 
-                                                    9] * 0.1 * 1e-3)             
-        self.gnss_id = QZS_ID
-        self.hr_clock = HR_clock
+        s_unpack = bit_layouts.unpack(header + bit_sat, message)
+        rows = sat_rows(s_unpack, 8, 2, self.n_sat)
+        sat = np.zeros(self.n_sat, dtype=HR_CLOCK_DTYPE)
+        # QZSS ID number
+        sat['gnss_id'] = sat_ids(rows[:, 0])
+        # High-rate clock correction [m]
+        sat['hr_clock'] = rows[:, 1] * 0.1 * 1e-3
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.hr_clock = sat['hr_clock']
         
 # *************************************************************************** #
 #                                                                             #
 #                      QZSS Phase Bias Message Type 1268                      #
 #                                                                             #
 # *************************************************************************** #
+@register(1268, 'phase_bias')
 class qzs_phase_bias:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u1u1u6'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        cursor = bit_layouts.BitCursor(message)
+        unpack_bits = cursor.read(header)
         
         self.gnss = 'QZSS'
         self.gnss_short = 'J'
@@ -5108,48 +4593,27 @@ class qzs_phase_bias:
         # ******************************************************************* # 
         
         # satellite parameters initialization
-        QZS_ID = []
-        num_phase = []
-        yaw_angle = []
-        yaw_rate = []
-            
+        sat = np.zeros(self.n_sat, dtype=PHASE_BIAS_DTYPE)
+
         track = []
         signal_int = []
         signal_WL = []
-        signal_dis = []
         signal_name = []
+        signal_dis = []
         phase_bias = []
-             
-        n_types = 0
-        bit_sat = 'u4u5u9s8' 
-           
+
         for i in range(self.n_sat):
-            s_unpack = bitstruct.unpack(header + bit_sat, message)
-            
-            # QZS sat ID number     
-            if s_unpack[4 * i + 5 * n_types + 10] < 10:
-                QZS_ID = np.append(QZS_ID, '0' + 
-                                   f'{s_unpack[4 * i + 5 * n_types + 10]}')
-            else:
-                QZS_ID = np.append(QZS_ID, 
-                                   f'{s_unpack[4 * i + 5 * n_types + 10]}')  
+            s_unpack = cursor.read('u4u5u9s8')
+            # QZSS sat ID number
+            sat['gnss_id'][i] = sat_id(s_unpack[0])
             # N. of Phase Biases Processed
-            num_phase = np.append(num_phase, 
-                                  s_unpack[4 * i + 5 * n_types + 11])
-                
+            sat['number'][i] = s_unpack[1]
             # Yaw Angle
             # Printed in [deg]
-            yaw_angle = np.append(yaw_angle, (s_unpack[4 * i + 
-                                                       5 * n_types +
-                                                       12] *
-                                              1 / 256) * 180)
-            
+            sat['yaw_angle'][i] = (s_unpack[2] * 1 / 256) * 180
             # Yaw Rate
             # Printed in [deg/s]
-            yaw_rate = np.append(yaw_rate, (s_unpack[4 * i +
-                                                     5 * n_types + 
-                                                     13] * 1 / 8192) * 180)
-
+            sat['yaw_rate'][i] = (s_unpack[3] * 1 / 8192) * 180
         # ******************************************************************* #
         #                                                                     # 
         #            Phase specific part of the satellite considered          #
@@ -5162,53 +4626,37 @@ class qzs_phase_bias:
             signal_name.append([])
             signal_dis.append([])
             phase_bias.append([])
-            
-            bit_phase = 'u5u1u2u4s20' 
-                
-            for j in range(s_unpack[4 * i + 5 * n_types + 11]):
-                p_unpack = bitstruct.unpack(header + bit_sat + 
-                                            bit_phase, message)
-            
+            # the signals of the satellite are read together
+            p_unpack = cursor.read(s_unpack[1] * 'u5u1u2u4s20')
+            for j in range(s_unpack[1]):
             # Track indicator
-                track[i].append(p_unpack[4 * i + 5 * n_types + 14 + j * 5])
-
+                track[i].append(p_unpack[5 * j])
             # Signal_name:
                 GNSS_ID = 'QZSS'
-                signal_name[i].append(signalID.signals(GNSS_ID, 
-                                      p_unpack[4 * i + 5 * n_types +
-                                               14 + j * 5]))
-            
+                signal_name[i].append(signalID.signals(GNSS_ID,
+                                                       p_unpack[5 * j]))
             # Signal integer indicator
-                signal_int[i].append(p_unpack[4 * i + 5 * n_types +
-                                              15 + j * 5])
-            
+                signal_int[i].append(p_unpack[5 * j + 1])
             # Signal wide-lane integer indicator
-                signal_WL[i].append(p_unpack[4 * i + 5 * n_types +
-                                             16 + j * 5])
-            
+                signal_WL[i].append(p_unpack[5 * j + 2])
             # Signal discontinuity counter
-                signal_dis[i].append(p_unpack[4 * i + 5 * n_types +
-                                              17 + j * 5])
-            
+                signal_dis[i].append(p_unpack[5 * j + 3])
             # PHASE BIAS
-                phase_bias[i].append(p_unpack[4 * i + 5 * n_types +
-                                              18 + j * 5] * 0.0001)
-
-                if j < s_unpack[4 * i + 5 * n_types + 11] - 1:
-                    bit_phase = bit_phase + 'u5u1u2u4s20'
-                        
-            n_types = n_types + s_unpack[4 * i + 5 * n_types + 11]    
-            bit_sat = bit_sat + bit_phase  + 'u4u5u9s8'
-                    
-        self.number = num_phase
-        self.yaw_angle = yaw_angle
-        self.yaw_rate = yaw_rate
+                phase_bias[i].append(p_unpack[5 * j + 4] * 0.0001)
+
+        self.sat = sat
+        self.gnss_id = sat['gnss_id']
+        self.rows = sat_index(self.gnss_id)
+        self.number = sat['number']
+        self.yaw_angle = sat['yaw_angle']
+        self.yaw_rate = sat['yaw_rate']
         self.track = track
         self.name = signal_name
         self.bias = phase_bias
+        self.biases = bias_index(self.gnss_id, signal_name, phase_bias)
         self.sig_wl = signal_WL
         self.sig_dis = signal_dis
-        self.sig_i = signal_int     
+        self.sig_i = signal_int
         
 # =============================================================================
 #                                IONOSPHERE
@@ -5218,12 +4666,14 @@ class qzs_phase_bias:
 #                          VTEC Message Type 1264                             #
 #                                                                             #
 # *************************************************************************** # 
+@register(1264, 'iono')
 class iono_sph:
     def __init__(self, message):
         # Definition of the bits of the header of the message
         header = 'u12u20u4u1u4u16u4u9u2'
         # Unpack the bits of the header    
-        unpack_bits = bitstruct.unpack(header, message)
+        cursor = bit_layouts.BitCursor(message)
+        unpack_bits = cursor.read(header)
         self.gnss = 'Ionosphere Spherical Harmonics'
         
         # **************************** Parameters *************************** #
@@ -5273,57 +4723,41 @@ class iono_sph:
         n_C = []
         n_S = []
         
-        n = 0
-        bit_lay = 'u8u4u4'
         for i in range(self.n_layers):
-            l_unpack = bitstruct.unpack(header + bit_lay, message)
+            l_unpack = cursor.read('u8u4u4')
         # Height of Ionospheric Layer
         # The resolution is 10[km], therefore the result has to be multiplied 
         # by a factor of 10
-            height  = np.append(height, l_unpack[n + 9] * 10)
+            height  = np.append(height, l_unpack[0] * 10)
 
         # Spherical Harmonics Degree
-            degree  = np.append(degree, l_unpack[n + 10] + 1)
+            degree  = np.append(degree, l_unpack[1] + 1)
         
         # Spherical Harmonics Order
-            order   = np.append(order, l_unpack[n + 11] + 1)
+            order   = np.append(order, l_unpack[2] + 1)
         
         # Model Part of the SSR VTEC Ionosphere Spherical Harmonic Cosine 
         # Coefficients
             # num of C coeff
-            number_C =  ((degree + 1) * (degree + 2) / 2 -    
-                         (degree - order) * (degree - order + 1) / 2)
+            number_C =  ((degree[i] + 1) * (degree[i] + 2) / 2 -    
+                         (degree[i] - order[i]) *
+                         (degree[i] - order[i] + 1) / 2)
             n_C = np.append(n_C, number_C)
             
-            bit_C = ''    
-            for j in range(int(number_C[0])):
-                bit_C = bit_C + 's16'
-                
-            C_unpack = bitstruct.unpack(header + bit_lay + bit_C, message)
+            C_unpack = cursor.read(int(number_C) * 's16')
             C.append([])
-            for j in range(int(number_C[0])):
-                C[i].append(C_unpack[j + n + 12] * 0.005)
+            for j in range(int(number_C)):
+                C[i].append(C_unpack[j] * 0.005)
                 
         # Model Part of the SSR VTEC Ionosphere Spherical Harmonic Sine 
         # Coefficients   
-            number_S = ((degree + 1) * (degree + 2) / 2 -        
-                        (degree - order) * (degree - order + 1) / 2 -
-                        (degree + 1))
+            number_S = number_C - (degree[i] + 1)
             n_S = np.append(n_S, number_S)
             
-            bit_S = ''    
-            for j in range(int(number_S[0])):
-                bit_S = bit_S + 's16'
-            
-            S_unpack = bitstruct.unpack(header + bit_lay +
-                                        bit_C + bit_S, message)
-            
+            S_unpack = cursor.read(int(number_S) * 's16')
             S.append([])
-            for j in range(int(number_S[0])):
-                S[i].append(S_unpack[j + int(number_C[0]) + n + 12] * 0.005)
-            
-            n = n + number_C + number_S
-            bit_lay = bit_lay + 'u8u4u4' + bit_C + bit_S    
+            for j in range(int(number_S)):
+                S[i].append(S_unpack[j] * 0.005)
         
         self.height = height
         self.degree = degree
@@ -0,0 +1,218 @@
+"""
+   ----------------------------------------------------------------------------
+   Copyright (C) 2020 Francesco Darugna <fd@geopp.de>  Geo++ GmbH,
+                      Jannes B. Wübbena <jw@geopp.de>  Geo++ GmbH.
+   
+   A list of all the historical RTCM-SSR Python Demonstrator contributors in
+   CREDITS.info.
+   
+   The first author has received funding from the European Union's Horizon 2020
+   research and innovation programme under the Marie Sklodowska-Curie Grant
+   Agreement No 722023.
+   ----------------------------------------------------------------------------
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import numpy as np
+import rtcm_decoder
+
+""" Pushdown filters of the RTCM frames
+
+    Input:
+    - epochs      : [first, last] GPS time of week [s] of the SSR epochs to be
+                    considered
+    - systems     : GNSS to be considered, e.g. ['G', 'E']
+    - msg_types   : RTCM message numbers to be considered
+    - provider_ids: SSR provider IDs to be considered
+    - solution_ids: SSR solution IDs to be considered
+    - ls          : GLONASS leap seconds, for the epoch window of the
+                    GLONASS messages
+
+    Output:
+    - FrameFilter object, whose accept method tells if a frame has to be
+      decoded
+
+    ***************************************************************************
+    Description:
+    the filters are applied before the decoding of the messages, so that
+    the rejected frames are not unpacked, sorted and printed. The message
+    type and the GNSS are known from the message number, so these filters
+    do not read the message content. Only if an epoch window, a provider or
+    a solution ID is given, the common SSR header is peeked by the
+    ssr_header class of the rtcm_decoder module.
+    The criteria which are not defined for a message are not applied, i.e.
+    the ephemeris messages pass the epoch, provider and solution filters,
+    since they are needed for the SSR corrections of any epoch, and the VTEC
+    message passes the GNSS filter. The message type filter is strict: if
+    given, the ephemeris message types have to be included as well for the
+    computation of the SSR influence on the user position.
+
+    The epoch window is given in GPS time of week and it is converted into
+    the time of the SSR epoch of every GNSS: BeiDou time of week (GPS - 14 s)
+    and GLONASS time of day (UTC + 3 h, i.e. GPS - ls + 3 h). If the window
+    crosses the end of the week or of the GLONASS day, it is split in two.
+
+    The mask method applies the same filters to the records of a frame index
+    (rtcm_index module), without reading the RTCM file.
+"""
+
+WEEK_SECONDS = 604800
+DAY_SECONDS = 86400
+BDS_OFFSET = -14    # BeiDou time - GPS time [s]
+
+def as_set(values):
+    # single value or iterable of values
+    if values is None:
+        return None
+    if np.isscalar(values):
+        return {values}
+    return set(values)
+
+class FilterStats:
+    def __init__(self):
+        self.accepted = 0
+        self.rejected = 0
+        self.peeked = 0
+
+    def __repr__(self):
+        return 'FilterStats objects: accepted, rejected, peeked'
+
+    def __str__(self):
+        return ('### Filtered frames: accepted ' + str(self.accepted) +
+                ', rejected ' + str(self.rejected) +
+                ', peeked headers ' + str(self.peeked) + ' ###')
+
+class FrameFilter:
+    def __init__(self, epochs=None, systems=None, msg_types=None,
+                 provider_ids=None, solution_ids=None, ls=0):
+        self.epochs = None if epochs is None else [epochs[0], epochs[1]]
+        self.systems = as_set(systems)
+        self.msg_types = as_set(msg_types)
+        self.provider_ids = as_set(provider_ids)
+        self.solution_ids = as_set(solution_ids)
+        self.ls = ls
+        self.stats = FilterStats()
+        self.peek = ((self.epochs is not None) or
+                     (self.provider_ids is not None) or
+                     (self.solution_ids is not None))
+        # epoch windows per GNSS in the time of the SSR epoch
+        self.windows = {}
+        if self.epochs is not None:
+            for gnss_short in ['G', 'E', 'J', None]:
+                self.windows[gnss_short] = self.system_window(0,
+                                                              WEEK_SECONDS)
+            self.windows['C'] = self.system_window(BDS_OFFSET, WEEK_SECONDS)
+            self.windows['R'] = self.system_window(10800 - ls, DAY_SECONDS)
+
+    def __repr__(self):
+        return ('FrameFilter objects: epochs, systems, msg_types, ' +
+                'provider_ids, solution_ids, ls, stats')
+
+    def is_active(self):
+        return (self.peek or (self.systems is not None) or
+                (self.msg_types is not None))
+
+    def system_window(self, offset, period):
+        [first, last] = self.epochs
+        if last - first >= period:
+            return [[0, period]]
+        first = (first + offset) % period
+        last = (last + offset) % period
+        if first <= last:
+            return [[first, last]]
+        return [[first, period], [0, last]]
+
+    def accept_type(self, msg_type):
+        # filters depending only on the message number
+        if (self.msg_types is not None) and (msg_type not in self.msg_types):
+            return False
+        if self.systems is not None:
+            if msg_type in rtcm_decoder.EPHEMERIS_SYSTEMS:
+                gnss_short = rtcm_decoder.EPHEMERIS_SYSTEMS[msg_type]
+            else:
+                gnss_short = rtcm_decoder.SSR_SYSTEMS.get(msg_type)
+            if (gnss_short is not None) and (gnss_short not in self.systems):
+                return False
+        return True
+
+    def accept_header(self, header):
+        if header.epoch is None:
+            # message without SSR header, e.g. ephemeris
+            return True
+        if ((self.provider_ids is not None) and
+            (header.provider_id not in self.provider_ids)):
+            return False
+        if ((self.solution_ids is not None) and
+            (header.solution_id not in self.solution_ids)):
+            return False
+        if self.epochs is not None:
+            for [first, last] in self.windows[header.gnss_short]:
+                if first <= header.epoch <= last:
+                    return True
+            return False
+        return True
+
+    def accept(self, msg_type, message):
+        accepted = self.accept_type(msg_type)
+        if (accepted and self.peek and
+            (rtcm_decoder.ssr_header_layout(msg_type) is not None)):
+            self.stats.peeked += 1
+            try:
+                header = rtcm_decoder.ssr_header(message, msg_type)
+            except Exception:
+                # message too short for its SSR header, leave it to the
+                # decoder
+                header = None
+            if header is not None:
+                accepted = self.accept_header(header)
+        if accepted:
+            self.stats.accepted += 1
+        else:
+            self.stats.rejected += 1
+        return accepted
+
+    def mask(self, records):
+        # boolean selection of the records of a frame index
+        selected = np.ones(len(records), dtype=bool)
+        if self.msg_types is not None:
+            selected &= np.isin(records['msg_type'], list(self.msg_types))
+        gnss = records['gnss']
+        if self.systems is not None:
+            systems = [system.encode() for system in self.systems]
+            selected &= np.isin(gnss, systems) | (gnss == b'')
+        # records without SSR header have negative epoch, provider and
+        # solution ID
+        no_header = records['epoch'] < 0
+        if self.provider_ids is not None:
+            selected &= no_header | np.isin(records['provider_id'],
+                                            list(self.provider_ids))
+        if self.solution_ids is not None:
+            selected &= no_header | np.isin(records['solution_id'],
+                                            list(self.solution_ids))
+        if self.epochs is not None:
+            epoch = records['epoch']
+            in_window = np.zeros(len(records), dtype=bool)
+            for [gnss_short, windows] in self.windows.items():
+                if gnss_short is None:
+                    system = gnss == b''
+                else:
+                    system = gnss == gnss_short.encode()
+                for [first, last] in windows:
+                    in_window |= system & (epoch >= first) & (epoch <= last)
+            selected &= no_header | in_window
+        self.stats.accepted += int(np.count_nonzero(selected))
+        self.stats.rejected += int(len(records) - np.count_nonzero(selected))
+        return selected
@@ -0,0 +1,192 @@
+"""
+   ----------------------------------------------------------------------------
+   Copyright (C) 2020 Francesco Darugna <fd@geopp.de>  Geo++ GmbH,
+                      Jannes B. Wübbena <jw@geopp.de>  Geo++ GmbH.
+   
+   A list of all the historical RTCM-SSR Python Demonstrator contributors in
+   CREDITS.info.
+   
+   The first author has received funding from the European Union's Horizon 2020
+   research and innovation programme under the Marie Sklodowska-Curie Grant
+   Agreement No 722023.
+   ----------------------------------------------------------------------------
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import mmap
+import crc24q
+
+"""
+    Iterator over the RTCM 3 frames contained in a binary stream.
+
+    Input:
+        - source: RTCM 3 binary data as bytes, bytearray or memoryview
+        - stats : optional FrameStats object updated while iterating
+        - block : number of bytes whose candidate preambles are verified
+                  together
+        - start : position in the stream where the search starts
+
+    Output:
+        - (offset, msg_type, payload) for every frame with a valid CRC.
+          offset is the position of the preamble in the stream, msg_type the
+          RTCM message number and payload a memoryview of the message content
+          without the frame, i.e. without preamble, length and CRC.
+
+    ***************************************************************************
+    Description:
+    the preambles are searched with the find method of the underlying
+    buffer instead of comparing the stream byte by byte. The candidates of a
+    block of the stream are passed together to the verify_frames function of
+    the crc24q module, which rejects the implausible frame headers and
+    computes the CRC-24Q over header and message of the others (Ref. RTCM
+    10403.3, chap. 4).
+    The candidates are then considered in stream order: if the CRC is 0 the
+    frame is complete, the payload is returned as a memoryview slice of the
+    input, so no copy of the message content is done, and the candidates
+    inside the frame are discarded. Otherwise, the candidate was a false
+    preamble or a corrupted frame and the next candidate is considered.
+
+    The MappedFile class gives access to an RTCM file through a read-only
+    memory map, so that a complete archive can be framed without reading it
+    into memory: the payloads are slices of the mapping and the pages are
+    loaded by the operating system only when the frames are read. An empty
+    file cannot be mapped and it is read as bytes.
+
+    The FrameStats class counts the frames found, the bytes not belonging to
+    any valid frame, the rejected frame headers, the failed CRC checks and
+    the candidates whose frame exceeds the end of the stream.
+"""
+
+class MappedFile:
+    def __init__(self, f_in, use_mmap=True):
+        self.f_in = f_in
+        self.use_mmap = use_mmap
+        self.data = None
+        self._file = None
+
+    def __repr__(self):
+        return 'MappedFile objects: f_in, use_mmap, data'
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        self._file = open(self.f_in, 'rb')
+        try:
+            if self.use_mmap:
+                self.data = mmap.mmap(self._file.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+            else:
+                self.data = self._file.read()
+        except ValueError:
+            # empty file, nothing to map
+            self.data = b''
+        return self.data
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            try:
+                self.data.close()
+            except BufferError:
+                # payloads still referenced by the caller, the mapping is
+                # released together with the last of them
+                pass
+        self.data = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class FrameStats:
+    def __init__(self):
+        self.frames = 0
+        self.skipped_bytes = 0
+        self.bad_headers = 0
+        self.crc_failures = 0
+        self.incomplete = 0
+
+    def __repr__(self):
+        return ('FrameStats objects: frames, skipped_bytes, bad_headers,' +
+                ' crc_failures, incomplete')
+
+    def __str__(self):
+        return ('### Frames: ' + str(self.frames) +
+                ', skipped bytes: ' + str(self.skipped_bytes) +
+                ', rejected headers: ' + str(self.bad_headers) +
+                ', failed CRC checks: ' + str(self.crc_failures) +
+                ', incomplete frames: ' + str(self.incomplete) + ' ###')
+
+def iter_frames(source, stats=None, block=65536, start=0):
+    if stats is None:
+        stats = FrameStats()
+    if isinstance(source, memoryview):
+        # the find method is not available for memoryview, use the exporting
+        # object if the view covers it completely
+        base = source.obj
+        if not (hasattr(base, 'find') and len(base) == source.nbytes):
+            base = source.tobytes()
+        source = base
+    data = memoryview(source)
+    n_bytes = len(data)
+    preamble = bytes([crc24q.PREAMBLE])
+    header_len = crc24q.HEADER_LEN
+    frame_len = crc24q.HEADER_LEN + crc24q.CRC_LEN
+
+    i = start           # position of the next byte to be considered
+    last_end = start    # end of the last valid frame
+    while i < n_bytes:
+        # collect the candidate preambles of the block
+        block_end = i + block
+        candidates = []
+        k = source.find(preamble, i, block_end)
+        while k >= 0:
+            candidates.append(k)
+            k = source.find(preamble, k + 1, block_end)
+        checks = crc24q.verify_frames(data, candidates)
+
+        for c in range(len(candidates)):
+            k = candidates[c]
+            if k < i:
+                # inside the last valid frame
+                continue
+            [status, msg_len] = checks[c]
+            if status == crc24q.BAD_HEADER:
+                stats.bad_headers += 1
+                continue
+            elif status == crc24q.INCOMPLETE:
+                # frame exceeding the stream, it might be a false preamble
+                stats.incomplete += 1
+                continue
+            elif status == crc24q.BAD_CRC:
+                stats.crc_failures += 1
+                continue
+
+            payload = data[k + header_len:k + header_len + msg_len]
+            if msg_len >= 2:
+                msg_type = (payload[0] << 4) | (payload[1] >> 4)
+            else:
+                # empty frame, no message number available
+                msg_type = None
+            stats.frames += 1
+            stats.skipped_bytes += k - last_end
+            last_end = k + msg_len + frame_len
+            i = last_end
+            yield k, msg_type, payload
+        i = max(i, block_end)
+
+    stats.skipped_bytes += n_bytes - last_end
@@ -0,0 +1,268 @@
+"""
+   ----------------------------------------------------------------------------
+   Copyright (C) 2020 Francesco Darugna <fd@geopp.de>  Geo++ GmbH,
+                      Jannes B. Wübbena <jw@geopp.de>  Geo++ GmbH.
+   
+   A list of all the historical RTCM-SSR Python Demonstrator contributors in
+   CREDITS.info.
+   
+   The first author has received funding from the European Union's Horizon 2020
+   research and innovation programme under the Marie Sklodowska-Curie Grant
+   Agreement No 722023.
+   ----------------------------------------------------------------------------
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import numpy as np
+import crc24q
+import rtcm_decoder
+import rtcm_frames
+
+""" Sidecar frame index of RTCM files
+
+    Input:
+    - f_in    : RTCM binary file
+    - idx_file: index file, if not provided f_in + '.idx'
+
+    Output:
+    - FrameIndex object with one record per valid RTCM frame of f_in
+
+    ***************************************************************************
+    Description:
+    the index is a binary file next to the RTCM file. It starts with a header
+    of HEADER_DTYPE, followed by the records of the frames (RECORD_DTYPE),
+    written in little endian without padding, so that the records can be
+    memory mapped as a NumPy structured array. Every record contains:
+        - offset     : position of the frame preamble in the RTCM file
+        - length     : message length, i.e. the frame without preamble,
+                       length and CRC
+        - msg_type   : RTCM message number
+        - gnss       : GNSS of the message (G, R, E, C, J), empty for the
+                       messages without GNSS, e.g. VTEC
+        - epoch      : SSR epoch time [s] (GPS time of week, GLONASS time of
+                       day), -1 for messages without SSR header
+        - iod        : IOD SSR, -1 for messages without SSR header
+        - provider_id: SSR provider ID, -1 for messages without SSR header
+        - solution_id: SSR solution ID, -1 for messages without SSR header
+    The fields of the SSR header are read by the ssr_header class of the
+    rtcm_decoder module, i.e. the messages are not decoded completely.
+
+    The function update_index builds the index incrementally: the header
+    stores the position where the framing of the RTCM file stopped, i.e. the
+    end of the last indexed frame, a CRC of the first bytes of the file and
+    a CRC of the last bytes before scan_end. If the RTCM file grew, only the
+    new part is framed and its records are appended to the index. If the
+    beginning of the file or the bytes before scan_end changed, or the file
+    is shorter than the indexed part, the index is built again.
+
+    The function load_index memory maps the records of an index, and the
+    FrameIndex class selects the records by message type, GNSS and epoch.
+    The frames of the selected records are returned by iter_indexed_frames,
+    which slices the messages from the RTCM data without searching the
+    preambles and computing the CRC again: only the preamble and the
+    message length of the frame header are compared with the record, and a
+    ValueError is raised if they differ. The function check_records does the
+    same comparison for all the selected records before the decoding, so
+    that the index can be built again if the file changed inside the
+    indexed part.
+"""
+
+MAGIC = b'RTCMIDX1'
+VERSION = 2
+CHECK_LEN = 4096    # bytes of the RTCM file considered by the header CRCs
+
+HEADER_DTYPE = np.dtype([('magic', 'S8'), ('version', '<u4'),
+                         ('record_size', '<u4'), ('scan_end', '<u8'),
+                         ('check_len', '<u4'), ('check_crc', '<u4'),
+                         ('tail_len', '<u4'), ('tail_crc', '<u4')])
+RECORD_DTYPE = np.dtype([('offset', '<u8'), ('length', '<u2'),
+                         ('msg_type', '<u2'), ('gnss', 'S1'),
+                         ('epoch', '<i4'), ('iod', 'i1'),
+                         ('provider_id', '<i4'), ('solution_id', 'i1')])
+
+class FrameIndex:
+    def __init__(self, records, scan_end=0, idx_file=None):
+        self.records = records
+        self.scan_end = scan_end
+        self.idx_file = idx_file
+
+    def __repr__(self):
+        return 'FrameIndex objects: records, scan_end, idx_file'
+
+    def __str__(self):
+        return ('### Frame index: ' + str(len(self.records)) +
+                ' frames, indexed bytes: ' + str(self.scan_end) + ' ###')
+
+    def __len__(self):
+        return len(self.records)
+
+    def mask(self, msg_types=None, systems=None, epochs=None):
+        # boolean selection of the records, epochs = [first, last] [s]
+        selected = np.ones(len(self.records), dtype=bool)
+        if msg_types is not None:
+            selected &= np.isin(self.records['msg_type'], list(msg_types))
+        if systems is not None:
+            gnss = [system.encode() for system in systems]
+            selected &= np.isin(self.records['gnss'], gnss)
+        if epochs is not None:
+            epoch = self.records['epoch']
+            # messages without epoch, e.g. ephemeris, are kept
+            selected &= ((epoch < 0) |
+                         ((epoch >= epochs[0]) & (epoch <= epochs[1])))
+        return selected
+
+    def select(self, msg_types=None, systems=None, epochs=None):
+        return self.records[self.mask(msg_types, systems, epochs)]
+
+def index_file(f_in):
+    return f_in + '.idx'
+
+def check_crc(data, check_len):
+    return crc24q.crc24q(data[:check_len])
+
+def tail_crc(data, scan_end, tail_len):
+    # CRC of the tail_len bytes before scan_end
+    return crc24q.crc24q(data[scan_end - tail_len:scan_end])
+
+def frame_record(offset, msg_type, msg_content):
+    try:
+        header = rtcm_decoder.ssr_header(msg_content, msg_type)
+    except Exception:
+        # message too short for its SSR header
+        header = rtcm_decoder.ssr_header(msg_content, None)
+    fields = [header.epoch, header.iod, header.provider_id,
+              header.solution_id]
+    fields = [-1 if field is None else field for field in fields]
+    gnss = b'' if header.gnss_short is None else header.gnss_short.encode()
+    return (offset, len(msg_content), msg_type, gnss) + tuple(fields)
+
+def index_frames(data, start=0):
+    records = []
+    scan_end = start
+    for [offset, msg_type,
+         msg_content] in rtcm_frames.iter_frames(data, start=start):
+        if msg_type is None:
+            # empty frame, nothing to index
+            continue
+        records.append(frame_record(offset, msg_type, msg_content))
+        scan_end = offset + len(msg_content) + (crc24q.HEADER_LEN +
+                                                 crc24q.CRC_LEN)
+    return [np.array(records, dtype=RECORD_DTYPE), scan_end]
+
+def read_header(idx_file):
+    try:
+        header = np.fromfile(idx_file, dtype=HEADER_DTYPE, count=1)
+    except (OSError, ValueError):
+        return None
+    if ((len(header) == 0) or (header['magic'][0] != MAGIC) or
+        (header['version'][0] != VERSION) or
+        (header['record_size'][0] != RECORD_DTYPE.itemsize)):
+        return None
+    n_bytes = os.path.getsize(idx_file) - HEADER_DTYPE.itemsize
+    if n_bytes % RECORD_DTYPE.itemsize != 0:
+        # truncated record, e.g. interrupted writing
+        return None
+    return header[0]
+
+def update_index(f_in, idx_file=None, rebuild=False):
+    if idx_file is None:
+        idx_file = index_file(f_in)
+    with rtcm_frames.MappedFile(f_in) as data:
+        n_bytes = len(data)
+        header = None if rebuild else read_header(idx_file)
+        if header is not None:
+            check_len = int(header['check_len'])
+            scan_end = int(header['scan_end'])
+            tail_len = int(header['tail_len'])
+            if ((scan_end > n_bytes) or (n_bytes < check_len) or
+                (tail_len > scan_end) or
+                (check_crc(data, check_len) != header['check_crc']) or
+                (tail_crc(data, scan_end, tail_len) != header['tail_crc'])):
+                # the RTCM file changed, build the index again
+                header = None
+        if header is None:
+            start = 0
+        else:
+            start = int(header['scan_end'])
+        [records, scan_end] = index_frames(data, start)
+        new_header = np.zeros(1, dtype=HEADER_DTYPE)
+        new_header['magic'] = MAGIC
+        new_header['version'] = VERSION
+        new_header['record_size'] = RECORD_DTYPE.itemsize
+        new_header['scan_end'] = scan_end
+        new_header['check_len'] = min(CHECK_LEN, n_bytes)
+        new_header['check_crc'] = check_crc(data, min(CHECK_LEN, n_bytes))
+        new_header['tail_len'] = min(CHECK_LEN, scan_end)
+        new_header['tail_crc'] = tail_crc(data, scan_end,
+                                          min(CHECK_LEN, scan_end))
+        records = None if len(records) == 0 else records
+    if header is None:
+        with open(idx_file, 'wb') as f:
+            new_header.tofile(f)
+            if records is not None:
+                records.tofile(f)
+    else:
+        # append the new records, then update the header
+        with open(idx_file, 'r+b') as f:
+            f.seek(0, os.SEEK_END)
+            if records is not None:
+                records.tofile(f)
+            f.seek(0)
+            new_header.tofile(f)
+    return load_index(f_in, idx_file)
+
+def load_index(f_in, idx_file=None):
+    if idx_file is None:
+        idx_file = index_file(f_in)
+    header = read_header(idx_file)
+    if header is None:
+        return None
+    n_records = ((os.path.getsize(idx_file) - HEADER_DTYPE.itemsize) //
+                 RECORD_DTYPE.itemsize)
+    if n_records == 0:
+        records = np.zeros(0, dtype=RECORD_DTYPE)
+    else:
+        records = np.memmap(idx_file, dtype=RECORD_DTYPE, mode='r',
+                            offset=HEADER_DTYPE.itemsize, shape=(n_records,))
+    return FrameIndex(records, int(header['scan_end']), idx_file)
+
+def check_records(data, records):
+    """
+        True if the frame headers of the RTCM data at the offsets of the
+        records have the preamble and the message length of the records.
+    """
+    data = memoryview(data)
+    n_bytes = len(data)
+    for [offset, length] in zip(records['offset'].tolist(),
+                                records['length'].tolist()):
+        [status, msg_len] = crc24q.check_header(data, offset, n_bytes)
+        if (status != crc24q.FRAME_OK) or (msg_len != length):
+            return False
+    return True
+
+def iter_indexed_frames(data, records):
+    data = memoryview(data)
+    n_bytes = len(data)
+    header_len = crc24q.HEADER_LEN
+    for [offset, length, msg_type] in zip(records['offset'].tolist(),
+                                          records['length'].tolist(),
+                                          records['msg_type'].tolist()):
+        [status, msg_len] = crc24q.check_header(data, offset, n_bytes)
+        if (status != crc24q.FRAME_OK) or (msg_len != length):
+            raise ValueError('The frame index does not match the RTCM ' +
+                             'data at offset ' + str(offset))
+        yield (offset, msg_type,
+               data[offset + header_len:offset + header_len + length])
@@ -0,0 +1,148 @@
+"""
+   ----------------------------------------------------------------------------
+   Copyright (C) 2020 Francesco Darugna <fd@geopp.de>  Geo++ GmbH,
+                      Jannes B. Wübbena <jw@geopp.de>  Geo++ GmbH.
+   
+   A list of all the historical RTCM-SSR Python Demonstrator contributors in
+   CREDITS.info.
+   
+   The first author has received funding from the European Union's Horizon 2020
+   research and innovation programme under the Marie Sklodowska-Curie Grant
+   Agreement No 722023.
+   ----------------------------------------------------------------------------
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import collections
+from concurrent.futures import ProcessPoolExecutor
+import rtcm_decoder
+
+""" Parallel decoding of RTCM frames
+
+    Input:
+    - frames    : iterator over the frames (offset, msg_type, msg_content) of
+                  the rtcm_frames or rtcm_index module
+    - year      : year at the time of the message reception
+    - doy       : day of the year at the time of the message reception
+    - select    : function of msg_type and msg_content telling if a frame has
+                  to be decoded
+    - workers   : number of decoding processes, if None or 1 the frames are
+                  decoded in the calling process
+    - render    : if True, the decoded messages are also converted to text,
+                  i.e. the output of the rtcm_decoder class for the .ssr file
+    - chunk_size: number of decoded frames per job of the process pool
+
+    Output:
+    - (offset, msg_type, msg_content, decoded) for every frame, in stream
+      order. decoded is None for the frames not selected, otherwise an object
+      with the members msg_type, type_len and dec_msg, whose string is the
+      decoded message.
+
+    ***************************************************************************
+    Description:
+    the framing and the CRC check of the stream are done in the calling
+    process, so the stream is split between complete and valid frames. The
+    selected messages are collected in chunks of consecutive frames, whose
+    contents are copied and decoded by a pool of processes. The results of
+    the chunks are collected in the order of submission, so the frames are
+    returned in stream order and the sorting of ephemeris and SSR messages
+    sees the same sequence as in the sequential decoding. Only a limited
+    number of chunks is pending at the same time, so the stream is not read
+    completely in advance.
+    The rendering of the .ssr output is done in the workers as well, since it
+    takes as long as the decoding. A message that cannot be rendered raises
+    TypeError when converted to string, as the rtcm_decoder class.
+    With the spawn start method of multiprocessing (e.g. Windows), the
+    script starting the decoding has to be protected by
+    if __name__ == '__main__'.
+"""
+
+class decoded_message:
+    def __init__(self, msg_type, type_len, dec_msg, text):
+        self.msg_type = msg_type
+        self.type_len = type_len
+        self.dec_msg = dec_msg
+        self.text = text
+
+    def __repr__(self):
+        return 'decoded_message objects: msg_type, type_len, dec_msg, text'
+
+    def __str__(self):
+        if self.text is None:
+            raise TypeError('message ' + str(self.msg_type) +
+                            ' not rendered')
+        return self.text
+
+def decode_chunk(messages, year, doy, render):
+    decoded = []
+    for message in messages:
+        read_msg = rtcm_decoder.rtcm_decoder(message, len(message), year, doy)
+        text = None
+        if render:
+            try:
+                text = str(read_msg)
+            except TypeError:
+                # unknown message, reported by the calling process
+                text = None
+        decoded.append(decoded_message(read_msg.msg_type, read_msg.type_len,
+                                       read_msg.dec_msg, text))
+    return decoded
+
+def decode_sequential(frames, year, doy, select):
+    for [offset, msg_type, msg_content] in frames:
+        if (msg_type is None) or (not select(msg_type, msg_content)):
+            yield offset, msg_type, msg_content, None
+            continue
+        read_msg = rtcm_decoder.rtcm_decoder(msg_content, len(msg_content),
+                                             year, doy)
+        yield offset, msg_type, msg_content, read_msg
+
+def decode_frames(frames, year, doy, select, workers=None, render=True,
+                  chunk_size=512):
+    if (workers is None) or (workers <= 1):
+        yield from decode_sequential(frames, year, doy, select)
+        return
+    with ProcessPoolExecutor(workers) as pool:
+        pending = collections.deque()
+        chunk = []      # frames of the chunk being collected
+        messages = []   # contents of the selected frames of the chunk
+        for [offset, msg_type, msg_content] in frames:
+            selected = ((msg_type is not None) and
+                        select(msg_type, msg_content))
+            chunk.append([offset, msg_type, msg_content, selected])
+            if selected:
+                messages.append(bytes(msg_content))
+            if len(messages) < chunk_size:
+                continue
+            pending.append([chunk, pool.submit(decode_chunk, messages, year,
+                                               doy, render)])
+            chunk = []
+            messages = []
+            while len(pending) > 2 * workers:
+                yield from merge_chunk(*pending.popleft())
+        if chunk:
+            pending.append([chunk, pool.submit(decode_chunk, messages, year,
+                                               doy, render)])
+        while pending:
+            yield from merge_chunk(*pending.popleft())
+
+def merge_chunk(chunk, job):
+    decoded = iter(job.result())
+    for [offset, msg_type, msg_content, selected] in chunk:
+        if selected:
+            yield offset, msg_type, msg_content, next(decoded)
+        else:
+            yield offset, msg_type, msg_content, None
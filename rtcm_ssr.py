@@ -25,6 +25,8 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import bisect
+import copy
 import numpy as np
 
 """
@@ -45,10 +47,41 @@ import numpy as np
    while the content of the messages are updated by using the method update 
    of the Msgs class, called by the method update_ssr of the SSR class. 
    
+   The SSR class stores the epochs in an append-only list and a dictionary
+   from the epoch to its row, i.e. the position of the epoch in the list and
+   of its Msgs objects in the list of every GNSS. Adding an epoch and
+   finding the row of an epoch do not search the epochs. The objects
+   epochs, gps, glo, gal, bds, qzs and iono are arrays built from the lists
+   when they are read after a new epoch, so that ssr.gps[j] is the Msgs
+   object of GPS at the epoch ssr.epochs[j]. The row of an epoch is given by
+   the method row.
+   
+   For a long running process, the epochs can be limited to the last
+   retention seconds: after the insertion of a new epoch, the epochs older
+   than retention w.r.t. the newest epoch are removed from the beginning of
+   the list, together with their messages and ionosphere epochs. The rows
+   are counted from the first epoch ever received, so the row dictionary
+   does not change when the old epochs are removed. The age of an epoch is
+   computed modulo the week, so the epochs of the previous week are removed
+   after the week rollover. The number of removed epochs is given by the
+   evicted object.
+   The GLONASS epochs received before any GLONASS ephemeris are not
+   converted to GPS time (gps_time=False of add_epoch), i.e. they are
+   GLONASS time of day. They do not change the newest epoch in GPS time:
+   their age is counted from the newest GPS epoch at their reception, or
+   from the first GPS epoch received after them, and w.r.t. the newest
+   GLONASS time of day (modulo the day) if no epoch in GPS time has been
+   received, e.g. for a GLONASS correction stream without ephemeris.
+   
    Every epoch of received ionospheric message the iono_epochs are updated
    using the method add_iono_epoch of the SSR class.
    In order to get the closest in epoch time global ionosphere message, the SSR
-   class has the method get_closest_iono.
+   class has the method get_closest_iono. The ionosphere epochs are also kept
+   sorted, so the closest one is found by bisection. The method get_iono
+   returns the closest message or, with blend=True, the VTEC coefficients
+   interpolated in time between the messages before and after the epoch
+   (function blend_iono). The result of the last epoch is cached, since it
+   is the same for all the satellites of the epoch.
 """
 class Msgs:
     def __init__(self):
@@ -77,92 +110,251 @@ class Msgs:
                 self.pbias = pbias
             if iono is not None:
                 self.iono = iono
+
+SYSTEMS = ['G', 'R', 'E', 'C', 'J', 'IONO']
+WEEK_SECONDS = 604800
+DAY_SECONDS = 86400
              
 class SSR:
     def __init__(self, epochs=None, iono_epochs=None, gps=None, glo=None,
-                 gal=None, bds=None, qzs=None, iono=None):
-        if epochs is None:
-            self.epochs = []
-        else:
-            self.epochs = epochs
-        
-        if iono_epochs is None:
-            self.iono_epochs = []
-        else:
-            self.iono_epochs = iono_epochs
-        
-        if gps is None:
-            self.gps = []
-        else:
-            self.gps = gps
-        
-        if glo is None:
-            self.glo = []
-        else:
-            self.glo = glo
-            
-        if gal is None:
-            self.gal = []
-        else:
-            self.gal = gal 
-            
-        if bds is None:
-            self.bds = []
-        else:
-            self.bds = bds 
-
-        if qzs is None:
-            self.qzs = []
-        else:
-            self.qzs = qzs
+                 gal=None, bds=None, qzs=None, iono=None, retention=None):
+        self.epoch_list = []                # epochs in order of reception
+        self.rows = {}                      # epoch -> row
+        self.first = 0                      # row of the first epoch of list
+        self.retention = None               # [s], all epochs if None
+        self.newest = None                  # newest epoch in GPS time
+        self.newest_glo = None              # newest GLONASS time of day
+        self.stamps = []                    # (GPS time, time) of the epochs
+        self.pending = 0                    # epochs stamped in GLONASS time
+        self.evicted = 0
+        self.msgs = {system: [] for system in SYSTEMS}
+        self.iono_epoch_list = []
+        self.iono_epoch_set = set()
+        self.iono_sorted = []               # sorted ionosphere epochs
+        self._iono_cache = None
+        self._views = {}
         
-        if iono is None:
-            self.iono = []
-        else:
-            self.iono = iono
+        if epochs is not None:
+            # rows given by the arrays of epochs and messages. A repeated
+            # epoch keeps the messages of its first row
+            msgs = [gps, glo, gal, bds, qzs, iono]
+            for j in range(len(epochs)):
+                if epochs[j] in self.rows:
+                    continue
+                self.add_epoch(epochs[j])
+                row = self.row(epochs[j])
+                for [system, system_msgs] in zip(SYSTEMS, msgs):
+                    if system_msgs is not None:
+                        self.msgs[system][row] = system_msgs[j]
+        if iono_epochs is not None:
+            for epo in iono_epochs:
+                self.add_iono_epoch(epo)
+        # the retention applies from the next epoch
+        self.retention = retention
             
     def __repr__(self):
         return ('SSR objects: epochs, iono_epochs, gps, glo, gal, bds, qzs,' +
                 'iono')
+    
+    def view(self, name):
+        # array of a list, built again only after a new epoch
+        if name not in self._views:
+            if name == 'epochs':
+                view = np.array(self.epoch_list, dtype=float)
+            elif name == 'iono_epochs':
+                view = np.array(self.iono_epoch_list, dtype=float)
+            else:
+                view = np.empty(len(self.msgs[name]), dtype=object)
+                view[:] = self.msgs[name]
+            self._views[name] = view
+        return self._views[name]
+    
+    @property
+    def epochs(self):
+        return self.view('epochs')
+    
+    @property
+    def iono_epochs(self):
+        return self.view('iono_epochs')
+    
+    @property
+    def gps(self):
+        return self.view('G')
+    
+    @property
+    def glo(self):
+        return self.view('R')
+    
+    @property
+    def gal(self):
+        return self.view('E')
+    
+    @property
+    def bds(self):
+        return self.view('C')
+    
+    @property
+    def qzs(self):
+        return self.view('J')
+    
+    @property
+    def iono(self):
+        return self.view('IONO')
+    
+    def row(self, epo):
+        # position of the epoch in epochs and in the GNSS arrays
+        return self.rows[epo] - self.first
                
-    def add_epoch(self, epo, sat=None):
-        if epo not in self.epochs:
-            self.epochs = np.append(self.epochs, epo)
-            self.gps = np.append(self.gps, Msgs())
-            self.glo = np.append(self.glo, Msgs())
-            self.gal = np.append(self.gal, Msgs())
-            self.bds = np.append(self.bds, Msgs())
-            self.qzs = np.append(self.qzs, Msgs())
-            self.iono = np.append(self.iono, Msgs())
+    def add_epoch(self, epo, sat=None, gps_time=True):
+        """
+            Add the epoch epo, in GPS time or, with gps_time=False, in
+            GLONASS time of day.
+        """
+        if epo not in self.rows:
+            self.rows[epo] = self.first + len(self.epoch_list)
+            self.epoch_list.append(epo)
+            for system in SYSTEMS:
+                self.msgs[system].append(Msgs())
+            self._views = {}
+            self.stamp(epo, gps_time)
+            if self.retention is not None:
+                self.evict()
+    
+    def stamp(self, epo, gps_time):
+        # time of the epoch for its age: in GPS time if possible
+        if gps_time:
+            # newest epoch, also after the week rollover
+            if ((self.newest is None) or
+                ((epo - self.newest) % WEEK_SECONDS < WEEK_SECONDS / 2)):
+                self.newest = epo
+            if self.pending > 0:
+                # epochs in GLONASS time received before, aged from now
+                self.stamps = [(True, epo) if not stamp[0] else stamp
+                               for stamp in self.stamps]
+                self.pending = 0
+            self.stamps.append((True, epo))
+        elif self.newest is not None:
+            self.stamps.append((True, self.newest))
+        else:
+            if ((self.newest_glo is None) or
+                ((epo - self.newest_glo) % DAY_SECONDS < DAY_SECONDS / 2)):
+                self.newest_glo = epo
+            self.stamps.append((False, epo))
+            self.pending += 1
+    
+    def age(self, stamp):
+        [gps_time, epo] = stamp
+        if gps_time:
+            return (self.newest - epo) % WEEK_SECONDS
+        return (self.newest_glo - epo) % DAY_SECONDS
+    
+    def evict(self):
+        n = 0
+        while ((n < len(self.epoch_list)) and
+               (self.age(self.stamps[n]) > self.retention)):
+            n += 1
+        if n == 0:
+            return
+        for old in self.epoch_list[:n]:
+            del self.rows[old]
+        self.pending -= sum(1 for stamp in self.stamps[:n] if not stamp[0])
+        del self.epoch_list[:n]
+        del self.stamps[:n]
+        for system in SYSTEMS:
+            del self.msgs[system][:n]
+        self.first += n
+        self.evicted += n
+        n = 0
+        while ((n < len(self.iono_epoch_list)) and
+               (self.iono_epoch_list[n] not in self.rows)):
+            old = self.iono_epoch_list[n]
+            self.iono_epoch_set.discard(old)
+            del self.iono_sorted[bisect.bisect_left(self.iono_sorted, old)]
+            n += 1
+        del self.iono_epoch_list[:n]
+        self._iono_cache = None
     
     def add_iono_epoch(self, epo):
-        if epo not in self.iono_epochs:
-            self.iono_epochs = np.append(self.iono_epochs, epo)
+        if epo not in self.iono_epoch_set:
+            self.iono_epoch_set.add(epo)
+            self.iono_epoch_list.append(epo)
+            bisect.insort(self.iono_sorted, epo)
+            self._views.pop('iono_epochs', None)
+        self._iono_cache = None
             
     def update_ssr(self, system, epo, orb=None, clck=None, orb_clck=None,
                        cbias=None, pbias=None, iono=None):
-        j = int(np.where(self.epochs == epo)[0])
-        if system == 'G':
-            self.gps[j].update(orb, clck, orb_clck, cbias, pbias, iono)
-        elif system == 'R':
-            self.glo[j].update(orb, clck, orb_clck, cbias, pbias, iono)
-        elif system == 'E':
-            self.gal[j].update(orb, clck, orb_clck, cbias, pbias, iono)
-        elif system == 'C':
-            self.bds[j].update(orb, clck, orb_clck, cbias, pbias, iono)
-        elif system == 'J':
-            self.qzs[j].update(orb, clck, orb_clck, cbias, pbias, iono)
-        elif system == 'IONO':
-            self.iono[j].update(orb, clck, orb_clck, cbias, pbias, iono)
+        if system == 'IONO':
+            self._iono_cache = None
+        if system in self.msgs:
+            j = self.row(epo)
+            self.msgs[system][j].update(orb, clck, orb_clck, cbias, pbias,
+                                        iono)
     
-    def get_closest_iono(self, ssr, epoch):
-        # find the index among the iono epochs
-        iono_index = np.where(np.abs(ssr.iono_epochs - epoch) ==
-                              np.nanmin(np.abs(ssr.iono_epochs - epoch)))[0]
-        # consider the index in the common list of epochs
-        if len(iono_index) == 1:    
-            index = np.where(ssr.epochs == ssr.iono_epochs[iono_index])[0]
+    def bracket_iono(self, epoch):
+        """
+            Ionosphere epochs before (or at) and after epoch, None if not
+            available.
+        """
+        i = bisect.bisect_right(self.iono_sorted, epoch)
+        before = self.iono_sorted[i - 1] if i > 0 else None
+        after = self.iono_sorted[i] if i < len(self.iono_sorted) else None
+        return before, after
+    
+    def closest_iono_epoch(self, epoch):
+        [before, after] = self.bracket_iono(epoch)
+        if before is None:
+            return after
+        if (after is None) or (epoch - before <= after - epoch):
+            return before
+        return after
+    
+    def get_iono(self, epoch, blend=False):
+        """
+            Global ionosphere message for epoch: the closest one or, with
+            blend, the interpolation of the messages before and after epoch.
+            None if no ionosphere message has been received.
+        """
+        if ((self._iono_cache is not None) and
+            (self._iono_cache[0] == epoch) and
+            (self._iono_cache[1] == blend)):
+            return self._iono_cache[2]
+        closest = self.closest_iono_epoch(epoch)
+        if closest is None:
+            iono = None
         else:
-            index = np.where(ssr.epochs == ssr.iono_epochs[iono_index[0]])[0]
-        return ssr.iono[index[0]].iono
-        
+            iono = self.msgs['IONO'][self.row(closest)].iono
+            [before, after] = self.bracket_iono(epoch)
+            if blend and (before is not None) and (after is not None):
+                iono0 = self.msgs['IONO'][self.row(before)].iono
+                iono1 = self.msgs['IONO'][self.row(after)].iono
+                w = (epoch - before) / (after - before)
+                blended = blend_iono(iono0, iono1, w)
+                if blended is not None:
+                    iono = blended
+        self._iono_cache = (epoch, blend, iono)
+        return iono
+    
+    def get_closest_iono(self, ssr, epoch):
+        iono = ssr.get_iono(epoch)
+        if iono is None:
+            raise ValueError('No ionosphere message received')
+        return iono
+
+def blend_iono(iono0, iono1, w):
+    """
+        VTEC message with the coefficients interpolated between the messages
+        iono0 (weight 1 - w) and iono1 (weight w). None if the messages have
+        different layers, degree or order.
+    """
+    if ((iono0.n_layers != iono1.n_layers) or 
+        not np.array_equal(iono0.height, iono1.height) or
+        not np.array_equal(iono0.degree, iono1.degree) or
+        not np.array_equal(iono0.order, iono1.order)):
+        return None
+    iono = copy.copy(iono1)
+    iono.c = [list((1 - w) * np.array(c0) + w * np.array(c1))
+              for [c0, c1] in zip(iono0.c, iono1.c)]
+    iono.s = [list((1 - w) * np.array(s0) + w * np.array(s1))
+              for [s0, s1] in zip(iono0.s, iono1.s)]
+    return iono
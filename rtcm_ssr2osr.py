@@ -35,6 +35,70 @@ import iono_computation
     Set of classes to translate SSR parameters in OSR. 
 """
 
+def orbit_iod(ssr, sv):
+    """
+        IOD of the ephemeris of the orbit correction of satellite sv, None if
+        the satellite has no orbit correction.
+    """
+    if np.any(ssr.orb):
+        orb = ssr.orb
+    elif np.any(ssr.orb_clck):
+        orb = ssr.orb_clck
+    else:
+        return None
+    i = orb.rows.get(sv)
+    if i is None:
+        return None
+    return orb.gnss_iod[i]
+
+def ephemeris_epoch(system, epoch, ls, n4):
+    """
+        Epoch of the ephemeris of the GNSS system corresponding to the SSR
+        epoch, i.e. the GLONASS time of day for GLONASS (tb). Without n4 the
+        GLONASS SSR epoch has not been converted to GPS time and it is
+        already the GLONASS time of day.
+    """
+    if (system == 'R') and (n4 is not None):
+        return (epoch - ls + 10800) % 86400
+    return epoch
+
+def ephemeris_week(system, ephemeris, n4, ls):
+    """
+        GPS week of the ephemeris of a satellite of the GNSS system.
+    """
+    if system == 'R':
+        # here we are interested only in the week since the epoch has
+        # already been set in GPS time
+        [week, epo_t] = trafo.glo_time2gps_time(ephemeris.nt, 0, n4,
+                                                ls)
+    elif system == 'E':
+        # Week needs to be defined w.r.t. GST started Ref. Galileo ICD
+        [week0, gps_time0] = trafo.gps_time_from_y_doy_hms(1999, 235, 
+                                                           0, 0, 0)
+        week = week0 + ephemeris.week
+    elif system == 'C':
+        # Week needs to be defined w.r.t. BDT started Ref. Beidou ICD
+        [week0, gps_time0] = trafo.gps_time_from_y_doy_hms(2006, 2, 
+                                                           0, 0, 0)
+        week = week0 + ephemeris.week
+    else:
+        week = ephemeris.week
+    return week
+
+def signal_frequency(system, ephemeris):
+    """
+        Frequency to be considered for correction computation as example
+        GPS/QZSS(L1), GLONASS(L1), Galileo(E1) and Beidou(2I).
+    """
+    if system == 'R':
+        ch = ephemeris.ch
+        fr = (1602 + ch * 9/16)  * 1e6
+    elif system == 'C':
+        fr = 1561.098 * 1e6
+    else:
+        fr = 2 * 77 * 10.23 * 1e6
+    return fr
+
 class RtcmSsr2osr:
     """
         Class to compute the SSR influence on user position using
@@ -56,6 +120,12 @@ class RtcmSsr2osr:
                         cartesian coordinates
             - dt:  interval of time w.r.t. epoch
             - f_out_iono: output file for the ionospheric parameters
+            - eph: optional Ephemeris object, to use the ephemeris with the
+                   IOD of the orbit correction
+            - glo_orbits: optional GloOrbits object, to integrate the GLONASS
+                          ephemeris with its cached trajectories
+            - cache: optional TrajectoryCache object, to evaluate the
+                     satellite states from the interpolated trajectories
         Output:
             callable objects for the following corrections:
             - orbit 
@@ -69,8 +139,14 @@ class RtcmSsr2osr:
         ***********************************************************************
         Description:  
         firstly, the satellite state vector is computed passing the ephemeris
-        message to the class Orbit. The ssr influence on the user position
-        is then computed for each satellite for all the components calling the 
+        message to the class Orbit, with and without correcting for the
+        satellite clock from a single light-time iteration.
+        If eph is given, the ephemeris with the IOD of the orbit correction
+        of the satellite is taken from its IOD index, the one closest to the
+        epoch within the validity of the GNSS, while the ephemeris given as
+        input, e.g. the closest in time, is used only if there is no such
+        ephemeris. The ssr influence on the user position is then computed
+        for each satellite for all the components calling the 
         classes OrbCorr, ClockCorr, CodeBias, PhaseBias, ShapiroEffect and
         WindUp. The __str__ method can be used to print the content of 
         the message in a human readable format.
@@ -78,39 +154,26 @@ class RtcmSsr2osr:
     
     def __init__(self, ssr, ephemeris, epoch, ionosphere,
                  ID, track_mode, ls, n4,
-                 receiver, dt, f_out_iono):
+                 receiver, dt, f_out_iono, eph=None, glo_orbits=None,
+                 cache=None):
         self.ID = ID
         system = self.ID[0]
         sv = self.ID[1:]
+        if eph is not None:
+            iod_eph = eph.get_iod_ephemeris(system, ID, orbit_iod(ssr, sv),
+                                            ephemeris_epoch(system, epoch,
+                                                            ls, n4))
+            if iod_eph is not None:
+                ephemeris = iod_eph
+        self.ephemeris = ephemeris
         xyz = receiver['cartesian']
-        if system == 'R':
-            # here we are interested only in the week since the epoch has
-            # already been set in GPS time
-            [week, epo_t] = trafo.glo_time2gps_time(ephemeris.nt, 0, n4,
-                                                    ls)
-        elif system == 'E':
-            # Week needs to be defined w.r.t. GST started Ref. Galileo ICD
-            [week0, gps_time0] = trafo.gps_time_from_y_doy_hms(1999, 235, 
-                                                               0, 0, 0)
-            week = week0 + ephemeris.week
-        elif system == 'C':
-            # Week needs to be defined w.r.t. BDT started Ref. Beidou ICD
-            [week0, gps_time0] = trafo.gps_time_from_y_doy_hms(2006, 2, 
-                                                               0, 0, 0)
-            week = week0 + ephemeris.week
-        else:
-            week = ephemeris.week
+        week = ephemeris_week(system, ephemeris, n4, ls)
         self.week = week
-        orbit_p = Orbit(system, xyz, ls, epoch, week)
-        # compute satellite state vector correcting for the satellite clock
-        sat_clock = 'corrected' 
-        self.sat_state = orbit_p.compute_state_vector(ephemeris,
-                                                      sat_clock)   
-        # compute satellite state vector without correcting for the satellite
-        # clock
-        sat_clock = 'uncorrected' 
-        self.sat_state_tr = orbit_p.compute_state_vector(ephemeris,
-                                                      sat_clock)          
+        orbit_p = Orbit(system, xyz, ls, epoch, week, glo_orbits, cache)
+        # compute satellite state vector correcting and without correcting
+        # for the satellite clock, from the same light-time iteration
+        [self.sat_state,
+         self.sat_state_tr] = orbit_p.compute_light_time_states(ephemeris)
         # receiver coordinates
         lat    = receiver['ellipsoidal'][0]
         lon    = receiver['ellipsoidal'][1]
@@ -120,14 +183,7 @@ class RtcmSsr2osr:
 
         # frequency to be considered for correction computation as example
         # GPS/QZSS(L1), GLONASS(L1), Galileo(E1) and Beidou(2I)
-        if system == 'R':
-            ch = ephemeris.ch
-            fr = (1602 + ch * 9/16)  * 1e6
-        elif system == 'C':
-            fr = 1561.098 * 1e6
-        else:
-            ch = 0
-            fr = 2 * 77 * 10.23 * 1e6          
+        fr = signal_frequency(system, ephemeris)
               
         # compute orbit obs line corrections
         if np.any(ssr.orb):
@@ -227,6 +283,426 @@ class RtcmSsr2osr:
             value_out = '{:8.4f}'.format(value)
         return value_out
 
+# =============================================================================
+# OSR of all the satellites of a GNSS system at one epoch
+# =============================================================================
+OSR_DTYPE = np.dtype([('week', 'i8'), ('epoch', 'f8'), ('ID', 'U3'),
+                      ('el', 'f8'), ('clck', 'f8'), ('orb', 'f8'),
+                      ('iono', 'f8'), ('shap', 'f8'), ('wup', 'f8'),
+                      ('pbias', 'f8'), ('cbias', 'f8'),
+                      ('state', 'f8', 6), ('state_tr', 'f8', 6)])
+
+class RtcmSsr2osrBatch:
+    """
+        Class to compute the SSR influence on user position for all the
+        satellites of a GNSS system at a specific epoch.
+        
+        Input:
+            - ssr: ssr parameters at the considered epoch, for the considered
+                    GNSS system
+            - ephemerides: ephemeris of each satellite of IDs
+            - epoch: specific epoch time of received message to compute
+                     the ssr influence 
+            - ionosphere: closest in time received ionospheric rtcm-ssr msg
+            - IDs: IDs of the satellites considered, e.g. ["G01", "G02"]
+            - track_mode: track mode of the considered signal, e.g. "1C"
+            - ls: leap second for the specific system
+            - n4: GLONASS four-year interval number 
+            - receiver: receiver WGS84 ellipsoidal coordinates and
+                        cartesian coordinates, or arrays of shape (m, 3) of
+                        the coordinates of m receivers
+            - dt:  interval of time w.r.t. epoch
+            - f_out_iono: output file for the ionospheric parameters
+            - eph: optional Ephemeris object, to use the ephemeris with the
+                   IOD of the orbit correction
+            - glo_orbits: optional GloOrbits object with the cached GLONASS
+                          trajectories, a new one is used if None
+            - cache: optional TrajectoryCache object, to evaluate the
+                     satellite states from the interpolated trajectories
+        Output:
+            - osr: structured array with dtype OSR_DTYPE, one row for each
+                   satellite of IDs, or of shape (m, n) for m receivers.
+                   The corrections not available are nan, the elevation is
+                   in [deg]
+            
+        ***********************************************************************
+        Description:  
+        the satellite state vectors are computed for all the satellites with
+        the class KeplerOrbits, or GloOrbits for GLONASS. Then, the orbit and
+        clock corrections, the shapiro effect, the wind-up effect and the
+        elevation are computed for all the satellites together with array
+        operations, and the code and phase bias are looked up in the bias
+        index of the messages. The global ionosphere is computed for each
+        satellite by GlobalIono, which prints its output in f_out_iono. The
+        results are the same as the ones of RtcmSsr2osr, which is kept as
+        reference implementation for cross-checking. The __str__ method
+        gives the lines of the satellites in the same format as RtcmSsr2osr.
+        With several receivers, the satellite states are computed once, for
+        the first receiver, and moved along the orbit to the transmission
+        time of the signal of each receiver by a second order expansion in
+        the difference of light time (method light_time_shift), whose error
+        is below 1e-6 m for differences of light time up to 50 ms. The
+        receiver dependent corrections are computed for all the pairs of
+        receiver and satellite together, the global ionosphere by the class
+        IonoBatch without debug output, the clock corrections and the biases
+        only once.
+    """
+    
+    def __init__(self, ssr, ephemerides, epoch, ionosphere,
+                 IDs, track_mode, ls, n4,
+                 receiver, dt, f_out_iono, eph=None, glo_orbits=None,
+                 cache=None):
+        n = len(IDs)
+        self.osr = np.zeros(n, dtype=OSR_DTYPE)
+        self.ephemerides = []
+        if n == 0:
+            return
+        system = IDs[0][0]
+        svs = [ID[1:] for ID in IDs]
+        xyz = receiver['cartesian']
+        self.rec = np.asarray(receiver['cartesian'], dtype=float)
+        llh = np.asarray(receiver['ellipsoidal'], dtype=float)
+        multi = self.rec.ndim == 2
+        if multi:
+            # states computed for the first receiver
+            xyz = self.rec[0]
+            n_rec = len(self.rec)
+        else:
+            n_rec = 1
+        
+        # satellite state vectors, with and without satellite clock
+        fr = np.zeros(n)
+        for [k, ID] in enumerate(IDs):
+            ephemeris = ephemerides[k]
+            if eph is not None:
+                iod_eph = eph.get_iod_ephemeris(system, ID,
+                                                orbit_iod(ssr, svs[k]),
+                                                ephemeris_epoch(system,
+                                                                epoch, ls,
+                                                                n4))
+                if iod_eph is not None:
+                    ephemeris = iod_eph
+            self.ephemerides.append(ephemeris)
+            week = ephemeris_week(system, ephemeris, n4, ls)
+            self.osr['week'][k] = week
+            fr[k] = signal_frequency(system, ephemeris)
+        if system == 'R':
+            if glo_orbits is None:
+                glo_orbits = GloOrbits()
+            [self.osr['state'],
+             self.osr['state_tr']] = glo_orbits.compute_light_time_states(
+                                                self.ephemerides, epoch, ls,
+                                                self.osr['week'], xyz, cache)
+        else:
+            orbits = KeplerOrbits(system, self.ephemerides, cache)
+            [self.osr['state'],
+             self.osr['state_tr']] = orbits.compute_light_time_states(epoch,
+                                                                      ls, xyz)
+        self.osr['epoch'] = epoch
+        self.osr['ID'] = IDs
+        if multi:
+            osr = np.repeat(self.osr[np.newaxis, :], n_rec, axis=0)
+            [osr['state'],
+             osr['state_tr']] = RtcmSsr2osrBatch.light_time_shift(
+                                                        self.osr['state'],
+                                                        self.osr['state_tr'],
+                                                        xyz, self.rec)
+            self.osr = osr
+            # pairs of receiver and satellite
+            rows = self.osr.reshape(-1)
+            rec = np.repeat(self.rec, n, axis=0)
+            lat = np.repeat(llh[:, 0], n)
+            lon = np.repeat(llh[:, 1], n)
+            sv_rows = svs * n_rec
+            fr_rows = np.tile(fr, n_rec)
+        else:
+            rows = self.osr
+            rec = self.rec
+            lat = llh[0]
+            lon = llh[1]
+            sv_rows = svs
+            fr_rows = fr
+        state = rows['state']
+        state_tr = rows['state_tr']
+        
+        # orbit corrections
+        if np.any(ssr.orb):
+            orb = ssr.orb
+        elif np.any(ssr.orb_clck):
+            orb = ssr.orb_clck
+        else:
+            orb = None
+        rows['orb'] = RtcmSsr2osrBatch.orbit_corr(orb, sv_rows, state_tr,
+                                                  rec)
+        
+        # clock corrections
+        if np.any(ssr.clck):
+            clock = ssr.clck
+        elif np.any(ssr.orb_clck):
+            clock = ssr.orb_clck
+        else:
+            clock = None
+        rows['clck'] = np.tile(RtcmSsr2osrBatch.clock_corr(clock, svs, dt),
+                               n_rec)
+        
+        # code and phase bias
+        if np.any(ssr.cbias):
+            rows['cbias'] = np.tile(RtcmSsr2osrBatch.bias(ssr.cbias, svs,
+                                                          track_mode), n_rec)
+        else:
+            rows['cbias'] = np.nan
+        if np.any(ssr.pbias):
+            rows['pbias'] = np.tile(RtcmSsr2osrBatch.bias(ssr.pbias, svs,
+                                                          track_mode), n_rec)
+        else:
+            rows['pbias'] = np.nan
+        
+        # relativistic shapiro effect
+        rows['shap'] = RtcmSsr2osrBatch.shapiro(state_tr[:, 0:3], rec)
+        
+        # global ionosphere
+        rows['iono'] = np.nan
+        if np.any(ionosphere) and multi:
+            rows['iono'] = iono_computation.IonoBatch(epoch, state[:, 0:3],
+                                                      rec, fr_rows,
+                                                      ionosphere).stec_corr_f1
+        elif np.any(ionosphere):
+            for [k, ID] in enumerate(IDs):
+                rows['iono'][k] = GlobalIono(ionosphere, epoch,
+                                             system, ID, state[k],
+                                             rec, fr[k],
+                                             f_out_iono).corr
+        
+        # wind up effect
+        if np.any(ssr.pbias):
+            rows['wup'] = RtcmSsr2osrBatch.wind_up(ssr.pbias, sv_rows, dt,
+                                                   state, fr_rows, rec,
+                                                   lat, lon)
+        else:
+            rows['wup'] = np.nan
+        
+        # ellipsoidal elevation
+        rows['el'] = RtcmSsr2osrBatch.elevation(state[:, 0:3], rec,
+                                                lat, lon)
+    
+    def __len__(self):
+        return len(self.osr)
+    
+    def __str__(self):
+        return '\n'.join(RtcmSsr2osrBatch.make_output_line(osr)
+                         for osr in self.osr.reshape(-1))
+    
+    def __repr__(self):
+        return ('OSR batch objects: osr, ephemerides')
+    
+    def visible(self):
+        """
+            Mask of the satellites with elevation not lower than 0 deg, at
+            the precision of the output.
+        """
+        return np.round(self.osr['el'], 3) >= 0
+    
+    def light_time_shift(state, state_tr, xyz, recs):
+        """
+            State vectors of the satellites for the receivers recs, shape
+            (m, 3), from the states computed for the receiver xyz: the
+            states are moved by the difference of light time of the signal
+            to each receiver, with the velocity and the acceleration of the
+            central gravity field in the Earth-fixed frame (method
+            acceleration). Output of shape (m, n, 6).
+        """
+        c = Constants().c
+        pos = state[:, 0:3]
+        vel = state[:, 3:6]
+        acc = RtcmSsr2osrBatch.acceleration(state)
+        acc_tr = RtcmSsr2osrBatch.acceleration(state_tr)
+        radial = LA.norm(pos - xyz, axis=1)
+        dt = np.zeros((len(recs), len(state), 1))
+        # the difference of light time is smaller than 50 ms
+        for i in range(3):
+            radial_rec = LA.norm(pos + vel * dt + acc * dt ** 2 / 2 -
+                                 recs[:, np.newaxis, :], axis=2)
+            dt = -(radial_rec - radial)[..., np.newaxis] / c
+        shift = np.concatenate([vel * dt + acc * dt ** 2 / 2, acc * dt],
+                               axis=2)
+        shift_tr = np.concatenate([state_tr[:, 3:6] * dt +
+                                   acc_tr * dt ** 2 / 2, acc_tr * dt], axis=2)
+        return [state + shift, state_tr + shift_tr]
+    
+    def acceleration(state):
+        """
+            Acceleration [m/s^2] of the satellites in the Earth-fixed frame,
+            central gravity field with the Coriolis and centrifugal terms.
+        """
+        pos = state[:, 0:3]
+        vel = state[:, 3:6]
+        omega = np.array([0, 0, Constants().omega_e])
+        r = LA.norm(pos, axis=1)[:, np.newaxis]
+        return (-Constants().mu_gal * pos / r ** 3 -
+                2 * np.cross(omega, vel) -
+                np.cross(omega, np.cross(omega, pos)))
+    
+    def rows(sv_list, index):
+        """
+            Rows of the satellites of sv_list in a message, with the mask of
+            the satellites found in the message.
+        """
+        i = np.array([index.get(sv, -1) for sv in sv_list], dtype=int)
+        return [i, i >= 0]
+    
+    def orbit_corr(orb, sv_list, state_tr, rec):
+        corr = np.full(len(sv_list), np.nan)
+        if orb is None:
+            return corr
+        [i, found] = RtcmSsr2osrBatch.rows(sv_list, orb.rows)
+        if not np.any(found):
+            return corr
+        i = i[found]
+        rec = np.broadcast_to(rec, np.shape(state_tr[:, 0:3]))[found]
+        sat_tr = state_tr[found, 0:3]
+        vel_tr = state_tr[found, 3:]
+        # radial, along-track and cross-track unit vectors
+        alo = vel_tr / LA.norm(vel_tr, axis=1)[:, None]
+        crs = np.cross(sat_tr, vel_tr)
+        crs = crs / LA.norm(crs, axis=1)[:, None]
+        rad = np.cross(alo, crs)
+        delta_x = (rad * np.asarray(orb.dr, dtype=float)[i, None] +
+                   alo * np.asarray(orb.dt, dtype=float)[i, None] +
+                   crs * np.asarray(orb.dn, dtype=float)[i, None])
+        sight = sat_tr - rec
+        sight = sight / LA.norm(sight, axis=1)[:, None]
+        corr[found] = np.sum(delta_x * sight, axis=1)
+        return corr
+    
+    def clock_corr(clock, sv_list, dt):
+        corr = np.full(len(sv_list), np.nan)
+        if clock is None:
+            return corr
+        [i, found] = RtcmSsr2osrBatch.rows(sv_list, clock.rows)
+        i = i[found]
+        corr[found] = (1e-3 * (np.asarray(clock.dc0, dtype=float)[i] +
+                               np.asarray(clock.dc1, dtype=float)[i] * dt +
+                               np.asarray(clock.dc2, dtype=float)[i] * dt**2))
+        return corr
+    
+    def bias(bias, sv_list, signal_ID):
+        try:
+            biases = bias.biases
+        except AttributeError:
+            return np.full(len(sv_list), np.nan)
+        corr = [biases.get((sv, signal_ID), []) for sv in sv_list]
+        return np.array([np.nan if np.size(value) == 0 else value
+                         for value in corr], dtype=float)
+    
+    def shapiro(sat_tr, rec):
+        c = Constants().c
+        mu = Constants().mu_gps
+        r_sat = LA.norm(sat_tr, axis=1)
+        r_rec = LA.norm(rec, axis=-1)
+        r_sat_rec = LA.norm(sat_tr - rec, axis=1)
+        return (2 * mu / c ** 2 *
+                np.log((r_sat + r_rec + r_sat_rec) /
+                       (r_sat + r_rec - r_sat_rec)))
+    
+    def elevation(sat, rec, lat, lon):
+        """ Ellipsoidal elevation [deg], see PiercePoint.compute_az_el.
+            lat, lon can be arrays with one receiver for each satellite
+        """
+        lat = np.deg2rad(lat)
+        lon = np.deg2rad(lon)
+        R = np.array([[-np.sin(lon)               ,
+                       +np.cos(lon)               ,
+                       +np.zeros_like(lon)         ],
+                      [-np.sin(lat) * np.cos(lon),
+                       -np.sin(lat) * np.sin(lon),
+                       +np.cos(lat)                ],
+                      [+np.cos(lat) * np.cos(lon),
+                       +np.cos(lat) * np.sin(lon),
+                       +np.sin(lat)                ]])
+        s = np.einsum('ij...,...j->...i', R, sat - rec)
+        return np.rad2deg(np.arctan2(s[:, 2],
+                                     np.sqrt(s[:, 0] ** 2 + s[:, 1] ** 2)))
+    
+    def wind_up(pbias, sv_list, dt, state, fr, rec, lat, lon):
+        corr = np.full(len(sv_list), np.nan)
+        try:
+            [i, found] = RtcmSsr2osrBatch.rows(sv_list, pbias.rows)
+        except AttributeError:
+            return corr
+        if not np.any(found):
+            return corr
+        i = i[found]
+        sat = state[found, 0:3]
+        vel = state[found, 3:].copy()
+        lam = Constants().c / fr[found]
+        rec = np.broadcast_to(rec, np.shape(state[:, 0:3]))[found]
+        diff = rec - sat
+        k = diff / LA.norm(diff, axis=1)[:, None]
+        
+        lat = np.broadcast_to(np.deg2rad(lat), len(sv_list))[found]
+        lon = np.broadcast_to(np.deg2rad(lon), len(sv_list))[found]
+        
+        # correction for Eart rotation
+        vel[:, 0] = vel[:, 0] - Constants().omega_e * sat[:, 1]
+        vel[:, 1] = vel[:, 1] + Constants().omega_e * sat[:, 0]
+        
+        # ee, en unit vectors in ENU ref frame
+        ee = np.stack([-np.sin(lon), +np.cos(lon), np.zeros_like(lon)],
+                      axis=-1)
+        en = np.stack([-np.cos(lon) * np.sin(lat),
+                       -np.sin(lon) * np.sin(lat),
+                       +np.cos(lat)], axis=-1)
+        
+        # ex, ey, ez unit vectors of the satellites
+        ez = -sat / LA.norm(sat, axis=1)[:, None]
+        ey = -np.cross(sat, vel)
+        ey = ey / LA.norm(ey, axis=1)[:, None]
+        ex = np.cross(ey, ez)
+        
+        # yaw angle rotation
+        yaw = np.deg2rad(np.asarray(pbias.yaw_angle, dtype=float)[i] +
+                         np.asarray(pbias.yaw_rate, dtype=float)[i] * dt)
+        cos_yaw = np.cos(yaw)[:, None]
+        sin_yaw = np.sin(yaw)[:, None]
+        [ex, ey] = [cos_yaw * ex + sin_yaw * ey,
+                    -sin_yaw * ex + cos_yaw * ey]
+        
+        # effective dipoles for the satellites and the receiver
+        D_sat = (ex - k * np.sum(k * ex, axis=1)[:, None] -
+                 np.cross(k, ey))
+        D_rec = (ee - k * np.sum(k * ee, axis=1)[:, None] +
+                 np.cross(k, en))
+        
+        # wind up computation
+        gamma = np.sum(k * np.cross(D_sat, D_rec), axis=1)
+        omega = np.arccos(np.sum(D_sat * D_rec, axis=1) /
+                          (LA.norm(D_sat, axis=1) * LA.norm(D_rec, axis=1)))
+        omega = -omega / (2 * np.pi)
+        omega = np.where(gamma < 0, -omega, omega)
+        # correction for lambda1, lambda2
+        corr[found] = omega * lam
+        return corr
+    
+    def make_output_line(osr):
+        """
+            Line of a satellite in the output format of RtcmSsr2osr.
+        """
+        def make_output_format(value):
+            if np.isnan(value):
+                return '{:8s}'.format('    n/a')
+            return '{:8.4f}'.format(value)
+        return ('   ' + '{:8.0f}'.format(osr['week']) +
+                '   ' + '{:8.4f}'.format(osr['epoch']) + '    ' +
+                f'{osr["ID"]}' + '    ' +
+                '{:7.3f}'.format(osr['el']) + '  ' +
+                make_output_format(osr['clck']) + '  ' +
+                make_output_format(osr['orb']) + '   ' +
+                make_output_format(osr['iono']) + '   ' +
+                make_output_format(osr['shap']) + '   ' +
+                make_output_format(osr['wup']) + '   ' +
+                make_output_format(osr['pbias']) + '   ' +
+                make_output_format(osr['cbias']))
+
 # =============================================================================
 # OSR orbit corrections
 # =============================================================================
@@ -240,11 +716,10 @@ class OrbCorr:
             orbit correction along the line of sight
     """
     def __init__(self, orb, state_tr, rec, sv):
-        i = np.where(orb.gnss_id == sv)
-        if np.size(i) == 0:
+        i = orb.rows.get(sv)
+        if i is None:
             self.corr = []
         else:
-            i = int(i[0])
             # compute radial, along-track and cross-track satellite coordinates
             sat_tr = state_tr[0:3]
             vel_tr = state_tr[3:]
@@ -274,11 +749,10 @@ class ClockCorr:
             clock correction along the line of sight in [m]
     """
     def __init__(self, clock, dt, sv):
-        i = np.where(clock.gnss_id == sv)        
-        if np.size(i) == 0:
+        i = clock.rows.get(sv)
+        if i is None:
             self.corr = []
         else:
-            i = int(i[0])
             self.corr = (1e-3 * (clock.dc0[i] + clock.dc1[i] * dt +
                                  clock.dc2[i] * dt**2))
 # =============================================================================
@@ -295,21 +769,9 @@ class CodeBias:
     """
     def __init__(self, cbias, sv, signal_ID): 
         try:
-            i = np.where(cbias.gnss_id == sv)
+            self.corr = cbias.biases.get((sv, signal_ID), [])
         except AttributeError:
             self.corr = []
-        if np.size(i) == 0:
-            self.corr = []
-        else:
-            i = int(i[0])   
-            if signal_ID not in cbias.name[i]:
-                self.corr = []
-            else:
-                k = 0
-                for s in cbias.name[i]:
-                    if s == signal_ID:
-                        self.corr = cbias.bias[i][k] 
-                    k = k + 1      
 # =============================================================================
 # OSR Phase Bias    
 # =============================================================================
@@ -324,23 +786,9 @@ class PhaseBias:
     """
     def __init__(self, pbias, sv, signal_ID):
         try:
-            i = np.where(pbias.gnss_id == sv)
+            self.corr = pbias.biases.get((sv, signal_ID), [])
         except AttributeError:
             self.corr = []
-            return
-        if np.size(i) == 0:
-            self.corr = []
-        else:
-            i = int(i[0])   
-            k = 0
-            if signal_ID not in pbias.name[i]:
-                self.corr = []
-            else:
-                k = 0
-                for s in pbias.name[i]:
-                    if s == signal_ID:
-                        self.corr = pbias.bias[i][k] 
-                    k = k + 1         
             
 # =============================================================================
 #    Global Ionosphere Spherical Harmonics
@@ -396,14 +844,13 @@ class WindUp:
                 
         """
         try:
-            i = np.where(pbias.gnss_id == sv)
+            i = pbias.rows.get(sv)
         except AttributeError:
             self.corr = []
             return
-        if np.size(i) == 0:
+        if i is None:
             self.corr = []
         else:
-            i = int(i[0])
             sat = state[0:3]
             vel = state[3:]
         
@@ -512,7 +959,8 @@ class Orbit:
             - propagate_orbit_elements, it propagates the orbt elements
                                         from ephemeris for the desired epoch
     """
-    def __init__(self, gnss, receiver_xyz, ls, epoch, week):
+    def __init__(self, gnss, receiver_xyz, ls, epoch, week, glo_orbits=None,
+                 cache=None):
         self.gnss = gnss
         self.receiver_xyz = receiver_xyz
         self.ls = ls
@@ -520,16 +968,66 @@ class Orbit:
         self.week = week
         self.c     = Constants().c    # speed of light [m/s]          
         self.omega_E = Constants().omega_e  # Earth rotation rate   [rad/s]
+        # GloOrbits integrating the GLONASS ephemeris, ode if None
+        self.glo_orbits = glo_orbits
+        # TrajectoryCache of the ephemeris, not used if None
+        self.cache = cache
               
+    def glo_time(self, ephemeris, tf):
+        """
+            Day in the four years cycle and time of day of the GLONASS
+            ephemeris at the GPS time of week tf, corrected for the satellite
+            clock bias, and satellite clock bias dts.
+        """
+        Rday  = ephemeris.nt
+        tb    = ephemeris.tb
+        gamma = ephemeris.gamma
+        tau   = ephemeris.tau
+        dt_tau_c = ephemeris.tau_c
+        
+        i_day = int((tf + 10800.0 + 0.005) / Constants().day_seconds)
+        t_day = tf + 10800.0 - i_day * Constants().day_seconds
+    
+        # With correction for Moskow time
+        [iy, DOY,
+         hh, mm,
+         ss] = trafo.gpsTime2y_doy_hms(self.week, tf + 10800.0) 
+    
+        if np.mod(iy, 4) != 0:
+            DOY = DOY + np.mod(iy, 4) * 365 + 1
+        i_day = DOY  # day in four years cycle
+    
+        tk = (i_day - Rday) * Constants().day_seconds + (t_day - tb)
+
+        while (tk <= -Constants().day_seconds/2):
+            tk = tk + Constants().day_seconds
+        while (tk > Constants().day_seconds/2):
+            tk = tk - Constants().day_seconds
+        
+        # calculate actual clock drift and bias
+        dts    = -(tau - gamma * tk)
+        if np.abs(dt_tau_c) < 1.0:    # plausibilty check for TauC
+            dts = dts -  dt_tau_c
+
+        t_day = t_day - dts
+        tk = ((i_day - Rday) * Constants().day_seconds +
+              (t_day - tb))   # with correct t_day
+        while (tk <= -Constants().day_seconds/2):
+            tk = tk + Constants().day_seconds
+            t_day = t_day + Constants().day_seconds
+        while (tk > Constants().day_seconds/2):
+            tk = tk - Constants().day_seconds   
+            t_day = t_day - Constants().day_seconds
+        
+        dts = -(tau - gamma * tk)
+        return [i_day, t_day, dts]
+    
     def compute_state_vector(self, ephemeris, sat_clock):
 
         if self.gnss == 'R':
             # Info from message:
             Rday  = ephemeris.nt
             tb    = ephemeris.tb
-            gamma = ephemeris.gamma
-            tau   = ephemeris.tau
-            dt_tau_c = ephemeris.tau_c
 
             # Integration step
             step = 60   # [s]
@@ -558,43 +1056,10 @@ class Orbit:
                     tf = self.epoch - dtt - self.ls
     
                 dt_sv_last = dt_sv
-                i_day = int((tf + 10800.0 + 0.005) / Constants().day_seconds)
-                t_day = tf + 10800.0 - i_day * Constants().day_seconds
-            
-                # With correction for Moskow time
-                [iy, DOY,
-                 hh, mm,
-                 ss] = trafo.gpsTime2y_doy_hms(self.week, tf + 10800.0) 
-            
-                if np.mod(iy, 4) != 0:
-                    DOY = DOY + np.mod(iy, 4) * 365 + 1
-                i_day = DOY  # day in four years cycle
-            
-                tk = (i_day - Rday) * Constants().day_seconds + (t_day - tb)
-   
-                while (tk <= -Constants().day_seconds/2):
-                    tk = tk + Constants().day_seconds
-                while (tk > Constants().day_seconds/2):
-                    tk = tk - Constants().day_seconds
-                
-                # calculate actual clock drift and bias
-                dts    = -(tau - gamma * tk)
-                if np.abs(dt_tau_c) < 1.0:    # plausibilty check for TauC
-                    dts = dts -  dt_tau_c
-
-                t_day = t_day - dts
-                tk = ((i_day - Rday) * Constants().day_seconds +
-                      (t_day - tb))   # with correct t_day
-                while (tk <= -Constants().day_seconds/2):
-                    tk = tk + Constants().day_seconds
-                    t_day = t_day + Constants().day_seconds
-                while (tk > Constants().day_seconds/2):
-                    tk = tk - Constants().day_seconds   
-                    t_day = t_day - Constants().day_seconds
+                [i_day, t_day, dts] = Orbit.glo_time(self, ephemeris, tf)
                 
                 dt = ((i_day - d_xsv) * Constants().day_seconds +
                       (t_day - td_xsv))
-                dts = -(tau - gamma * tk)
 
                 if (np.abs(dt) <= epsilon) :
                     coord = np.array([state_0[0] + state_0[3] * dt,
@@ -609,7 +1074,16 @@ class Orbit:
                         d_xsv  = Rday
                         td_xsv = tb 
                     t0 = td_xsv + (d_xsv - i_day) *Constants().day_seconds
-                    state = Orbit.propagate_state(self, t0, state_0,
+                    if self.cache is not None:
+                        # interpolated trajectory of the ephemeris
+                        state = self.cache.evaluate(self.gnss, [ephemeris],
+                                                    [t_day - t0])[0][0]
+                    elif self.glo_orbits is not None:
+                        # trajectory of the ephemeris from tb
+                        state = self.glo_orbits.state([ephemeris],
+                                                      [t_day - t0])[0]
+                    else:
+                        state = Orbit.propagate_state(self, t0, state_0,
                                                       luni_solar,
                                                       step, t_day) 
                     if np.size(state) > 6:
@@ -631,6 +1105,9 @@ class Orbit:
             coord = Orbit.pz2wgs(self, coord)
             vel   = Orbit.pz2wgs(self, vel)
             state = np.append(coord, vel)
+            # transmission time and satellite clock of the last iteration
+            self.t_tx = tf
+            self.dt_sv = dt_sv
             
             return state 
         else:
@@ -655,16 +1132,59 @@ class Orbit:
                 dt_sv_last = dt_sv
                 [state,
                  t_xsv_old,
-                 dt_sv] = Orbit.propagate_orbit_elements(self, ephemeris,
-                                                         tf, t_xsv, state_0)
+                 dt_sv] = Orbit.elements_state(self, ephemeris,
+                                               tf, t_xsv, state_0)
 
                 radial = LA.norm(np.array([state[0], state[1],
                                            state[2]]) - self.receiver_xyz)
                 dtt = (radial - radial_last) / self.c
                 t_xsv = t_xsv_old
                 state_0 = state
+            # transmission time and satellite clock of the last iteration
+            self.t_tx = tf
+            self.dt_sv = dt_sv
     
         return state
+    
+    def compute_light_time_states(self, ephemeris):
+        """
+            State vectors with ('corrected') and without ('uncorrected')
+            correcting for the satellite clock, from a single light-time
+            iteration: the iteration converges on the transmission time
+            corrected for the satellite clock, and the uncorrected state is
+            given at the same transmission time without the satellite clock
+            term. For GLONASS it is extrapolated linearly from the corrected
+            state, the satellite clock being smaller than a millisecond.
+        """
+        state = self.compute_state_vector(ephemeris, 'corrected')
+        t_tr = self.t_tx - self.dt_sv
+        if self.gnss == 'R':
+            state_tr = np.append(state[0:3] - state[3:] * self.dt_sv,
+                                 state[3:])
+        else:
+            # no linear propagation from the corrected state
+            [state_tr,
+             t_xsv, dts] = Orbit.elements_state(self, ephemeris,
+                                                t_tr, np.inf, state)
+        return [state, state_tr]
+    
+    def elements_state(self, ephemeris, time, t_xsv, state_0):
+        """
+            State vector as propagate_orbit_elements, evaluated from the
+            trajectory cache if given.
+        """
+        if self.cache is None:
+            return Orbit.propagate_orbit_elements(self, ephemeris, time,
+                                                  t_xsv, state_0)
+        [state, dts] = self.cache.evaluate(self.gnss, [ephemeris], [time])
+        state = state[0]
+        # Linear propagation of the orbit
+        epsilon = 1e-3
+        dt  =  np.abs(time - t_xsv)
+        if dt < epsilon:
+            state = state_0 + np.array([state_0[3] * dt, state_0[4] * dt,
+                                        state_0[5] * dt, 0, 0, 0])
+        return [state, time, dts[0]]
         
     def propagate_state(self, t0, y0, parameters, step, tf):
         """
@@ -707,7 +1227,7 @@ class Orbit:
     
             return [v_x, v_y, v_z, a_x, a_y, a_z] 
                     
-        t  = np.linspace(t0, tf, np.abs(tf - t0) / step + 1)
+        t  = np.linspace(t0, tf, int(np.ceil(np.abs(tf - t0) / step)) + 1)
         r = ode(f).set_integrator('dop853')
         r.set_initial_value(y0, t0) 
 
@@ -927,6 +1447,490 @@ class Orbit:
 
         return wgs
     
+# =============================================================================
+#          satellite state vectors of several broadcast ephemerides
+# =============================================================================
+class KeplerOrbits:
+    """
+        Class to compute the state vectors of several satellites of a GNSS
+        with Keplerian broadcast ephemeris (GPS, Galileo, Beidou, QZSS) with
+        array operations.
+        It is defined by two methods:
+            - propagate, it propagates the orbit elements of all the
+                         ephemerides for a vector of times
+            - compute_state_vectors, light-time iteration of all the
+                                     satellites as Orbit.compute_state_vector
+        
+        The formulas are the ones of Orbit.propagate_orbit_elements, which is
+        the reference for a single satellite: the Kepler equation is solved
+        for all the satellites and times together, stopping the iteration of
+        each element at the same tolerance, and the rotation matrices are
+        stacked along the satellites and times.
+    """
+    ELEMENTS = ['root_a', 'dn', 'ecc', 'i0', 'idot', 'omega_0', 'omega_dot',
+                'omega', 'm0', 'crc', 'crs', 'cuc', 'cus', 'cic', 'cis',
+                'af0', 'af1', 'af2', 'toe', 'toc', 'week']
+    
+    def __init__(self, gnss, ephemerides, cache=None):
+        self.gnss = gnss
+        self.c       = Constants().c        # speed of light [m/s]
+        self.omega_E = Constants().omega_e  # Earth rotation rate   [rad/s]
+        self.ephemerides = list(ephemerides)
+        # TrajectoryCache of the ephemeris, not used if None
+        self.cache = cache
+        # orbit elements as columns, one row for each ephemeris
+        for name in KeplerOrbits.ELEMENTS:
+            setattr(self, name,
+                    np.array([getattr(kepler, name)
+                              for kepler in ephemerides],
+                             dtype=float).reshape(-1, 1))
+    
+    def __len__(self):
+        return len(self.toe)
+    
+    def propagate(self, time):
+        """
+            State vectors at time, in seconds of week. With time of shape
+            (m,) all the ephemerides are propagated at all the times, with
+            time of shape (n, 1) or (n, m) each ephemeris has its own times.
+            
+            Output:
+                - state: ECEF state vectors [m, m/s], shape (n, m, 6)
+                - dts: satellite clock bias with relativistic correction [s],
+                       shape (n, m)
+                - dtsdot: satellite clock drift [s/s], shape (n, m)
+        """
+        if ((self.gnss == 'G') | (self.gnss == 'J')):
+            F  = Constants().F_gps
+            mu = Constants().mu_gps
+        elif ((self.gnss == 'E') | (self.gnss == 'C')):
+            F  = Constants().F_gal
+            mu = Constants().mu_gal
+        week_seconds = Constants().week_seconds
+        time = np.atleast_1d(np.asarray(time, dtype=float))
+        if time.ndim == 1:
+            time = time[np.newaxis, :]
+        time = time + np.zeros_like(self.toe)
+        
+        a = self.root_a * self.root_a
+        e = self.ecc
+        
+        # Clock corrections
+        delta_clock = time - self.toc
+        while np.any(delta_clock <= -week_seconds/2):
+            delta_clock = np.where(delta_clock <= -week_seconds/2,
+                                   delta_clock + week_seconds, delta_clock)
+        while np.any(delta_clock >= week_seconds/2):
+            delta_clock = np.where(delta_clock >= week_seconds/2,
+                                   delta_clock - week_seconds, delta_clock)
+        dtsdot = self.af1 + self.af2 * delta_clock
+        dts    = self.af0 + (self.af1 + self.af2 * delta_clock) * delta_clock
+        
+        # Period
+        tol = 10.0 * 1e-3   # [s]
+        dT  = self.week * week_seconds + time
+        T   = time - self.toe - dts
+        T = np.where(np.abs(T) > week_seconds/2,
+                     np.mod(T, week_seconds/2) - np.sign(T) * week_seconds/2,
+                     T)
+        
+        # Mean motion, mean anomaly and its derivative
+        n = np.sqrt(mu / (a ** 3.0)) + self.dn
+        M = self.m0 + n * T
+        dM = n
+        
+        # Eccentric anomaly : M = E - e*sin(E), the elements which reached
+        # the tolerance are not iterated any more
+        i_max = 10
+        toll  = 0.5 * 1e-11
+        E = M
+        active = np.ones(np.shape(M), dtype=bool)
+        for i in range(i_max):
+            E_next = M + e * np.sin(E)
+            diff = np.abs(E_next - E)
+            E = np.where(active, E_next, E)
+            active = active & (diff >= toll)
+            if not np.any(active):
+                break
+        sin_E = np.sin(E)
+        cos_E = np.cos(E)
+        
+        # Correction of clock for the relativistic effect 
+        saver = 1.0 - e * cos_E
+        dtr   = F * e * self.root_a * sin_E
+        dfr   = F * e * self.root_a * cos_E * n / saver
+        if self.gnss == 'C':
+            dtr = -2 * mu ** 0.5 / (self.c ** 2) * e * self.root_a * sin_E
+        dts    = dts + dtr
+        dtsdot = dtsdot + dfr
+        
+        # Derivative eccentric anomaly, true anomaly and its derivative
+        dE = dM / saver
+        theta = np.arctan2((np.sqrt(1.0 - e ** 2.0) * sin_E) / saver,
+                           (cos_E - e) / saver)
+        dtheta = (dE * np.sqrt(1.0 - e ** 2.0)) / saver
+        
+        # Argument of latitude and its derivative
+        u_bar = self.omega + theta
+        du_bar = dtheta
+        sin_2u = np.sin(2.0 * u_bar)
+        cos_2u = np.cos(2.0 * u_bar)
+        
+        # Periodic corrections and their derivatives
+        delta_r = self.crs * sin_2u + self.crc * cos_2u
+        delta_u = self.cus * sin_2u + self.cuc * cos_2u
+        delta_i = self.cis * sin_2u + self.cic * cos_2u
+        ddelta_r = 2 * du_bar * (self.crs * cos_2u - self.crc * sin_2u)
+        ddelta_u = 2 * du_bar * (self.cus * cos_2u - self.cuc * sin_2u)
+        ddelta_i = 2 * du_bar * (self.cis * cos_2u - self.cic * sin_2u)
+        
+        # Perturbed radius, argument of latitude and inclination
+        r = a * (1.0 - e * cos_E) + delta_r
+        u = u_bar + delta_u
+        i = self.i0 + self.idot * T + delta_i
+        dr = a * e * dE * sin_E + ddelta_r
+        d_i = self.idot + ddelta_i
+        
+        # Greenwich longitude of the ascending node and its derivative
+        lambda_Om = (self.omega_0 + (self.omega_dot - self.omega_E) * T -
+                     self.omega_E * self.toe)
+        dOmega = (self.omega_dot - self.omega_E) + np.zeros_like(T)
+        
+        # Rotation matrices, stacked along the ephemerides and times
+        zero = np.zeros_like(T)
+        one = np.ones_like(T)
+        sin_L = np.sin(lambda_Om)
+        cos_L = np.cos(lambda_Om)
+        sin_i = np.sin(i)
+        cos_i = np.cos(i)
+        R3 = KeplerOrbits.stack([[cos_L, -sin_L, zero],
+                                 [sin_L,  cos_L, zero],
+                                 [zero ,   zero,  one]])
+        R1 = KeplerOrbits.stack([[one , zero ,   zero],
+                                 [zero, cos_i, -sin_i],
+                                 [zero, sin_i,  cos_i]])
+        dR1 = d_i[..., np.newaxis, np.newaxis] * KeplerOrbits.stack(
+                                [[zero,   zero,   zero],
+                                 [zero, -sin_i, -cos_i],
+                                 [zero,  cos_i, -sin_i]])
+        dR3 = dOmega[..., np.newaxis, np.newaxis] * KeplerOrbits.stack(
+                                [[-sin_L, -cos_L, zero],
+                                 [+cos_L, -sin_L, zero],
+                                 [zero  ,   zero, zero]])
+        
+        # Satellite coordinates on Orbital Plane and their derivatives
+        xp = r * np.cos(u)
+        yp = r * np.sin(u)
+        dxp = dr * np.cos(u) - r * (du_bar + ddelta_u) * np.sin(u)
+        dyp = dr * np.sin(u) + r * (du_bar + ddelta_u) * np.cos(u)
+        p  = np.stack([xp, yp, zero], axis=-1)[..., np.newaxis]
+        dp = np.stack([dxp, dyp, zero], axis=-1)[..., np.newaxis]
+        
+        # Earth-fixed position and velocity
+        R = np.matmul(R3, R1)
+        r_ITRF = np.matmul(R, p)[..., 0]
+        v_ITRF = (np.matmul(R, dp) +
+                  np.matmul(np.matmul(dR3, R1) + np.matmul(R3, dR1), p))[..., 0]
+        
+        r_ITRF = np.where((np.abs(dT) <= tol)[..., np.newaxis],
+                          r_ITRF + v_ITRF * dT[..., np.newaxis], r_ITRF)
+        
+        state = np.concatenate([r_ITRF, v_ITRF], axis=-1)
+        return [state, dts, dtsdot]
+    
+    def stack(rows):
+        """ Matrices of shape (..., 3, 3) from 3x3 nested lists of arrays
+        """
+        return np.stack([np.stack(row, axis=-1) for row in rows], axis=-2)
+    
+    def compute_state_vectors(self, epoch, ls, receiver_xyz, sat_clock):
+        """
+            State vectors of all the ephemerides at the transmission time
+            of the signal received at epoch, with the light-time iteration
+            of Orbit.compute_state_vector for sat_clock 'corrected' or
+            'uncorrected'. The iteration of each satellite stops at the
+            same tolerances, shape of the output (n, 6).
+        """
+        n = len(self)
+        radial = np.zeros(n)
+        radial_last = np.full(n, 20e6)  # [m] first guess sat - rec distance
+        dt_sv = np.zeros(n)
+        dt_sv_last = np.full(n, 10.0)
+        state_0 = np.zeros((n, 6))
+        state = np.zeros((n, 6))
+        t_xsv = np.zeros(n)
+        dtt = radial_last / self.c
+        # Define tolerance for linear propagation
+        epsilon = 1e-3
+        active = np.ones(n, dtype=bool)
+        while np.any(active):
+            k = np.flatnonzero(active)
+            if sat_clock == 'corrected':
+                tf = epoch + dt_sv[k] - radial[k] / self.c - ls
+            else:
+                tf = epoch - dtt[k] - ls
+            
+            radial_last[k] = radial[k]
+            dt_sv_last[k] = dt_sv[k]
+            [state_k, dts_k] = self.evaluate(k, tf)
+            # Linear propagation of the orbit
+            dt = np.abs(tf - t_xsv[k])
+            linear = dt < epsilon
+            state_k[linear] = state_0[k[linear]]
+            state_k[linear, 0:3] += (state_0[k[linear], 3:] *
+                                     dt[linear, np.newaxis])
+            state[k] = state_k
+            dt_sv[k] = dts_k
+            
+            radial[k] = LA.norm(state_k[:, 0:3] - receiver_xyz, axis=1)
+            dtt[k] = (radial[k] - radial_last[k]) / self.c
+            t_xsv[k] = tf
+            state_0[k] = state_k
+            active[k] = ((np.abs(radial[k] - radial_last[k]) > 0.0001) |
+                         (np.abs(dt_sv[k] - dt_sv_last[k]) > 0.1 * 1e-7))
+        # transmission times and satellite clocks of the last iteration
+        self.t_tx = t_xsv
+        self.dt_sv = dt_sv
+        return state
+    
+    def compute_light_time_states(self, epoch, ls, receiver_xyz):
+        """
+            State vectors of all the ephemerides with and without correcting
+            for the satellite clock from a single light-time iteration, see
+            Orbit.compute_light_time_states.
+        """
+        state = self.compute_state_vectors(epoch, ls, receiver_xyz,
+                                           'corrected')
+        [state_tr, dts] = self.evaluate(np.arange(len(self)),
+                                        self.t_tx - self.dt_sv)
+        return [state, state_tr]
+    
+    def evaluate(self, k, time):
+        """
+            State vectors and clock bias of the ephemerides of the rows k,
+            each one at its time, from the trajectory cache if given.
+        """
+        if self.cache is not None:
+            return self.cache.evaluate(self.gnss,
+                                       [self.ephemerides[i] for i in k], time)
+        [state, dts, dtsdot] = self.subset(k).propagate(
+                                                    time[:, np.newaxis])
+        return [state[:, 0, :], dts[:, 0]]
+    
+    def subset(self, k):
+        """ KeplerOrbits of the ephemerides of the rows k
+        """
+        orbits = KeplerOrbits.__new__(KeplerOrbits)
+        orbits.gnss = self.gnss
+        orbits.c = self.c
+        orbits.omega_E = self.omega_E
+        orbits.ephemerides = [self.ephemerides[i] for i in k]
+        orbits.cache = self.cache
+        for name in KeplerOrbits.ELEMENTS:
+            setattr(orbits, name, getattr(self, name)[k])
+        return orbits
+    
+# =============================================================================
+#          GLONASS trajectories of several ephemerides
+# =============================================================================
+class GloOrbits:
+    """
+        Class to integrate the GLONASS ephemerides of several satellites
+        together with a fixed step Runge-Kutta of 4th order, as suggested by
+        the GLONASS ICD, with the force model of Orbit.propagate_state.
+        It is defined by three methods:
+            - state, it gives the PZ-90 state vectors [km, km/s] of the
+                     ephemerides at a time from their tb
+            - compute_state_vectors, light-time iteration of all the
+                                     satellites as Orbit.compute_state_vector
+            - compute_light_time_states, state vectors with and without
+                                         correcting for the satellite clock
+        
+        The trajectory of each ephemeris is cached at the nodes of the
+        integration step, forward and backward from tb. A state between two
+        nodes is given by a partial step from the node closer to tb, and the
+        trajectory is integrated only beyond the last cached node, so that
+        the light-time iterations and the following epochs continue from the
+        cached states instead of restarting from tb. All the ephemerides to
+        be extended are integrated together with array operations.
+        The trajectories of the oldest ephemerides are removed when more than
+        max_records ephemerides are cached.
+    """
+    def __init__(self, step=60, max_records=256):
+        self.step = step                # [s]
+        self.max_records = max_records
+        self.records = {}               # ephemeris key -> trajectory
+        self.steps = 0                  # number of integrated steps
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def key(ephemeris):
+        return (ephemeris.sat_id, ephemeris.nt, ephemeris.tb,
+                ephemeris.xn, ephemeris.yn, ephemeris.zn,
+                ephemeris.dxn, ephemeris.dyn, ephemeris.dzn,
+                ephemeris.ddxn, ephemeris.ddyn, ephemeris.ddzn)
+    
+    def trajectory(self, ephemeris):
+        """
+            Cached trajectory of the ephemeris: luni-solar accelerations and
+            the lists of the states at the nodes after and before tb.
+        """
+        key = GloOrbits.key(ephemeris)
+        record = self.records.get(key)
+        if record is None:
+            state_0 = np.array([ephemeris.xn, ephemeris.yn, ephemeris.zn,
+                                ephemeris.dxn, ephemeris.dyn, ephemeris.dzn],
+                               dtype=float)
+            luni_solar = np.array([ephemeris.ddxn, ephemeris.ddyn,
+                                   ephemeris.ddzn], dtype=float)
+            record = {'luni_solar': luni_solar,
+                      +1: [state_0], -1: [state_0]}
+            self.records[key] = record
+            while len(self.records) > self.max_records:
+                del self.records[next(iter(self.records))]
+        return record
+    
+    def state(self, ephemerides, tau):
+        """
+            PZ-90 state vectors [km, km/s] of the ephemerides at the times
+            tau [s] from their tb, shape (n, 6).
+        """
+        tau = np.asarray(tau, dtype=float)
+        records = [self.trajectory(ephemeris) for ephemeris in ephemerides]
+        sign = [1 if t >= 0 else -1 for t in tau]
+        node = [int(np.abs(t) // self.step) for t in tau]
+        
+        # integrate the trajectories up to the nodes, each branch once
+        branches = {}
+        for [record, s, k] in zip(records, sign, node):
+            depth = branches.get((id(record), s), (record, s, 0))[2]
+            branches[(id(record), s)] = (record, s, max(depth, k))
+        extend = [(record, s, k) for (record, s, k) in branches.values()
+                  if len(record[s]) <= k]
+        while extend:
+            y = np.array([record[s][-1] for (record, s, k) in extend])
+            luni_solar = np.array([record['luni_solar']
+                                   for (record, s, k) in extend])
+            h = np.array([s * self.step for (record, s, k) in extend],
+                         dtype=float)
+            y = GloOrbits.rk4(y, luni_solar, h)
+            self.steps += len(extend)
+            for [j, (record, s, k)] in enumerate(extend):
+                record[s].append(y[j])
+            extend = [(record, s, k) for (record, s, k) in extend
+                      if len(record[s]) <= k]
+        
+        # partial step from the node to tau
+        y = np.array([record[s][k]
+                      for [record, s, k] in zip(records, sign, node)])
+        luni_solar = np.array([record['luni_solar'] for record in records])
+        h = tau - np.array(sign) * np.array(node) * self.step
+        return GloOrbits.rk4(y, luni_solar, h)
+    
+    def rk4(y, luni_solar, h):
+        """ Runge-Kutta step of length h [s] of the states y, shape (n, 6)
+        """
+        h = np.reshape(h, (-1, 1))
+        k1 = GloOrbits.derivative(y, luni_solar)
+        k2 = GloOrbits.derivative(y + h / 2 * k1, luni_solar)
+        k3 = GloOrbits.derivative(y + h / 2 * k2, luni_solar)
+        k4 = GloOrbits.derivative(y + h * k3, luni_solar)
+        return y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+    
+    def derivative(y, luni_solar):
+        """
+            Derivative of the PZ-90 states y, shape (n, 6), with the force
+            model of Orbit.propagate_state
+        """
+        mu   = Constants().mu_glo
+        factor = -26332671177.69
+        oe_2 = 5.3174941173225e-9
+        oe2  = 1.4584230e-4
+        
+        r = np.sqrt(y[:, 0] ** 2 + y[:, 1] ** 2 + y[:, 2] ** 2)
+        r2 = r  ** 2
+        r3 = r  * r2
+        r5 = r3 * r2
+
+        gm3 = - mu / r3
+        fr5 = factor / r5
+
+        z2r = y[:, 2] / r
+        z2r =  z2r * z2r
+        z52r = 5.0 * z2r
+
+        fxy = (gm3 + fr5 * (1.0 - z52r) + oe_2)
+        
+        dy = np.empty_like(y)
+        dy[:, 0:3] = y[:, 3:6]
+        dy[:, 3] = fxy * y[:, 0] + oe2 * y[:, 4] + luni_solar[:, 0]
+        dy[:, 4] = fxy * y[:, 1] - oe2 * y[:, 3] + luni_solar[:, 1]
+        dy[:, 5] = (gm3 + fr5 * (3.0 - z52r)) * y[:, 2] + luni_solar[:, 2]
+        return dy
+    
+    def compute_state_vectors(self, ephemerides, epoch, ls, week,
+                              receiver_xyz, cache=None):
+        """
+            WGS84 state vectors [m, m/s] of the ephemerides at the
+            transmission time of the signal received at epoch, corrected for
+            the satellite clock, with the light-time iteration of
+            Orbit.compute_state_vector for all the satellites together.
+            The states are taken from the TrajectoryCache cache if given.
+        """
+        n = len(ephemerides)
+        c = Constants().c
+        def state_at(ephs, tau):
+            if cache is None:
+                return self.state(ephs, tau)
+            return cache.evaluate('R', ephs, tau)[0]
+        orbits = [Orbit('R', receiver_xyz, ls, epoch, week[k], self)
+                  for k in range(n)]
+        radial = np.full(n, 20e6)  # [m] distance first guess
+        radial_last = np.zeros(n)
+        dt_sv = np.full(n, 10.0)
+        t_tx = np.zeros(n)
+        state = np.zeros((n, 6))
+        active = np.ones(n, dtype=bool)
+        while np.any(active):
+            k = np.flatnonzero(active)
+            tf = epoch + dt_sv[k] - radial[k] / c - ls
+            tau = np.zeros(len(k))
+            for [j, i] in enumerate(k):
+                [i_day, t_day, dt_sv[i]] = orbits[i].glo_time(ephemerides[i],
+                                                             tf[j])
+                t0 = (ephemerides[i].tb + (ephemerides[i].nt - i_day) *
+                      Constants().day_seconds)
+                tau[j] = t_day - t0
+            state[k] = np.dot(state_at([ephemerides[i] for i in k], tau),
+                              1000)  # [m]
+            radial_last[k] = radial[k]
+            radial[k] = LA.norm(state[k, 0:3] - receiver_xyz, axis=1)
+            t_tx[k] = tf
+            active[k] = np.abs(radial[k] - radial_last[k]) > 0.00001
+        self.t_tx = t_tx
+        self.dt_sv = dt_sv
+        # from PZ-90 to WGS84
+        R = np.array([[1                , -1.662910926205e-6, 0],
+                      [1.662910926205e-6,                  1, 0],
+                      [0                ,                  0, 1]])
+        state[:, 0:3] = np.dot(state[:, 0:3], np.transpose(R))
+        state[:, 3:6] = np.dot(state[:, 3:6], np.transpose(R))
+        return state
+    
+    def compute_light_time_states(self, ephemerides, epoch, ls, week,
+                                  receiver_xyz, cache=None):
+        """
+            State vectors of the ephemerides with and without correcting
+            for the satellite clock from a single light-time iteration, see
+            Orbit.compute_light_time_states.
+        """
+        state = self.compute_state_vectors(ephemerides, epoch, ls, week,
+                                           receiver_xyz, cache)
+        state_tr = state.copy()
+        state_tr[:, 0:3] = state[:, 0:3] - state[:, 3:] * self.dt_sv[:, None]
+        return [state, state_tr]
+    
 # =============================================================================
 # RTCM-SSR constants
 # =============================================================================
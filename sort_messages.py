@@ -94,7 +94,8 @@ def sort_msg(msg_type, dec_msg, eph=None, ssr=None, n4=None, ls=None):
         else:
             epoch = dec_msg.epoch
         
-        ssr.add_epoch(epoch)
+        # GLONASS time of day if the epoch has not been converted
+        ssr.add_epoch(epoch, gps_time=not ((system == 'R') and (n4 is None)))
         # orbit
         if ((msg_type == 1057) | (msg_type == 1063) |
             (msg_type == 1240) | (msg_type == 1246) |
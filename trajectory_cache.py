@@ -0,0 +1,289 @@
+"""
+   ----------------------------------------------------------------------------
+   Copyright (C) 2020 Francesco Darugna <fd@geopp.de>  Geo++ GmbH,
+                      Jannes B. Wübbena <jw@geopp.de>  Geo++ GmbH.
+   
+   A list of all the historical RTCM-SSR Python Demonstrator contributors in
+   CREDITS.info.
+   
+   The first author has received funding from the European Union's Horizon 2020
+   research and innovation programme under the Marie Sklodowska-Curie Grant
+   Agreement No 722023.
+   ----------------------------------------------------------------------------
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+from collections import OrderedDict
+import numpy as np
+from numpy.polynomial import chebyshev
+from ephemeris import VALIDITY
+import rtcm_ssr2osr
+
+""" Dense-output cache of the satellite trajectories
+
+    Input:
+    - accuracy   : maximum interpolation error of the positions [m] and
+                   velocities [m/s], accuracy / c for the clock [s]
+    - max_records: maximum number of ephemeris records in the cache, the
+                   least recently used record is removed beyond it
+    - degree     : maximum degree of the Chebyshev polynomials
+    - glo_orbits : GloOrbits object integrating the GLONASS ephemeris, a new
+                   one if None
+    
+    Output:
+    - positions, velocities and clock of the satellites, evaluated from the
+      Chebyshev polynomials of their ephemeris records
+    - stats: number of cache hits, misses, evaluations outside the
+             validity window, removed records and evaluations of the
+             ephemeris by the fits
+    
+    ***************************************************************************
+    Description:
+    on the first request for an ephemeris record, its position, velocity and
+    clock are approximated over the validity window of the ephemeris
+    (VALIDITY of the ephemeris module, around toe for GPS, Galileo, Beidou
+    and QZSS or around tb for GLONASS, plus a margin) by Chebyshev
+    polynomials on segments of equal length. The fit starts from one segment
+    over the window and the lowest degree of DEGREES: the degree is
+    increased up to the given degree, then the number of segments is
+    doubled, until the error at the points between the interpolation nodes
+    is below accuracy, or the segments are shorter than min_segment. A lower
+    accuracy gives a lower degree or fewer segments, i.e. fewer evaluations
+    of the ephemeris for the fit, counted in the stats. The coefficients of
+    the higher degrees are zero up to the given degree.
+    The broadcast ephemeris are evaluated by the KeplerOrbits class, the
+    GLONASS ones by the GloOrbits class, so the units and time arguments
+    are the ones of these classes: seconds of week and [m, m/s] for the
+    Keplerian ephemeris, seconds from tb and [km, km/s] for GLONASS, whose
+    clock is not interpolated.
+    The later requests of the record evaluate the polynomials, several
+    satellites together. The requests outside the window are evaluated
+    directly from the ephemeris.
+"""
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.outside = 0
+        self.evicted = 0
+        self.fit_points = 0
+
+    def __repr__(self):
+        return ('CacheStats objects: hits, misses, outside, evicted, ' +
+                'fit_points')
+
+    def __str__(self):
+        return ('### Trajectory cache: hits ' + str(self.hits) +
+                ', misses ' + str(self.misses) +
+                ', outside window ' + str(self.outside) +
+                ', evicted ' + str(self.evicted) +
+                ', fit evaluations ' + str(self.fit_points) + ' ###')
+
+class Trajectory:
+    """
+        Chebyshev polynomials of the state vector and clock of an ephemeris
+        record on n_seg segments of the window [t0, t1].
+    """
+    def __init__(self, t0, t1, coef):
+        self.t0 = t0
+        self.t1 = t1
+        self.coef = coef                # (n_seg, degree + 1, 7)
+        self.n_seg = coef.shape[0]
+        self.length = (t1 - t0) / self.n_seg
+
+    def __repr__(self):
+        return ('Trajectory of ' + str(self.n_seg) + ' segments from ' +
+                str(self.t0) + ' to ' + str(self.t1))
+
+    def segment(self, t):
+        """ Segment of the times t and their position in it, from -1 to 1
+        """
+        seg = np.clip(((t - self.t0) // self.length).astype(int),
+                      0, self.n_seg - 1)
+        x = (t - self.t0 - (seg + 0.5) * self.length) / (self.length / 2)
+        return [seg, x]
+
+class TrajectoryCache:
+    MARGIN = 120        # [s] beyond the validity of the ephemeris
+    DEGREES = [4, 6, 8, 10, 12, 16, 20]   # degrees tried by the fit
+
+    def __init__(self, accuracy=1e-3, max_records=512, degree=12,
+                 min_segment=60, glo_orbits=None):
+        self.accuracy = accuracy
+        self.max_records = max_records
+        self.degree = degree
+        self.min_segment = min_segment
+        if glo_orbits is None:
+            glo_orbits = rtcm_ssr2osr.GloOrbits()
+        self.glo_orbits = glo_orbits
+        self.records = OrderedDict()    # least recently used first
+        self.stats = CacheStats()
+        self.degrees = ([d for d in TrajectoryCache.DEGREES if d < degree] +
+                        [degree])
+
+    def __len__(self):
+        return len(self.records)
+
+    def __repr__(self):
+        return ('TrajectoryCache objects: accuracy, max_records, degree, ' +
+                'records, stats')
+
+    def nodes(degree):
+        """ Chebyshev nodes of the degree and the points between them
+        """
+        nodes = np.cos(np.pi * (np.arange(degree + 1) + 0.5) /
+                       (degree + 1))[::-1]
+        test = np.concatenate([[-1.0], (nodes[1:] + nodes[:-1]) / 2, [1.0]])
+        return [nodes, test]
+
+    def key(gnss, ephemeris):
+        if gnss == 'R':
+            return ('R',) + rtcm_ssr2osr.GloOrbits.key(ephemeris)
+        return ((gnss,) +
+                tuple(getattr(ephemeris, name)
+                      for name in rtcm_ssr2osr.KeplerOrbits.ELEMENTS))
+
+    def center(gnss, ephemeris):
+        # reference time of the ephemeris in the time of evaluate
+        if gnss == 'R':
+            return 0.0
+        return float(ephemeris.toe)
+
+    def compute(self, gnss, ephemeris, t):
+        """
+            State vectors and clock of the ephemeris at the times t, from
+            the ephemeris, shape (m, 7).
+        """
+        t = np.asarray(t, dtype=float)
+        y = np.zeros((len(t), 7))
+        if gnss == 'R':
+            y[:, 0:6] = self.glo_orbits.state([ephemeris] * len(t), t)
+        else:
+            orbits = rtcm_ssr2osr.KeplerOrbits(gnss, [ephemeris])
+            [state, dts, dtsdot] = orbits.propagate(t)
+            y[:, 0:6] = state[0]
+            y[:, 6] = dts[0]
+        return y
+
+    def tolerance(self, gnss):
+        # positions, velocities and clock
+        scale = 1e-3 if gnss == 'R' else 1.0     # GLONASS in [km]
+        return np.array([self.accuracy * scale] * 6 +
+                        [self.accuracy / rtcm_ssr2osr.Constants().c])
+
+    def fit(self, gnss, ephemeris):
+        """
+            Trajectory of the ephemeris with the Chebyshev polynomials of
+            the least number of segments, and of the lowest degree, reaching
+            the accuracy.
+        """
+        center = TrajectoryCache.center(gnss, ephemeris)
+        t0 = center - VALIDITY[gnss] - TrajectoryCache.MARGIN
+        t1 = center + VALIDITY[gnss] + TrajectoryCache.MARGIN
+        tolerance = self.tolerance(gnss)
+        n_seg = 1
+        while True:
+            length = (t1 - t0) / n_seg
+            mid = t0 + length * (np.arange(n_seg) + 0.5)
+            for degree in self.degrees:
+                [nodes, test] = TrajectoryCache.nodes(degree)
+                n = degree + 1
+                t = (mid[:, np.newaxis] + length / 2 * nodes).ravel()
+                y = self.compute(gnss, ephemeris, t).reshape(n_seg, n, 7)
+                # coefficients of all the segments and components together,
+                # zero beyond the degree
+                coef = chebyshev.chebfit(nodes,
+                                         np.transpose(y, (1, 0, 2)).reshape(
+                                                                    n, -1),
+                                         degree)
+                coef = np.transpose(coef.reshape(n, n_seg, 7), (1, 0, 2))
+                coef = np.concatenate([coef,
+                                       np.zeros((n_seg, self.degree - degree,
+                                                 7))], axis=1)
+                trajectory = Trajectory(t0, t1, coef)
+                self.stats.fit_points += len(t)
+                if ((length / 2 < self.min_segment) and
+                    (degree == self.degree)):
+                    return trajectory
+                # error between the nodes
+                t_test = (mid[:, np.newaxis] + length / 2 * test).ravel()
+                error = np.abs(self.compute(gnss, ephemeris, t_test) -
+                               TrajectoryCache.clenshaw(
+                                   np.repeat(coef, len(test), axis=0),
+                                   np.tile(test, n_seg)))
+                self.stats.fit_points += len(t_test)
+                if np.all(error <= tolerance):
+                    return trajectory
+            n_seg = 2 * n_seg
+
+    def trajectory(self, gnss, ephemeris):
+        key = TrajectoryCache.key(gnss, ephemeris)
+        trajectory = self.records.get(key)
+        if trajectory is None:
+            self.stats.misses += 1
+            trajectory = self.fit(gnss, ephemeris)
+            self.records[key] = trajectory
+            while len(self.records) > self.max_records:
+                self.records.popitem(last=False)
+                self.stats.evicted += 1
+        else:
+            self.stats.hits += 1
+            self.records.move_to_end(key)
+        return trajectory
+
+    def evaluate(self, gnss, ephemerides, time):
+        """
+            State vectors and clock of the ephemerides at the times time,
+            one for each ephemeris, of shape (n, 6) and (n,).
+        """
+        time = np.asarray(time, dtype=float)
+        n = len(ephemerides)
+        y = np.zeros((n, 7))
+        coef = np.zeros((n, self.degree + 1, 7))
+        x = np.zeros(n)
+        inside = np.zeros(n, dtype=bool)
+        week_seconds = rtcm_ssr2osr.Constants().week_seconds
+        for [k, ephemeris] in enumerate(ephemerides):
+            t = time[k]
+            if gnss != 'R':
+                # seconds of week around the reference time
+                center = TrajectoryCache.center(gnss, ephemeris)
+                t = (center + (t - center + week_seconds / 2) % week_seconds -
+                     week_seconds / 2)
+            trajectory = self.trajectory(gnss, ephemeris)
+            if trajectory.t0 <= t <= trajectory.t1:
+                [seg, x[k]] = trajectory.segment(np.array([t]))
+                coef[k] = trajectory.coef[seg[0]]
+                inside[k] = True
+            else:
+                self.stats.outside += 1
+                y[k] = self.compute(gnss, ephemeris, [time[k]])[0]
+        if np.any(inside):
+            y[inside] = TrajectoryCache.clenshaw(coef[inside], x[inside])
+        return [y[:, 0:6], y[:, 6]]
+
+    def clenshaw(coef, x):
+        """
+            Chebyshev series of the coefficients coef, shape (n, degree + 1,
+            k), at the points x, shape (n,).
+        """
+        x = np.asarray(x, dtype=float)[:, np.newaxis]
+        b1 = np.zeros((coef.shape[0], coef.shape[2]))
+        b2 = np.zeros_like(b1)
+        for j in range(coef.shape[1] - 1, 0, -1):
+            [b1, b2] = [2 * x * b1 - b2 + coef[:, j], b1]
+        return x * b1 - b2 + coef[:, 0]